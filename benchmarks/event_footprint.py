@@ -0,0 +1,102 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+"""
+Compares the memory footprint and argument access time of the slotted Event and
+GenericEvent classes against the previous dictionary based implementation.
+
+    python -m benchmarks.event_footprint
+"""
+import json
+import tracemalloc
+from collections.abc import MutableMapping
+from timeit import Timer
+
+from evee import Event
+from evee import GenericEvent
+
+EVENTS = 100000
+ACCESSES = 1000000
+
+
+class DictEvent(object):
+    def __init__(self):
+        self.__propagation_stopped = False
+
+    def is_propagation_stopped(self) -> bool:
+        return self.__propagation_stopped
+
+    def stop_propagation(self):
+        self.__propagation_stopped = True
+
+
+class DictGenericEvent(DictEvent, MutableMapping):
+    def __init__(self, subject=None, arguments: dict = None):
+        super().__init__()
+        self._arguments = arguments if arguments else {}
+        self.__subject = subject
+
+    def get_argument(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise KeyError('Argument "{}" not found.'.format(key))
+
+    def has_argument(self, key):
+        return key in self
+
+    def __delitem__(self, key):
+        del self._arguments[key]
+
+    def __setitem__(self, key, value):
+        self._arguments[key] = value
+
+    def __iter__(self):
+        return iter(self._arguments)
+
+    def __getitem__(self, key):
+        return self._arguments[key]
+
+    def __len__(self):
+        return len(self._arguments)
+
+
+def bytes_per_event(factory) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = [factory() for _ in range(EVENTS)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the events is not part of the events
+    return (after - before) / len(events) - 8
+
+
+def ns_per_call(statement: str, event) -> float:
+    timer = Timer(statement, globals={'event': event})
+    return min(timer.repeat(5, ACCESSES)) / ACCESSES * 1e9
+
+
+def main():
+    results = {}
+    for name, event_class, generic_event_class in [('before', DictEvent, DictGenericEvent),
+                                                   ('after', Event, GenericEvent)]:
+        event = generic_event_class(None, {'name': 'Event'})
+        results[name] = {
+            'event_bytes': bytes_per_event(event_class),
+            'generic_event_bytes': bytes_per_event(lambda: generic_event_class(None, {'name': 'Event'})),
+            'get_argument_ns': ns_per_call("event.get_argument('name')", event),
+            'has_argument_ns': ns_per_call("event.has_argument('name')", event),
+            'in_ns': ns_per_call("'name' in event", event),
+            'getitem_ns': ns_per_call("event['name']", event),
+        }
+
+    print(json.dumps(results, indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+"""
+Compares the garbage collector pressure and time of dispatching new events against
+pooled GenericEvent instances and the shared event of the dispatcher. Events that are
+dropped right after the dispatch are freed by reference counting, so the collector
+only runs when events are held, e.g. while a queued dispatcher buffers them.
+
+    python -m benchmarks.event_pooling
+"""
+import gc
+import json
+from time import perf_counter
+
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee import QueuedEventDispatcher
+
+DISPATCHES = 500000
+QUEUE_SIZE = 1000
+
+
+def noop(event, event_name, dispatcher):
+    pass
+
+
+def new_generic_events(dispatcher):
+    for key in range(DISPATCHES):
+        dispatcher.dispatch('pre.foo', GenericEvent(None, {'id': key, 'name': 'Event'}))
+
+
+def pooled_generic_events(dispatcher):
+    for key in range(DISPATCHES):
+        dispatcher.dispatch('pre.foo', GenericEvent.acquire(None, id=key, name='Event')).release()
+
+
+def new_queued_events(dispatcher):
+    for key in range(DISPATCHES):
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': key, 'name': 'Event'}))
+        if dispatcher.get_queue_size() == QUEUE_SIZE:
+            dispatcher.flush()
+
+
+def pooled_queued_events(dispatcher):
+    for key in range(DISPATCHES):
+        dispatcher.enqueue('pre.foo', GenericEvent.acquire(None, id=key, name='Event'))
+        if dispatcher.get_queue_size() == QUEUE_SIZE:
+            for event_name, event in dispatcher.flush():
+                event.release()
+
+
+def empty_events(dispatcher):
+    for _ in range(DISPATCHES):
+        dispatcher.dispatch('pre.foo')
+
+
+def measure(producer, dispatcher) -> dict:
+    collections = []
+
+    def count_collections(phase, info):
+        if phase == 'start':
+            collections.append(info['generation'])
+
+    gc.collect()
+    gc.callbacks.append(count_collections)
+    try:
+        start = perf_counter()
+        producer(dispatcher)
+        elapsed = perf_counter() - start
+    finally:
+        gc.callbacks.remove(count_collections)
+
+    return {
+        'collections': len(collections),
+        'full_collections': collections.count(2),
+        'ns_per_dispatch': elapsed / DISPATCHES * 1e9,
+    }
+
+
+def main():
+    dispatcher = EventDispatcher()
+    dispatcher.add_listener('pre.foo', noop)
+    shared = EventDispatcher(shared_event=True)
+    shared.add_listener('pre.foo', noop)
+
+    queued = QueuedEventDispatcher()
+    queued.add_listener('pre.foo', noop)
+
+    results = {
+        'queued_generic_event': {
+            'before': measure(new_queued_events, queued),
+            'after': measure(pooled_queued_events, queued),
+        },
+        'generic_event': {
+            'before': measure(new_generic_events, dispatcher),
+            'after': measure(pooled_generic_events, dispatcher),
+        },
+        'empty_event': {
+            'before': measure(empty_events, dispatcher),
+            'after': measure(empty_events, shared),
+        },
+    }
+    print(json.dumps(results, indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+"""
+Measures the throughput and latency of the process event bus for small GenericEvent
+payloads, on a single machine using forked worker processes.
+
+    python -m benchmarks.process_event_bus
+"""
+import json
+import multiprocessing
+from time import monotonic
+
+from evee import GenericEvent
+from evee import ProcessEventBus
+
+EVENTS = 50000
+ROUND_TRIPS = 2000
+BATCH_SIZES = [1, 16, 256]
+WORKERS = [1, 2]
+
+
+def consume(bus, index, events, done):
+    bus.attach(index)
+    received = 0
+    while received < events:
+        received += bus.poll(timeout=None)
+    done.put(monotonic())
+
+
+def echo(bus, index, events):
+    bus.attach(index)
+    bus.add_listener('ping', lambda event, name, dispatcher: dispatcher.dispatch('pong', event))
+    received = 0
+    while received < events:
+        received += bus.poll(timeout=None)
+    bus.close()
+
+
+def throughput(context, workers: int, batch_size: int) -> float:
+    bus = ProcessEventBus(workers + 1, batch_size=batch_size, local=False, context=context)
+    done = context.Queue()
+    processes = [context.Process(target=consume, args=(bus, index, EVENTS, done)) for index in range(1, workers + 1)]
+    for process in processes:
+        process.start()
+
+    start = monotonic()
+    for key in range(EVENTS):
+        bus.dispatch('tick', GenericEvent(None, {'id': key, 'name': 'tick'}))
+    bus.flush()
+    end = max(done.get() for _ in processes)
+    for process in processes:
+        process.join()
+
+    return EVENTS / (end - start)
+
+
+def latency(context) -> dict:
+    bus = ProcessEventBus(2, local=False, context=context)
+    process = context.Process(target=echo, args=(bus, 1, ROUND_TRIPS))
+    process.start()
+
+    samples = []
+    bus.add_listener('pong', lambda event, name, dispatcher: samples.append(monotonic() - event['sent']))
+    for key in range(ROUND_TRIPS):
+        bus.dispatch('ping', GenericEvent(None, {'id': key, 'sent': monotonic()}))
+        while not bus.poll(timeout=None):
+            pass
+    process.join()
+
+    samples.sort()
+    return {
+        'round_trip_p50_us': samples[len(samples) // 2] * 1e6,
+        'round_trip_p99_us': samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def main():
+    context = multiprocessing.get_context('fork')
+    results = {'latency': latency(context), 'events_per_second': {}}
+    for workers in WORKERS:
+        for batch_size in BATCH_SIZES:
+            name = 'workers={},batch_size={}'.format(workers, batch_size)
+            results['events_per_second'][name] = round(throughput(context, workers, batch_size))
+
+    print(json.dumps(results, indent=4, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
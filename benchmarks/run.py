@@ -0,0 +1,276 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+"""
+Benchmark suite for the event dispatcher. Results are written as JSON and can be
+compared with the results of another commit:
+
+    python -m benchmarks.run --output before.json
+    git checkout other-commit
+    python -m benchmarks.run --output after.json --compare before.json
+
+Every benchmark reports the best of several repeats in nanoseconds per operation.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+from timeit import Timer
+
+from evee import AbstractEventSubscriber
+from evee import EventDispatcher
+from evee import GenericEvent
+
+SEED = 42
+LISTENER_COUNTS = [1, 10, 100, 1000, 10000]
+PRIORITY_SPREADS = [1, 10, 1000]
+
+
+def noop(event, event_name, dispatcher):
+    pass
+
+
+def make_listener():
+    return lambda event, event_name, dispatcher: None
+
+
+class BenchmarkSubscriber(AbstractEventSubscriber):
+    @staticmethod
+    def get_subscribed_events():
+        return {
+            'pre.foo': 'pre_foo',
+            'post.foo': ['post_foo', 10],
+            'pre.bar': [['pre_bar'], ['post_bar', -10]],
+        }
+
+    def pre_foo(self, event, event_name, dispatcher):
+        pass
+
+    def post_foo(self, event, event_name, dispatcher):
+        pass
+
+    def pre_bar(self, event, event_name, dispatcher):
+        pass
+
+    def post_bar(self, event, event_name, dispatcher):
+        pass
+
+
+def bench_dispatch(listeners: int, spread: int):
+    rng = random.Random(SEED)
+    dispatcher = EventDispatcher()
+    for _ in range(listeners):
+        dispatcher.add_listener('pre.foo', noop, rng.randrange(spread))
+    return lambda: dispatcher.dispatch('pre.foo'), max(1, 100000 // listeners)
+
+
+def bench_dispatch_without_listeners():
+    dispatcher = EventDispatcher()
+    dispatcher.add_listener('pre.foo', noop)
+    return lambda: dispatcher.dispatch('post.foo'), 100000
+
+
+def bench_conditional_dispatch(listeners: int, indexed: bool):
+    dispatcher = EventDispatcher()
+    event = GenericEvent(None, {'tenant': 'tenant.0'})
+    for key in range(listeners):
+        tenant = 'tenant.{}'.format(key % 100)
+        if indexed:
+            dispatcher.add_listener('pre.foo', noop, key % 10, when={'tenant': tenant})
+        else:
+            dispatcher.add_listener('pre.foo', make_tenant_listener(tenant), key % 10)
+    return lambda: dispatcher.dispatch('pre.foo', event), max(1, 100000 // listeners)
+
+
+def make_tenant_listener(tenant: str):
+    def listener(event, event_name, dispatcher):
+        if event['tenant'] != tenant:
+            return
+    return listener
+
+
+def bench_throttled_dispatch(listeners: int):
+    dispatcher = EventDispatcher()
+    for key in range(listeners):
+        dispatcher.add_listener('event.{}'.format(key), noop, throttle=1)
+    names = ['event.{}'.format(key % listeners) for key in range(100)]
+
+    def dispatch():
+        for name in names:
+            dispatcher.dispatch(name)
+
+    return dispatch, 1000
+
+
+def bench_child_dispatch(listeners: int):
+    rng = random.Random(SEED)
+    parent = EventDispatcher()
+    for _ in range(listeners):
+        parent.add_listener('pre.foo', noop, rng.randrange(10))
+
+    def request():
+        child = parent.child()
+        child.add_listener('pre.foo', noop, rng.randrange(10))
+        child.dispatch('pre.foo')
+        child.dispatch('pre.foo')
+
+    return request, max(1, 10000 // listeners)
+
+
+def bench_has_listeners(listeners: int, event_name: str = None):
+    dispatcher = EventDispatcher()
+    for key in range(listeners):
+        dispatcher.add_listener('event.{}'.format(key % 100), noop, key % 10)
+    return lambda: dispatcher.has_listeners(event_name), 100000
+
+
+def bench_registration_churn(listeners: int):
+    rng = random.Random(SEED)
+    dispatcher = EventDispatcher()
+    for _ in range(listeners):
+        dispatcher.add_listener('pre.foo', make_listener(), rng.randrange(10))
+    priorities = [rng.randrange(10) for _ in range(100)]
+
+    def churn():
+        for priority in priorities:
+            listener = make_listener()
+            dispatcher.add_listener('pre.foo', listener, priority)
+            dispatcher.dispatch('pre.foo')
+            dispatcher.remove_listener('pre.foo', listener)
+
+    return churn, 1
+
+
+def bench_subscribers(subscribers: int):
+    instances = [BenchmarkSubscriber() for _ in range(subscribers)]
+
+    def register_and_teardown():
+        dispatcher = EventDispatcher()
+        for subscriber in instances:
+            dispatcher.add_subscriber(subscriber)
+        for subscriber in instances:
+            dispatcher.remove_subscriber(subscriber)
+
+    return register_and_teardown, 1
+
+
+def bench_generic_event(statement: str):
+    event = GenericEvent(None, {'name': 'Event', 'id': 1})
+    return Timer(statement, globals={'event': event}), 1000000
+
+
+def get_benchmarks(quick: bool) -> dict:
+    counts = LISTENER_COUNTS[:3] if quick else LISTENER_COUNTS
+    benchmarks = {}
+    for listeners in counts:
+        for spread in PRIORITY_SPREADS:
+            name = 'dispatch[listeners={},priorities={}]'.format(listeners, spread)
+            benchmarks[name] = lambda listeners=listeners, spread=spread: bench_dispatch(listeners, spread)
+
+    benchmarks['dispatch_without_listeners'] = bench_dispatch_without_listeners
+    for listeners in counts[1:]:
+        for indexed in [False, True]:
+            name = 'conditional_dispatch[listeners={},indexed={}]'.format(listeners, indexed)
+            benchmarks[name] = \
+                lambda listeners=listeners, indexed=indexed: bench_conditional_dispatch(listeners, indexed)
+
+    for listeners in counts:
+        name = 'child_dispatch[listeners={}]'.format(listeners)
+        benchmarks[name] = lambda listeners=listeners: bench_child_dispatch(listeners)
+
+    for listeners in counts:
+        name = 'throttled_dispatch[listeners={}]'.format(listeners)
+        benchmarks[name] = lambda listeners=listeners: bench_throttled_dispatch(listeners)
+
+    for listeners in counts:
+        name = 'has_listeners[listeners={}]'.format(listeners)
+        benchmarks[name] = lambda listeners=listeners: bench_has_listeners(listeners)
+        benchmarks[name.replace('[', '_for_event[')] = \
+            lambda listeners=listeners: bench_has_listeners(listeners, 'event.0')
+
+    for listeners in counts:
+        name = 'registration_churn[listeners={}]'.format(listeners)
+        benchmarks[name] = lambda listeners=listeners: bench_registration_churn(listeners)
+
+    for subscribers in counts:
+        name = 'subscribers[subscribers={}]'.format(subscribers)
+        benchmarks[name] = lambda subscribers=subscribers: bench_subscribers(subscribers)
+
+    for name, statement in [('get_argument', "event.get_argument('name')"),
+                            ('getitem', "event['name']"),
+                            ('has_argument', "event.has_argument('name')")]:
+        benchmarks['generic_event.' + name] = lambda statement=statement: bench_generic_event(statement)
+
+    return benchmarks
+
+
+def run(benchmarks: dict, repeat: int, scale: float) -> dict:
+    results = {}
+    for name, setup in benchmarks.items():
+        function, operations = setup()
+        timer = function if isinstance(function, Timer) else Timer(function)
+        operations = max(1, int(operations * scale))
+        best = min(timer.repeat(repeat, operations))
+        results[name] = {'ns_per_op': best / operations * 1e9, 'operations': operations, 'repeat': repeat}
+        print('{:<55} {:>14.1f} ns/op'.format(name, results[name]['ns_per_op']), file=sys.stderr)
+
+    return results
+
+
+def get_metadata() -> dict:
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+    }
+
+
+def compare(results: dict, baseline: dict):
+    print('{:<55} {:>12} {:>12} {:>8}'.format('benchmark', 'baseline', 'current', 'ratio'))
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['ns_per_op']
+        after = result['ns_per_op']
+        print('{:<55} {:>12.1f} {:>12.1f} {:>7.2f}x'.format(name, before, after, after / before))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the evee benchmark suite.')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    parser.add_argument('--quick', action='store_true', help='smaller sizes and fewer operations')
+    args = parser.parse_args(argv)
+
+    benchmarks = {name: setup for name, setup in get_benchmarks(args.quick).items() if args.filter in name}
+    results = run(benchmarks, args.repeat, 0.1 if args.quick else 1.0)
+    report = {'metadata': get_metadata(), 'results': results}
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=4, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(results, json.load(baseline)['results'])
+
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -2,22 +2,40 @@
 
 from .abstract_event_dispatcher import AbstractEventDispatcher
 from .abstract_event_subscriber import AbstractEventSubscriber
+from .async_event_dispatcher import AsyncEventDispatcher
 from .event import Event
 from .event_dispatcher import EventDispatcher
+from .frozen_event_dispatcher import FrozenEventDispatcher
 from .generic_event import GenericEvent
+from .generic_event_batch import GenericEventBatch
+from .generic_event_batch import batch_listener
 from .immutable_event_dispatcher import ImmutableEventDispatcher
+from .process_event_bus import ProcessEventBus
+from .queued_event_dispatcher import QueuedEventDispatcher
+from .thread_safe_event_dispatcher import ThreadSafeEventDispatcher
+from .traceable_event_dispatcher import TraceableEventDispatcher
 from .exception import BadMethodCallError
 from .exception import EventDispatcherError
 from .exception import LogicError
+from .exception import QueueFullError
 
 __all__ = [
     'AbstractEventDispatcher',
     'AbstractEventSubscriber',
+    'AsyncEventDispatcher',
     'Event',
     'EventDispatcher',
+    'FrozenEventDispatcher',
     'GenericEvent',
+    'GenericEventBatch',
+    'batch_listener',
     'ImmutableEventDispatcher',
+    'ProcessEventBus',
+    'QueuedEventDispatcher',
+    'ThreadSafeEventDispatcher',
+    'TraceableEventDispatcher',
     'EventDispatcherError',
     'LogicError',
+    'QueueFullError',
     'BadMethodCallError'
 ]
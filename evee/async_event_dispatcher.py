@@ -0,0 +1,266 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+import asyncio
+from inspect import isawaitable
+from itertools import groupby
+from operator import itemgetter
+from time import monotonic
+from typing import Any, Callable, Iterable, Iterator, Sequence, Tuple
+
+from evee.abstract_event_dispatcher import AbstractEventDispatcher
+from evee.conditional_listener import MAX_ROUTES
+from evee.event import Event
+from evee.event_dispatcher import EventDispatcher
+from evee.exception import BadMethodCallError, LogicError, QueueFullError
+from evee.generic_event_batch import GenericEventBatch
+from evee.timer_wheel import TimerWheel
+
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+REJECT = 'reject'
+
+
+class AsyncEventDispatcher(EventDispatcher):
+    def __init__(self, concurrent: bool = False, workers: int = 1, max_queue_size: int = 1000,
+                 overflow: str = BLOCK):
+        """
+        Event dispatcher for asyncio applications. Listeners are registered exactly
+        like in the EventDispatcher, and can be plain functions or coroutine functions.
+        The handlers passed to dispatch middlewares, see use(), return a coroutine
+        that the middleware must return or await.
+
+        :param concurrent:     If true, all the listeners of the same priority level are
+                                awaited concurrently, otherwise listeners are awaited one
+                                at a time in priority order
+        :param workers:        The number of tasks dispatching the queued events, see
+                                dispatch_nowait()
+        :param max_queue_size: The maximum number of queued events, 0 is unbounded
+        :param overflow:       What to do when the queue is full: "block" waits for a
+                                free slot, "drop_oldest" drops the oldest queued event
+                                and "reject" raises a QueueFullError
+        """
+        if overflow not in (BLOCK, DROP_OLDEST, REJECT):
+            raise LogicError('Unknown overflow policy "{}", expected "{}", "{}" or "{}".'.format(
+                overflow, BLOCK, DROP_OLDEST, REJECT))
+
+        super().__init__()
+        self.__concurrent = concurrent
+        self.__worker_count = workers
+        self.__max_queue_size = max_queue_size
+        self.__overflow = overflow
+        self.__queue = None
+        self.__workers = []
+        self.__metrics = dict.fromkeys(['enqueued', 'processed', 'dropped', 'rejected', 'errors'], 0)
+        self.__lag = {'total': 0.0, 'last': 0.0, 'max': 0.0}
+        self.__priorities = {}
+
+    async def dispatch(self, event_name: str, event: Event = None) -> Event:
+        """
+        Dispatches an event to all registered listeners.
+
+        :param event_name: The name of the event to dispatch. The name of the event
+                            is the name of the method that is invoked on listeners
+        :param event:      The event to pass to the event handlers/listeners
+                            If not supplied, an empty Event instance is created
+        :return:           An instance of Event
+        """
+        if event is None:
+            event = Event()
+
+        result = self._dispatch(event_name, event)
+        if isawaitable(result):
+            await result
+
+        return event
+
+    def dispatch_batch(self, event_name: str, batch: GenericEventBatch) -> GenericEventBatch:
+        raise BadMethodCallError('Batches cannot be dispatched by the async event dispatcher, use dispatch().')
+
+    def dispatch_stream(self, event_name: str, events: Iterable[Event], chunk_size: int = 1) -> Iterator[Event]:
+        raise BadMethodCallError('Streams cannot be dispatched by the async event dispatcher, use dispatch().')
+
+    def is_concurrent(self) -> bool:
+        return self.__concurrent
+
+    def set_timer_wheel(self, wheel: TimerWheel):
+        self._get_timer_wheel()
+
+    def _get_timer_wheel(self) -> TimerWheel:
+        # The delayed calls run from the timer wheel, which cannot await coroutines
+        raise LogicError('Throttled and debounced listeners are not supported by the async event dispatcher.')
+
+    def _get_options(self) -> dict:
+        return {'concurrent': self.__concurrent, 'workers': self.__worker_count,
+                'max_queue_size': self.__max_queue_size, 'overflow': self.__overflow}
+
+    def _route(self, event_name: str, listeners: Sequence[Callable], event: Event) -> Tuple[Any, Sequence[Callable]]:
+        if self.__concurrent:
+            # Concurrent groups are built from the sort keys of every listener, the
+            # conditional listeners check their own conditions when called instead
+            return None, listeners
+        return super()._route(event_name, listeners, event)
+
+    def dispatch_nowait(self, event_name: str, event: Event = None) -> Event:
+        """
+        Queues an event and returns right away, the event is dispatched by one of the
+        worker tasks, which are started on demand. Must be called from a running loop.
+        When the queue is full the oldest event is dropped with the "drop_oldest"
+        policy, otherwise a QueueFullError is raised, use enqueue() to wait instead.
+
+        :param event_name: The name of the event to dispatch
+        :param event:      The event to pass to the event handlers/listeners
+                            If not supplied, an empty Event instance is created
+        :return:           The queued event
+        """
+        if event is None:
+            event = Event()
+
+        queue = self.__get_queue()
+        if queue.full():
+            if self.__overflow != DROP_OLDEST:
+                self.__metrics['rejected'] += 1
+                raise QueueFullError('The event queue is full ({} events).'.format(queue.maxsize))
+
+            queue.get_nowait()
+            queue.task_done()
+            self.__metrics['dropped'] += 1
+
+        queue.put_nowait((event_name, event, monotonic()))
+        self.__metrics['enqueued'] += 1
+        return event
+
+    async def enqueue(self, event_name: str, event: Event = None) -> Event:
+        """
+        Queues an event like dispatch_nowait(), but waits for a free slot when the
+        queue is full and the overflow policy is "block".
+
+        :param event_name: The name of the event to dispatch
+        :param event:      The event to pass to the event handlers/listeners
+        :return:           The queued event
+        """
+        if self.__overflow != BLOCK:
+            return self.dispatch_nowait(event_name, event)
+
+        if event is None:
+            event = Event()
+
+        await self.__get_queue().put((event_name, event, monotonic()))
+        self.__metrics['enqueued'] += 1
+        return event
+
+    async def drain(self):
+        """
+        Waits until every queued event has been dispatched, then stops the workers.
+        Events queued afterwards start new workers.
+        """
+        if self.__queue is None:
+            return
+
+        await self.__queue.join()
+        workers, self.__workers = self.__workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def get_queue_metrics(self) -> dict:
+        """
+        :return: The number of queued events (depth), the counts of enqueued, processed,
+                  dropped and rejected events and of listener errors, and the last,
+                  maximum and mean seconds events waited in the queue (lag)
+        """
+        metrics = dict(self.__metrics)
+        metrics['depth'] = self.__queue.qsize() if self.__queue is not None else 0
+        metrics['workers'] = len(self.__workers)
+        metrics['last_lag'] = self.__lag['last']
+        metrics['max_lag'] = self.__lag['max']
+        metrics['mean_lag'] = self.__lag['total'] / metrics['processed'] if metrics['processed'] else 0.0
+        return metrics
+
+    def __get_queue(self) -> asyncio.Queue:
+        if self.__queue is None:
+            self.__queue = asyncio.Queue(self.__max_queue_size)
+
+        if not self.__workers:
+            loop = asyncio.get_event_loop()
+            self.__workers = [loop.create_task(self.__work()) for _ in range(self.__worker_count)]
+
+        return self.__queue
+
+    async def __work(self):
+        queue = self.__queue
+        while True:
+            event_name, event, enqueued_at = await queue.get()
+            lag = monotonic() - enqueued_at
+            self.__lag['last'] = lag
+            self.__lag['max'] = max(self.__lag['max'], lag)
+            self.__lag['total'] += lag
+            try:
+                await self.dispatch(event_name, event)
+            except Exception as exception:
+                self.__metrics['errors'] += 1
+                asyncio.get_event_loop().call_exception_handler({
+                    'message': 'Listener of the queued event "{}" failed.'.format(event_name),
+                    'exception': exception,
+                })
+            finally:
+                self.__metrics['processed'] += 1
+                queue.task_done()
+
+    async def _do_dispatch(self, listeners: Sequence[Callable[[Event, str, AbstractEventDispatcher], Event]],
+                           event_name: str, event: Event):
+        """
+        Triggers the listeners of an event. In concurrent mode the propagation of the
+        event is only checked once every listener of a priority level is done.
+
+        :param listeners:  List of event listeners
+        :param event_name: The name of the event to dispatch
+        :param event:      The event object to pass to the event handlers/listeners
+        """
+        if not self.__concurrent:
+            for listener in listeners:
+                result = listener(event, event_name, self)
+                if isawaitable(result):
+                    await result
+                if event.is_propagation_stopped():
+                    break
+            return
+
+        prioritized = zip(self.__get_priorities(event_name, listeners), listeners)
+        for priority, group in groupby(prioritized, key=itemgetter(0)):
+            results = [listener(event, event_name, self) for priority, listener in group]
+            await asyncio.gather(*[result for result in results if isawaitable(result)])
+            if event.is_propagation_stopped():
+                break
+
+    def __get_priorities(self, event_name: str, listeners: Sequence[Callable]) -> Sequence[int]:
+        """
+        Get the priority of each listener of an event from the sort keys kept with the
+        listeners, so listeners registered on patterns or several times are grouped by
+        the priority of each registration. The priorities are cached until the list
+        of listeners is replaced.
+
+        :param event_name: The name of the event
+        :param listeners:  The listeners to dispatch
+        :return:           One priority per listener
+        """
+        cached = self.__priorities.get(event_name)
+        if cached is not None and cached[0] is listeners:
+            return cached[1]
+
+        prioritized = self._get_prioritized(event_name)
+        if len(prioritized) == len(listeners):
+            priorities = [key[0] for key, listener in prioritized]
+        else:
+            # The listeners were changed by a middleware, each one is awaited on its own
+            priorities = range(len(listeners))
+
+        if len(self.__priorities) >= MAX_ROUTES:
+            self.__priorities.clear()
+        self.__priorities[event_name] = (listeners, priorities)
+        return priorities
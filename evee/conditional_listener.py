@@ -0,0 +1,147 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from typing import Any, Callable, FrozenSet, List, Mapping, Sequence, Tuple
+
+from evee.event import Event
+from evee.generic_event import GenericEvent
+
+MAX_ROUTES = 1024
+
+_MISSING = object()
+
+
+class ConditionalListener(object):
+    """
+    Listener that is only called for GenericEvent instances whose arguments match its
+    conditions. Each condition maps an argument to either a value the argument must be
+    equal to, or a set of values the argument must be one of; all the conditions
+    must match.
+    """
+
+    def __init__(self, listener: Callable, when: Mapping[str, Any]):
+        self.__listener = listener
+        self.__conditions = tuple(
+            (key, frozenset(value) if isinstance(value, (set, frozenset)) else frozenset([value]))
+            for key, value in sorted(when.items())
+        )
+
+    def get_listener(self) -> Callable:
+        return self.__listener
+
+    def get_keys(self) -> Sequence[str]:
+        return [key for key, values in self.__conditions]
+
+    def get_conditions(self) -> Sequence[Tuple[str, FrozenSet]]:
+        """
+        :return: The argument and accepted values of every condition, sorted by argument
+        """
+        return self.__conditions
+
+    def matches(self, arguments: Mapping[str, Any]) -> bool:
+        """
+        :param arguments: The arguments of an event, or of a route
+        :return:          True if every condition holds
+        """
+        try:
+            return all(arguments.get(key, _MISSING) in values for key, values in self.__conditions)
+        except TypeError:
+            # Unhashable arguments cannot be equal to any of the values
+            return False
+
+    def get_matching_rows(self, batch) -> List[int]:
+        """
+        :param batch: A GenericEventBatch
+        :return:      The rows of the batch that are still propagated and match every condition
+        """
+        return [row for row in batch.get_active_rows() if self.matches(batch.get_row(row))]
+
+    def __call__(self, event: Event, event_name: str, dispatcher):
+        if isinstance(event, GenericEvent) and self.matches(event):
+            return self.__listener(event, event_name, dispatcher)
+
+    def __eq__(self, other):
+        if isinstance(other, ConditionalListener):
+            other = other.get_listener()
+        return self.__listener == other
+
+    def __hash__(self):
+        return hash(self.__listener)
+
+
+class ListenerRouter(object):
+    """
+    Hash index of a list of listeners by the values of the arguments used in the
+    conditions of its conditional listeners. Each argument maps its values to the
+    positions of the conditional listeners accepting them, so an event only looks up
+    its own values and a conditional listener matches when all of its arguments hit.
+    The listeners of every set of matching conditional listeners are filtered once,
+    in priority order, and reused by every event matching the same set. At most
+    MAX_ROUTES sets are kept.
+    """
+
+    __slots__ = ('__listeners', '__unconditional', '__index', '__sizes', '__routes')
+
+    def __init__(self, listeners: Sequence[Callable]):
+        self.__listeners = listeners
+        self.__unconditional = []
+        self.__index = {}
+        self.__sizes = {}
+        self.__routes = {}
+        for position, listener in enumerate(listeners):
+            if not isinstance(listener, ConditionalListener):
+                self.__unconditional.append(position)
+                continue
+
+            conditions = listener.get_conditions()
+            self.__sizes[position] = len(conditions)
+            for key, values in conditions:
+                positions = self.__index.setdefault(key, {})
+                for value in values:
+                    positions.setdefault(value, []).append(position)
+
+    def get_listeners(self) -> Sequence[Callable]:
+        return self.__listeners
+
+    def route(self, event: Event) -> Tuple[FrozenSet[int], Sequence[Callable]]:
+        """
+        Get the listeners matching an event.
+
+        :param event: The event
+        :return:      The route of the event, the positions of the matching conditional
+                       listeners, and the listeners to call
+        """
+        route = frozenset(self.__match(event)) if isinstance(event, GenericEvent) else frozenset()
+        listeners = self.__routes.get(route)
+        if listeners is None:
+            if len(self.__routes) >= MAX_ROUTES:
+                self.__routes.clear()
+            listeners = self.__routes[route] = self.__filter(route)
+
+        return route, listeners
+
+    def __match(self, event: GenericEvent) -> List[int]:
+        hits = {}
+        for key, positions in self.__index.items():
+            try:
+                matching = positions.get(event.get(key, _MISSING))
+            except TypeError:
+                # Unhashable arguments cannot be equal to any of the values
+                continue
+
+            if matching is not None:
+                for position in matching:
+                    hits[position] = hits.get(position, 0) + 1
+
+        sizes = self.__sizes
+        return [position for position, count in hits.items() if count == sizes[position]]
+
+    def __filter(self, route: FrozenSet[int]) -> Sequence[Callable]:
+        positions = sorted(route.union(self.__unconditional))
+        return [self.__listeners[position].get_listener() if position in route else self.__listeners[position]
+                for position in positions]
@@ -9,6 +9,8 @@
 
 
 class Event(object):
+    __slots__ = ('__propagation_stopped',)
+
     def __init__(self):
         self.__propagation_stopped = False
 
@@ -17,3 +19,9 @@ class Event(object):
 
     def stop_propagation(self):
         self.__propagation_stopped = True
+
+    def _reset(self):
+        """
+        Restores the initial state of the event so it can be reused.
+        """
+        self.__propagation_stopped = False
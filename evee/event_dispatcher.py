@@ -6,19 +6,79 @@
 #
 # @author Juan Manuel Torres <software@onema.io>
 #
-from collections import OrderedDict
+from bisect import bisect_left, insort
+from concurrent import futures
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from heapq import heappop, heappush, merge
+from inspect import isclass
+from itertools import count, islice
+from operator import itemgetter
+from time import monotonic
+from types import MappingProxyType
 from typing import Callable, Optional, Any
-from typing import Sequence
+from typing import Hashable, Iterable, Iterator, List, Mapping, Sequence, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from evee import AbstractEventDispatcher
 from evee.abstract_event_subscriber import AbstractEventSubscriber
+from evee.conditional_listener import ConditionalListener, ListenerRouter, MAX_ROUTES
 from evee.event import Event
+from evee.event_name_trie import EventNameTrie
+from evee.exception import BadMethodCallError, LogicError
+from evee.generic_event import GenericEvent
+from evee.generic_event_batch import GenericEventBatch, is_batch_listener
+from evee.lazy_listener import LazyListener, import_reference, shared
+from evee.offloaded_listener import OffloadedListener, THREAD
+from evee.once_listener import OnceListener
+from evee.throttled_listener import ThrottledListener
+from evee.timer_wheel import TimerWheel
+from evee.weak_listener import WeakListener
 
 
 class EventDispatcher(AbstractEventDispatcher):
-    def __init__(self):
-        self.__listeners = {}
+    __subscriber_specs = WeakKeyDictionary()
+
+    def __init__(self, weak: bool = False, shared_event: bool = False):
+        """
+        :param weak:         Only keep weak references to the listeners, listeners and
+                              subscribers that are garbage collected are removed from
+                              the dispatcher
+        :param shared_event: Reuse a single Event for the dispatches without an event
+                              instead of creating one per dispatch. The returned event
+                              is only valid until the next dispatch without an event
+        """
+        self.__weak = weak
+        self.__options = {'weak': weak, 'shared_event': shared_event}
+        self.__weak_listeners = {}
+        self.__collected = []
+        self.__index = {}
+        self.__buckets = {}
+        self.__bucket_keys = {}
         self.__sorted = {}
+        self.__slots = count()
+        self.__patterns = EventNameTrie()
+        # A plain counter, the length of the trie is a Python call on every lookup
+        self.__pattern_count = 0
+        self.__resolved = {}
+        self.__executors = {}
+        self.__futures = set()
+        self.__shared_event = Event() if shared_event else None
+        self.__wheel = None
+        self.__expiries = []
+        self.__next_expiry = float('inf')
+        self.__parent = None
+        self.__depth = 0
+        self.__merged = {}
+        self.__prioritized = {}
+        self.__middlewares = []
+        self.__chains = {}
+        self.__count = 0
+        self.__conditional = 0
+        self.__throttled = 0
+        self.__routers = {}
+        self.__version = 0
+        self.__view = (-1, None)
 
     def dispatch(self, event_name: str, event: Event = None) -> Event:
         """
@@ -30,34 +90,117 @@ class EventDispatcher(AbstractEventDispatcher):
                             If not supplied, an empty Event instance is created
         :return:           An instance of Event
         """
-        if not event:
+        if event is None:
+            if self.__shared_event is not None:
+                return self.__dispatch_shared(event_name)
             event = Event()
 
+        # Same as _dispatch(), inlined as the synchronous dispatch is the hot path
+        if self.__wheel is not None or self.__parent is not None:
+            self.advance_timers()
+
+        # get_listeners() removes the expired listeners
         listeners = self.get_listeners(event_name)
-        if listeners:
+        if self.__conditional or self.__middlewares:
+            self.__dispatch_routed(event_name, listeners, event)
+        elif listeners:
             self._do_dispatch(listeners, event_name, event)
 
         return event
 
-    def add_listener(self, event_name: str = None, listener: Callable = None, priority: int = 0):
+    def dispatch_batch(self, event_name: str, batch: GenericEventBatch) -> GenericEventBatch:
+        """
+        Dispatches a batch of generic events to all registered listeners. Batch aware
+        listeners are invoked once with the whole batch, other listeners are invoked
+        once per row that has not stopped propagation.
+
+        :param event_name: The name of the event to dispatch
+        :param batch:      The batch to pass to the event handlers/listeners
+        :return:           The batch
+        """
+        if self.__middlewares:
+            raise BadMethodCallError('Batches cannot be dispatched through middlewares, use dispatch_stream().')
+
+        listeners = self.get_listeners(event_name)
+        if listeners:
+            self._do_dispatch_batch(listeners, event_name, batch)
+
+        return batch
+
+    def dispatch_stream(self, event_name: str, events: Iterable[Event], chunk_size: int = 1) -> Iterator[Event]:
+        """
+        Lazily dispatches every event of an iterable and yields it once processed. Only
+        the current chunk of events is held, so arbitrarily long streams are processed
+        in constant memory, and streams can be chained by passing the generator of one
+        event name as the events of the next one, e.g.
+        dispatch_stream('order.priced', dispatch_stream('order.parsed', events)).
+
+        :param event_name: The name of the event to dispatch
+        :param events:     The events to pass to the event handlers/listeners
+        :param chunk_size: Number of events pulled from the iterable at a time, the
+                            listeners are looked up once per chunk
+        :return:           A generator of the dispatched events
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be at least 1, got {}.'.format(chunk_size))
+
+        events = iter(events)
+        while True:
+            chunk = list(islice(events, chunk_size))
+            if not chunk:
+                return
+
+            listeners = self.get_listeners(event_name)
+            routed = self.__conditional or self.__middlewares
+            for key, event in enumerate(chunk):
+                if routed:
+                    self.__dispatch_routed(event_name, listeners, event)
+                elif listeners:
+                    self._do_dispatch(listeners, event_name, event)
+                # Release the event before yielding so the chunk does not keep it alive
+                chunk[key] = None
+                yield event
+            del event
+
+    def add_listener(self, event_name: str = None, listener: Union[Callable, str] = None, priority: int = 0,
+                     executor: str = None, lazy: bool = False, when: Mapping[str, Any] = None,
+                     throttle: float = None, debounce: float = None, once: bool = False, ttl: float = None):
         """
         Adds an event listener that listens on the specified events.
 
-        :param event_name: The event to listen on
-        :param listener:   The listener
+        :param event_name: The event to listen on, or a pattern like "order.*" to
+                            listen on one segment, or "order.**" to listen on one
+                            or more segments
+        :param listener:   The listener, or an import path like "package.module:function"
+                            that is only imported when the listener is first called
         :param priority:   The higher this value, the earlier an event listener
                             will be triggered in the chain (defaults to 0)
+        :param executor:   Either "thread" or "process" to submit the listener to
+                            an executor instead of calling it in line, see join()
+        :param lazy:       The listener is a factory without arguments that is only
+                            called to build the listener when it is first dispatched
+        :param when:       Only call the listener for GenericEvent instances whose
+                            arguments match, e.g. {'tenant': 'acme'} or
+                            {'tenant': {'acme', 'initech'}}. Listeners are indexed by
+                            these arguments so non matching listeners are not called
+        :param throttle:   Call the listener at most once per this many seconds, the
+                            last event of an interval is passed on at its end
+        :param debounce:   Only call the listener once no event was dispatched for
+                            this many seconds, with the last event. Delayed calls
+                            run when the timers are advanced, see advance_timers()
+        :param once:       Remove the listener the first time it is called
+        :param ttl:        Remove the listener after this many seconds. Expired
+                            listeners are removed on the next dispatch, lookup of
+                            the listeners or registration
         """
-        if event_name not in self.__listeners:
-            self.__listeners[event_name] = {}
-
-        if priority not in self.__listeners[event_name]:
-            self.__listeners[event_name][priority] = []
+        if self.__collected:
+            self.__prune()
+        if self.__expiries:
+            self._sweep()
 
-        self.__listeners[event_name][priority].append(listener)
-
-        if event_name in self.__sorted:
-            del self.__sorted[event_name]
+        registration = self.__register(event_name, listener, priority, executor, lazy, when, throttle, debounce,
+                                       once, ttl)
+        self.__insert(event_name, [registration])
 
     def add_subscriber(self, subscriber: AbstractEventSubscriber):
         """
@@ -66,16 +209,56 @@ class EventDispatcher(AbstractEventDispatcher):
 
         :param subscriber:  The subscriber
         """
-        for event_name, params in subscriber.get_subscribed_events().items():
-            if isinstance(params, str):
-                self.add_listener(event_name, getattr(subscriber, params))
-            elif isinstance(params, list) and len(params) <= 2 and isinstance(params[0], str):
-                priority = params[1] if len(params) > 1 else 0
-                self.add_listener(event_name, getattr(subscriber, params[0]), priority)
-            else:
-                for listener in params:
-                    priority = listener[1] if len(listener) > 1 else 0
-                    self.add_listener(event_name, getattr(subscriber, listener[0]), priority)
+        self.add_subscribers([subscriber])
+
+    def add_subscribers(self, subscribers: Iterable[AbstractEventSubscriber]):
+        """
+        Adds several event subscribers at once. The listeners of each event are only
+        invalidated once, however many subscribers listen to it.
+
+        :param subscribers: The subscribers
+        """
+        if self.__collected:
+            self.__prune()
+        if self.__expiries:
+            self._sweep()
+
+        registrations = {}
+        for subscriber in subscribers:
+            for event_name, method, priority, options in self._get_subscriber_specs(subscriber):
+                registration = self.__register(event_name, getattr(subscriber, method), priority, **options)
+                registrations.setdefault(event_name, []).append(registration)
+
+        for event_name, event_registrations in registrations.items():
+            self.__insert(event_name, event_registrations)
+
+    def add_lazy_subscriber(self, subscriber_class: Union[type, str], factory: Callable[[], Any] = None):
+        """
+        Adds an event subscriber without building it. The events are read from the
+        class, and a single subscriber is built the first time one of its listeners
+        is dispatched.
+
+        :param subscriber_class: The subscriber class or its import path
+        :param factory:          Builds the subscriber, defaults to the class itself
+        """
+        if isinstance(subscriber_class, str):
+            subscriber_class = import_reference(subscriber_class)
+
+        instance = shared(factory or subscriber_class)
+        for event_name, method, priority, options in self._get_subscriber_specs(subscriber_class):
+            self.add_listener(event_name, LazyListener(subscriber_class, method, instance), priority, **options)
+
+    def remove_lazy_subscriber(self, subscriber_class: Union[type, str]):
+        """
+        Removes an event subscriber added with add_lazy_subscriber().
+
+        :param subscriber_class: The subscriber class or its import path
+        """
+        if isinstance(subscriber_class, str):
+            subscriber_class = import_reference(subscriber_class)
+
+        for event_name, method, priority, options in self._get_subscriber_specs(subscriber_class):
+            self.remove_listener(event_name, LazyListener(subscriber_class, method))
 
     def remove_listener(self, event_name: str, listener: Callable):
         """
@@ -84,17 +267,29 @@ class EventDispatcher(AbstractEventDispatcher):
         :param event_name: The event to remove a listener from
         :param listener:   The listener to remove
         """
-        if event_name not in self.__listeners:
+        if self.__collected:
+            self.__prune()
+
+        listener = _get_index_key(listener)
+        entries = self.__index.get(listener, {}).get(event_name)
+        if not entries:
             return
 
-        for priority, listeners in self.__listeners[event_name].items():
-            try:
-                key = listeners.index(listener)
-                del self.__listeners[event_name][priority][key]
-                if event_name in self.__sorted:
-                    del self.__sorted[event_name]
-            except ValueError:
-                pass
+        # Remove the oldest registration of the listener at each priority
+        removed = {}
+        for priority, slot in entries:
+            removed.setdefault(priority, slot)
+
+        for priority, slot in removed.items():
+            entries.remove((priority, slot))
+
+        if not entries:
+            del self.__index[listener][event_name]
+            if not self.__index[listener]:
+                del self.__index[listener]
+                self.__weak_listeners.pop(listener, None)
+
+        self.__remove_slots({event_name: removed.items()})
 
     def remove_subscriber(self, subscriber: AbstractEventSubscriber):
         """
@@ -103,36 +298,157 @@ class EventDispatcher(AbstractEventDispatcher):
         :param subscriber: The subscriber
         :return:
         """
-        for event_name, params in subscriber.get_subscribed_events().items():
-            if isinstance(params, list) and isinstance(params[0], list):
-                for listener in params:
-                    self.remove_listener(event_name, getattr(subscriber, listener[0]))
-            else:
-                parameters = params if isinstance(params, str) else params[0]
-                self.remove_listener(event_name, getattr(subscriber, parameters))
+        for event_name, method, priority, options in self._get_subscriber_specs(subscriber):
+            self.remove_listener(event_name, getattr(subscriber, method))
+
+    def use(self, middleware: Callable, per_listener: bool = False):
+        """
+        Adds a middleware around dispatch() and dispatch_stream(). A dispatch middleware
+        is called with the next handler and returns a handler with the signature of
+        _do_dispatch(), i.e. handler(listeners, event_name, event). A per listener
+        middleware is called with each listener and the event name and returns the
+        listener to call instead. Middlewares added first are the outermost ones.
+
+        The middlewares are composed into a single callable per event, which is only
+        rebuilt when the listeners of the event or the middlewares change. Without
+        middlewares dispatching is the plain loop over the listeners. Batches cannot
+        be dispatched through middlewares, dispatch_batch() raises a BadMethodCallError
+        while any middleware is set.
+
+        :param middleware:   The middleware
+        :param per_listener: Wrap every listener rather than the whole dispatch
+        """
+        self.__middlewares = self.__middlewares + [(middleware, per_listener)]
+        self.__chains = {}
+
+    def get_middlewares(self) -> List[Callable]:
+        """
+        :return: The middlewares added with use(), outermost first
+        """
+        return [middleware for middleware, per_listener in self.__middlewares]
+
+    def remove_middleware(self, middleware: Callable):
+        """
+        Removes a middleware added with use().
+
+        :param middleware: The middleware
+        """
+        self.__middlewares = [entry for entry in self.__middlewares if entry[0] != middleware]
+        self.__chains = {}
+
+    def set_timer_wheel(self, wheel: TimerWheel):
+        """
+        Replaces the timer wheel used by the throttled and debounced listeners, e.g.
+        to change its resolution. Must be called before adding such listeners.
+
+        :param wheel: A TimerWheel instance
+        """
+        self.__wheel = wheel
+
+    def advance_timers(self) -> int:
+        """
+        Runs the delayed calls of the throttled and debounced listeners that are due.
+        Timers are advanced on every dispatch, this method should also be called
+        periodically, e.g. from the main loop, so delayed calls are not held back
+        while no event is dispatched. The timers of the ancestors of a child are
+        advanced as well.
+
+        :return: The number of timers that ran
+        """
+        ran = self.__wheel.advance() if self.__wheel is not None else 0
+        if self.__parent is not None:
+            ran += self.__parent.advance_timers()
+        return ran
+
+    def submit(self, executor: str, listener: Callable, event: Event, event_name: str) -> Future:
+        """
+        Submits a listener to one of the executors managed by the dispatcher. Pending
+        futures are kept until they are done, see join().
+
+        :param executor:   Either "thread" or "process"
+        :param listener:   The listener
+        :param event:      The event to pass to the listener
+        :param event_name: The name of the event
+        :return:           The future of the listener call
+        """
+        if executor not in self.__executors:
+            self.__executors[executor] = ThreadPoolExecutor() if executor == THREAD else ProcessPoolExecutor()
+
+        # Dispatchers are neither picklable nor usable from another process
+        dispatcher = self if executor == THREAD else None
+        future = self.__executors[executor].submit(listener, event, event_name, dispatcher)
+        self.__futures.add(future)
+        future.add_done_callback(self.__futures.discard)
+        return future
+
+    def set_executor(self, executor: str, pool):
+        """
+        Replaces the executor used for the thread or process listeners, e.g. to
+        configure the number of workers. The previous executor is not shut down.
+
+        :param executor: Either "thread" or "process"
+        :param pool:     A concurrent.futures.Executor instance
+        """
+        self.__executors[executor] = pool
+
+    def join(self, timeout: float = None) -> List[Future]:
+        """
+        Waits for the listeners submitted to an executor that are still pending.
+
+        :param timeout: The maximum number of seconds to wait
+        :return:        The futures that were pending
+        """
+        pending = list(self.__futures)
+        futures.wait(pending, timeout)
+        return pending
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the executors managed by the dispatcher.
+
+        :param wait: Wait for the pending listeners before returning
+        """
+        for pool in self.__executors.values():
+            pool.shutdown(wait)
+        self.__executors = {}
 
     def get_listeners(self, event_name: str = None) -> Sequence[Callable[[Event, str, Any], Event]]:
         """
         Gets the listener of a specific event or all listeners stored by
-        descending priority.
+        descending priority. The listeners of a specific event include the
+        listeners of every pattern that matches the event name.
 
         :param event_name: The name of the event
-        :return:           The event listeners for the specified event, or all
-                            event listeners by event name
+        :return:           The event listeners for the specified event, or a
+                            read-only mapping of all event listeners by event name
         """
+        if self.__collected:
+            self.__prune()
+
         if event_name:
-            if event_name not in self.__listeners:
+            self._expire()
+            if self.__parent is not None:
+                return self.__get_merged(event_name)[1] or {}
+
+            if self.__pattern_count:
+                return self.__resolve(event_name)
+
+            if event_name not in self.__buckets:
                 return {}
-            if event_name not in self.__sorted:
-                self.sort_listeners(event_name)
 
-            return self.__sorted[event_name]
+            return self.__get_sorted(event_name)
 
-        for event_name, event_listener in self.__listeners.items():
-            if event_name not in self.__sorted:
-                self.sort_listeners(event_name)
+        # The view is shared by every caller until the listeners change
+        version, view = self.__view
+        if self.__parent is None and version != self.__version:
+            view = MappingProxyType({name: self.__get_sorted(name) for name in self.__buckets})
+            self.__view = (self.__version, view)
+        elif self.__parent is not None and version != self.__get_tree_version():
+            names = set(self.__buckets).union(self.__parent.get_listeners())
+            view = MappingProxyType({name: self.get_listeners(name) for name in names})
+            self.__view = (self.__get_tree_version(), view)
 
-        return {key: value for key, value in self.__sorted.items() if value != []}
+        return view
 
     def get_listener_priority(self, event_name: str, listener: Callable) -> Optional[Any]:
         """
@@ -142,20 +458,588 @@ class EventDispatcher(AbstractEventDispatcher):
         :param listener:   The listener
         :return:           The event listener priority
         """
-        if event_name not in self.__listeners:
-            return None
-
-        for priority, listeners in self.__listeners[event_name].items():
-            try:
-                listeners.index(listener)
-                return priority
-            except ValueError:
-                pass
+        entries = self.__index.get(_get_index_key(listener), {}).get(event_name)
+        if not entries:
+            return self.__parent.get_listener_priority(event_name, listener) if self.__parent is not None else None
 
-        return None
+        return entries[0][0]
 
     def has_listeners(self, event_name: str = None) -> bool:
-        return bool(len(self.get_listeners(event_name)))
+        """
+        Checks whether an event has any registered listeners, without sorting or
+        copying them.
+
+        :param event_name: The name of the event, or any event if not supplied
+        :return:           True if the event has listeners
+        """
+        if self.__collected:
+            self.__prune()
+
+        if self.__parent is not None:
+            if not event_name:
+                return self.__count > 0 or self.__parent.has_listeners()
+            return bool(self.get_listeners(event_name))
+
+        if not event_name:
+            return self.__count > 0
+
+        if event_name in self.__buckets:
+            return True
+
+        return self.__pattern_count > 0 and not EventNameTrie.is_pattern(event_name) and \
+            bool(self.__resolve(event_name))
+
+    def get_listener_count(self, event_name: str = None) -> int:
+        """
+        :param event_name: The name of the event, or all events if not supplied
+        :return:           The number of registered listeners, the listeners of the
+                            matching patterns are only counted for an event name
+        """
+        if self.__collected:
+            self.__prune()
+
+        if not event_name:
+            return self.__count + (self.__parent.get_listener_count() if self.__parent is not None else 0)
+
+        return len(self.get_listeners(event_name))
+
+    def get_version(self) -> int:
+        """
+        :return: A counter incremented every time the listeners change
+        """
+        return self.__version
+
+    def _has_timed_listeners(self) -> bool:
+        """
+        Checks if the dispatcher or one of its ancestors has throttled or debounced
+        listeners, or listeners with a time to live, which all depend on the timers
+        of the dispatcher.
+
+        :return: True if any such listener is registered
+        """
+        if self.__throttled or any(
+                (priority, slot) in self.__index.get(key, {}).get(event_name, ())
+                for expires_at, slot, event_name, key, priority in self.__expiries):
+            return True
+        return self.__parent is not None and self.__parent._has_timed_listeners()
+
+    def child(self) -> 'EventDispatcher':
+        """
+        Creates a scoped dispatcher, e.g. per request, tenant or plugin. The listeners
+        of a child are its own listeners merged by priority with the listeners of its
+        parent, the listeners of the parent come first at the same priority. The
+        parent is not copied: a child caches the merged listeners of each event until
+        the version of its parent or of itself changes. Listeners of the parent cannot
+        be removed through the child, and middlewares are not inherited. Dispatching
+        through a child also runs the due timers of its ancestors.
+
+        :return: A dispatcher of the same class and settings without listeners of its own
+        """
+        child = type(self)(**self._get_options())
+        child.__parent = self
+        child.__depth = self.__depth + 1
+        return child
+
+    def get_parent(self) -> Optional['EventDispatcher']:
+        return self.__parent
+
+    def _get_options(self) -> dict:
+        """
+        Get the constructor arguments of the dispatcher, used to create its children.
+        Subclasses with other constructor arguments override this method.
+
+        :return: The keyword arguments
+        """
+        return dict(self.__options)
+
+    def __get_tree_version(self) -> int:
+        """
+        Versions only grow, so the sum of the versions of a dispatcher and its
+        ancestors changes whenever any of their listeners change.
+        """
+        version = self.__version
+        parent = self.__parent
+        while parent is not None:
+            version += parent.__version
+            parent = parent.__parent
+        return version
+
+    def __get_merged(self, event_name: str) -> Tuple[List[Tuple[tuple, Callable]], List[Callable]]:
+        """
+        Get the listeners of an event merged with the listeners of the ancestors.
+
+        :param event_name: The name of the event
+        :return:           The listeners with their sort keys, and the listeners
+        """
+        # Expired listeners of the ancestors are removed before their versions are read
+        parent = self.__parent
+        while parent is not None:
+            parent._expire()
+            parent = parent.__parent
+
+        version = self.__get_tree_version()
+        merged = self.__merged.get(event_name)
+        if merged is not None and merged[0] == version:
+            return merged[1], merged[2]
+
+        # Most children only add listeners for a few events, the others share the list of the parent
+        inherited = self.__parent._get_prioritized(event_name)
+        own = self.__get_own_prioritized(event_name)
+        prioritized = list(merge(inherited, own, key=itemgetter(0))) if own else inherited
+        listeners = [listener for key, listener in prioritized]
+        if len(self.__merged) >= MAX_ROUTES:
+            self.__merged.clear()
+        self.__merged[event_name] = (version, prioritized, listeners)
+        return prioritized, listeners
+
+    def _get_prioritized(self, event_name: str) -> List[Tuple[tuple, Callable]]:
+        """
+        Get the listeners of an event with their sort keys, in the order of
+        get_listeners(event_name).
+
+        :param event_name: The name of the event
+        :return:           A list of ((-priority, depth, slot), listener) by key
+        """
+        if self.__collected:
+            self.__prune()
+
+        if self.__parent is not None:
+            return self.__get_merged(event_name)[0]
+
+        # Kept per version, so every child of this dispatcher reuses the same list
+        cached = self.__prioritized.get(event_name)
+        if cached is not None and cached[0] == self.__version:
+            return cached[1]
+
+        prioritized = self.__get_own_prioritized(event_name)
+        if len(self.__prioritized) >= MAX_ROUTES:
+            self.__prioritized.clear()
+        self.__prioritized[event_name] = (self.__version, prioritized)
+        return prioritized
+
+    def __get_own_prioritized(self, event_name: str) -> List[Tuple[tuple, Callable]]:
+        """
+        Get the listeners of an event and of the matching patterns with sort keys that
+        order them among the listeners of the other dispatchers of the hierarchy.
+
+        :param event_name: The name of the event
+        :return:           A list of ((-priority, depth, slot), listener) by key
+        """
+        names = [event_name] if event_name in self.__buckets else []
+        if self.__pattern_count and not EventNameTrie.is_pattern(event_name):
+            names += self.__patterns.match(event_name)
+
+        return list(merge(*[[((priority, self.__depth, slot), listener)
+                             for (priority, slot), listener in zip(self.__get_keys(name), self.__get_sorted(name))]
+                            for name in names], key=itemgetter(0)))
+
+    def __register(self, event_name: str, listener: Union[Callable, str], priority: int, executor: str = None,
+                   lazy: bool = False, when: Mapping[str, Any] = None, throttle: float = None,
+                   debounce: float = None, once: bool = False,
+                   ttl: float = None) -> Tuple[Tuple[int, int], Callable]:
+        """
+        Indexes a new registration of a listener, see add_listener().
+
+        :return: The sort key of the registration and the listener to store
+        """
+        if throttle and debounce:
+            raise LogicError('A listener can either be throttled or debounced, not both.')
+        wheel = self._get_timer_wheel() if throttle or debounce else None
+
+        lazy = lazy or isinstance(listener, str)
+        if self.__weak and not lazy and not isinstance(listener, LazyListener):
+            listener = self.__get_weak_listener(listener)
+
+        # Every registration gets a unique, increasing slot. Priorities are stored as
+        # (-priority, slot) so the list is ascending, can be bisected and has no ties
+        slot = next(self.__slots)
+        key = _get_index_key(listener)
+        self.__index.setdefault(key, {}).setdefault(event_name, []).append((priority, slot))
+        if lazy:
+            listener = LazyListener(listener)
+        if executor:
+            listener = OffloadedListener(listener, executor)
+        if throttle or debounce:
+            listener = ThrottledListener(listener, throttle or debounce, wheel, bool(debounce))
+            self.__throttled += 1
+        if once:
+            listener = OnceListener(listener, partial(self._remove_registrations, [(event_name, key, priority, slot)]))
+        if ttl is not None:
+            heappush(self.__expiries, (monotonic() + ttl, slot, event_name, key, priority))
+            self.__next_expiry = self.__expiries[0][0]
+        if when:
+            listener = ConditionalListener(listener, when)
+            self.__conditional += 1
+
+        return (-priority, slot), listener
+
+    def __insert(self, event_name: str, registrations: List[Tuple[Tuple[int, int], Callable]]):
+        """
+        Adds registrations to the buckets of an event. Every priority has its own bucket
+        of listeners by slot, and slots only grow, so a registration is appended to its
+        bucket and only a new priority is inserted in the sorted list of priorities.
+
+        :param event_name:    The name of the event
+        :param registrations: The sort keys and listeners returned by __register()
+        """
+        buckets = self.__buckets.get(event_name)
+        if buckets is None:
+            buckets = self.__buckets[event_name] = {}
+            self.__bucket_keys[event_name] = []
+            if EventNameTrie.is_pattern(event_name):
+                self.__patterns.add(event_name)
+                self.__pattern_count += 1
+
+        for (priority, slot), listener in registrations:
+            bucket = buckets.get(priority)
+            if bucket is None:
+                bucket = buckets[priority] = {}
+                insort(self.__bucket_keys[event_name], priority)
+            bucket[slot] = listener
+
+        self.__count += len(registrations)
+        self._invalidate(event_name)
+
+    def __get_sorted(self, event_name: str) -> List[Callable]:
+        """
+        Get the listeners of an event by descending priority. The list is built on the
+        first read after a change and never mutated afterwards, so it can be iterated
+        by a dispatch while listeners are added or removed.
+
+        :param event_name: The name of an event with listeners
+        """
+        listeners = self.__sorted.get(event_name)
+        if listeners is None:
+            listeners = []
+            buckets = self.__buckets[event_name]
+            for priority in self.__bucket_keys[event_name]:
+                listeners.extend(buckets[priority].values())
+            self.__sorted[event_name] = listeners
+
+        return listeners
+
+    def __get_keys(self, event_name: str) -> List[Tuple[int, int]]:
+        """
+        :param event_name: The name of an event with listeners
+        :return:           The (-priority, slot) sort keys of the listeners returned
+                            by __get_sorted()
+        """
+        buckets = self.__buckets[event_name]
+        return [(priority, slot) for priority in self.__bucket_keys[event_name] for slot in buckets[priority]]
+
+    def __dispatch_shared(self, event_name: str) -> Event:
+        """
+        Dispatches the shared event. Dispatches without an event made by the listeners
+        meanwhile get a new event, as the shared event is still in use.
+
+        :param event_name: The name of the event
+        """
+        event, self.__shared_event = self.__shared_event, None
+        event._reset()
+        try:
+            return self.dispatch(event_name, event)
+        finally:
+            self.__shared_event = event
+
+    def _dispatch(self, event_name: str, event: Event) -> Any:
+        """
+        Runs the due timers, sweeps the expired listeners and passes an event through
+        the listener index and the middlewares to _do_dispatch().
+
+        :param event_name: The name of the event
+        :param event:      The event
+        :return:           The result of the dispatch handler, e.g. the coroutine of
+                            an asynchronous dispatch
+        """
+        if self.__wheel is not None or self.__parent is not None:
+            self.advance_timers()
+
+        # get_listeners() removes the expired listeners
+        listeners = self.get_listeners(event_name)
+        if self.__conditional or self.__middlewares:
+            return self.__dispatch_routed(event_name, listeners, event)
+        if listeners:
+            return self._do_dispatch(listeners, event_name, event)
+
+    def _route(self, event_name: str, listeners: Sequence[Callable], event: Event) -> Tuple[Any, Sequence[Callable]]:
+        """
+        Get the listeners matching the arguments of an event from the listener index
+        of the event name, see ListenerRouter.
+
+        :param event_name: The name of the event
+        :param listeners:  The current listeners of the event
+        :param event:      The event
+        :return:           The route of the event, None if the listeners were not
+                            filtered, and the listeners to call
+        """
+        router = self.__routers.get(event_name)
+        if router is None or router.get_listeners() is not listeners:
+            if len(self.__routers) >= MAX_ROUTES:
+                self.__routers.clear()
+            router = self.__routers[event_name] = ListenerRouter(listeners)
+        return router.route(event)
+
+    def __dispatch_routed(self, event_name: str, listeners: Sequence[Callable], event: Event) -> Any:
+        """
+        Dispatches an event through the listener index and the middlewares.
+
+        :param event_name: The name of the event
+        :param listeners:  The current listeners of the event
+        :param event:      The event
+        :return:           The result of the dispatch handler
+        """
+        route = None
+        if self.__conditional and listeners:
+            route, listeners = self._route(event_name, listeners, event)
+
+        if self.__middlewares:
+            return self.__get_chain(event_name, listeners, event_name if route is None else (event_name, route))(event)
+        if listeners:
+            return self._do_dispatch(listeners, event_name, event)
+
+    def __get_chain(self, event_name: str, listeners: Sequence[Callable], key: Any) -> Callable[[Event], Any]:
+        """
+        Get the composed middlewares and listeners of an event. The listener lists are
+        replaced rather than mutated on every change, so a chain is rebuilt whenever
+        it was composed for another list.
+
+        :param event_name: The name of the event
+        :param listeners:  The current listeners of the event
+        :param key:        The cache key of the chain, the event name or the event
+                            name and the route of the listeners
+        :return:           A callable that dispatches an event
+        """
+        listeners = listeners or ()
+        chain = self.__chains.get(key)
+        if chain is not None and chain[0] is listeners:
+            return chain[1]
+
+        if len(self.__chains) >= MAX_ROUTES:
+            self.__chains = {}
+
+        wrapped = listeners
+        handler = self._do_dispatch
+        for middleware, per_listener in reversed(self.__middlewares):
+            if per_listener:
+                wrapped = [middleware(listener, event_name) for listener in wrapped]
+            else:
+                handler = middleware(handler)
+
+        self.__chains[key] = (listeners, partial(handler, wrapped, event_name))
+        return self.__chains[key][1]
+
+    def _get_timer_wheel(self) -> TimerWheel:
+        """
+        Get the timer wheel of the throttled and debounced listeners, it is created
+        with the first of them.
+        """
+        if self.__wheel is None:
+            self.__wheel = TimerWheel()
+        return self.__wheel
+
+    def __get_weak_listener(self, listener: Callable) -> WeakListener:
+        """
+        Get the weak listener of a listener, the same weak listener is used for every
+        registration of the listener so they are all pruned at once when collected.
+
+        :param listener: The listener
+        """
+        weak_listener = self.__weak_listeners.get(listener)
+        if weak_listener is None:
+            weak_listener = WeakListener(listener, self.__collected.append)
+            self.__weak_listeners[weak_listener] = weak_listener
+
+        return weak_listener
+
+    def __prune(self):
+        """
+        Removes every registration of the collected weak listeners.
+        """
+        slots = {}
+        while self.__collected:
+            weak_listener = self.__collected.pop()
+            self.__weak_listeners.pop(weak_listener, None)
+            for event_name, entries in self.__index.pop(weak_listener, {}).items():
+                slots.setdefault(event_name, []).extend(entries)
+
+        self.__remove_slots(slots)
+
+    def _expire(self):
+        """
+        Removes the registrations whose time to live is over if any is due. Only the
+        deadline of the first one is checked, so this is called on every lookup.
+        """
+        if self.__expiries and self.__next_expiry <= monotonic():
+            self._sweep()
+
+    def _sweep(self):
+        """
+        Removes the registrations whose time to live is over.
+        """
+        now = monotonic()
+        expired = []
+        while self.__expiries and self.__expiries[0][0] <= now:
+            expires_at, slot, event_name, listener, priority = heappop(self.__expiries)
+            expired.append((event_name, listener, priority, slot))
+
+        self.__next_expiry = self.__expiries[0][0] if self.__expiries else float('inf')
+        self._remove_registrations(expired)
+
+    def _remove_registrations(self, registrations: Iterable[Tuple[str, Callable, int, int]]):
+        """
+        Removes registrations of listeners, e.g. expired or one-shot listeners.
+        Registrations that were already removed are ignored.
+
+        :param registrations: The event name, listener as indexed, priority and slot
+                               of each registration
+        """
+        slots = {}
+        for event_name, listener, priority, slot in registrations:
+            if self.__forget(event_name, listener, priority, slot):
+                slots.setdefault(event_name, []).append((priority, slot))
+
+        self.__remove_slots(slots)
+
+    def __forget(self, event_name: str, listener: Callable, priority: int, slot: int) -> bool:
+        """
+        Removes a registration from the index.
+
+        :return: False if the listener was already removed
+        """
+        entries = self.__index.get(listener, {}).get(event_name)
+        if not entries or (priority, slot) not in entries:
+            return False
+
+        entries.remove((priority, slot))
+        if not entries:
+            del self.__index[listener][event_name]
+            if not self.__index[listener]:
+                del self.__index[listener]
+                self.__weak_listeners.pop(listener, None)
+
+        return True
+
+    def __remove_slots(self, slots: Mapping[str, Iterable[Tuple[int, int]]]):
+        """
+        Removes registrations from the buckets, each one in constant time.
+
+        :param slots: The priority and slot of the removed registrations by event name
+        """
+        for event_name, removed in slots.items():
+            buckets = self.__buckets[event_name]
+            for priority, slot in removed:
+                bucket = buckets[-priority]
+                self.__release(bucket.pop(slot))
+                if not bucket:
+                    del buckets[-priority]
+                    keys = self.__bucket_keys[event_name]
+                    del keys[bisect_left(keys, -priority)]
+
+            if not buckets:
+                del self.__buckets[event_name]
+                del self.__bucket_keys[event_name]
+                if EventNameTrie.is_pattern(event_name):
+                    self.__patterns.remove(event_name)
+                    self.__pattern_count -= 1
+            self._invalidate(event_name)
+
+        if not self.__pattern_count:
+            self.__resolved.clear()
+
+    def __release(self, listener: Callable):
+        """
+        Updates the counters and drops the pending calls of a removed listener.
+
+        :param listener: The listener as stored in the sorted listeners
+        """
+        self.__count -= 1
+        if isinstance(listener, ConditionalListener):
+            self.__conditional -= 1
+            listener = listener.get_listener()
+        if isinstance(listener, OnceListener):
+            listener = listener.get_listener()
+        if isinstance(listener, ThrottledListener):
+            self.__throttled -= 1
+            listener.cancel()
+
+    def __resolve(self, event_name: str) -> Sequence[Callable[[Event, str, Any], Event]]:
+        """
+        Merges the listeners of the event with the listeners of the matching patterns.
+        The result is cached until a registration on the event or a matching pattern.
+        Event names may be unbounded, e.g. "order.<id>.created", so at most MAX_ROUTES
+        names are cached.
+
+        :param event_name: The name of the event
+        """
+        if event_name in self.__resolved:
+            return self.__resolved[event_name]
+
+        names = [event_name] if event_name in self.__buckets else []
+        if not EventNameTrie.is_pattern(event_name):
+            names += self.__patterns.match(event_name)
+
+        if len(names) > 1:
+            prioritized = [zip(self.__get_keys(name), self.__get_sorted(name)) for name in names]
+            listeners = [listener for key, listener in merge(*prioritized, key=lambda item: item[0])]
+        elif names:
+            listeners = self.__get_sorted(names[0])
+        else:
+            listeners = {}
+
+        if len(self.__resolved) >= MAX_ROUTES:
+            self.__resolved.clear()
+        self.__resolved[event_name] = listeners
+        return listeners
+
+    def _invalidate(self, event_name: str):
+        """
+        Drops the cached listeners of every event name affected by a registration.
+        This method can be overridden to drop caches kept by a subclass.
+
+        :param event_name: The name of the event or pattern that changed
+        """
+        self.__version += 1
+        self.__sorted.pop(event_name, None)
+        if not EventNameTrie.is_pattern(event_name):
+            self.__resolved.pop(event_name, None)
+            return
+
+        for name in [name for name in self.__resolved if EventNameTrie.matches(event_name, name)]:
+            del self.__resolved[name]
+        self.__resolved.pop(event_name, None)
+
+    @classmethod
+    def _get_subscriber_specs(cls, subscriber: Union[AbstractEventSubscriber, type]) \
+            -> Sequence[Tuple[str, str, int, dict]]:
+        """
+        Normalizes the events of a subscriber. Each event maps to a method name, a list
+        with a method name, an optional priority and optional listener options (e.g.
+        ['method', 10, {'executor': 'thread'}]), or a list of such lists. As the events
+        are static, the normalized events are cached per subscriber class.
+
+        :param subscriber: The subscriber or its class
+        :return:           A list of (event name, method name, priority, options)
+        """
+        subscriber_class = subscriber if isclass(subscriber) else type(subscriber)
+        specs = cls.__subscriber_specs.get(subscriber_class)
+        if specs is not None:
+            return specs
+
+        specs = []
+        for event_name, params in subscriber.get_subscribed_events().items():
+            if isinstance(params, str):
+                params = [[params]]
+            elif isinstance(params[0], str):
+                params = [params]
+
+            for listener in params:
+                options = listener[-1] if isinstance(listener[-1], dict) else {}
+                priority = listener[1] if len(listener) > 1 and not isinstance(listener[1], dict) else 0
+                specs.append((event_name, listener[0], priority, options))
+
+        specs = tuple(specs)
+        cls.__subscriber_specs[subscriber_class] = specs
+        return specs
 
     def _do_dispatch(self, listeners: Sequence[Callable[[Event, str, AbstractEventDispatcher], Event]],
                      event_name: str, event: Event):
@@ -172,16 +1056,100 @@ class EventDispatcher(AbstractEventDispatcher):
             if event.is_propagation_stopped():
                 break
 
+    def _do_dispatch_batch(self, listeners: Sequence[Callable[[Event, str, AbstractEventDispatcher], Event]],
+                           event_name: str, batch: GenericEventBatch):
+        """
+        Triggers the listeners of an event for a batch. Rows are only turned into
+        GenericEvent instances for listeners that are not batch aware, and written
+        back to the batch before the next batch aware listener is invoked.
+
+        :param listeners:  List of event listeners
+        :param event_name: The name of the event to dispatch
+        :param batch:      The batch to pass to the event handlers/listeners
+        """
+        events = {}
+        for listener in listeners:
+            if is_batch_listener(listener):
+                self.__write_back(batch, events)
+                if isinstance(listener, ConditionalListener):
+                    self.__dispatch_conditional_batch(listener, event_name, batch)
+                else:
+                    listener(batch, event_name, self)
+            else:
+                for row in batch.get_active_rows():
+                    if row not in events:
+                        events[row] = GenericEvent(batch.get_subject(), batch.get_row(row))
+                    listener(events[row], event_name, self)
+                    if events[row].is_propagation_stopped():
+                        batch.stop_propagation(row)
+
+            if batch.is_propagation_stopped():
+                break
+
+        self.__write_back(batch, events)
+
+    def __dispatch_conditional_batch(self, listener: ConditionalListener, event_name: str, batch: GenericEventBatch):
+        """
+        Calls a batch aware conditional listener with the rows that do not match its
+        conditions stopped, they are propagated again once the listener returns.
+
+        :param listener:   The conditional listener
+        :param event_name: The name of the event to dispatch
+        :param batch:      The batch to pass to the listener
+        """
+        matching = set(listener.get_matching_rows(batch))
+        if not matching:
+            return
+
+        hidden = [row for row in batch.get_active_rows() if row not in matching]
+        for row in hidden:
+            batch.stop_propagation(row)
+        try:
+            listener.get_listener()(batch, event_name, self)
+        finally:
+            batch._resume(hidden)
+
+    @staticmethod
+    def __write_back(batch: GenericEventBatch, events: dict):
+        for row, event in events.items():
+            batch.set_row(row, event.get_arguments())
+        events.clear()
+
     def sort_listeners(self, event_name: str):
         """
-        Sorts the internal list of listeners for the given event by priority.
+        Rebuilds the internal list of listeners for the given event by priority.
+        The listeners are kept by priority on every registration and the list is
+        rebuilt on the next read after a change, so there is no need to call this
+        method before dispatching.
 
         :param event_name: the name of the event
         """
-        listeners = OrderedDict(sorted(self.__listeners[event_name].items(), reverse=True))
-        ordered_listeners = []
+        self.__sorted.pop(event_name, None)
+
+
+def _get_index_key(listener: Callable) -> Hashable:
+    """
+    Get the key of a listener in the index of the registrations. Listeners that cannot
+    be hashed, e.g. instances of a dataclass with a __call__ method, are indexed by
+    identity, so they must be removed with the same instance.
+
+    :param listener: The listener
+    """
+    try:
+        hash(listener)
+    except TypeError:
+        return _IdentityKey(listener)
+    return listener
+
+
+class _IdentityKey(object):
+    __slots__ = ('listener',)
+
+    def __init__(self, listener: Callable):
+        self.listener = listener
 
-        for priority, listener in listeners.items():
-            ordered_listeners += listener
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other.listener is self.listener
 
-        self.__sorted[event_name] = ordered_listeners
+    def __hash__(self):
+        return id(self.listener)
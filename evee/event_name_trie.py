@@ -0,0 +1,113 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from typing import List
+
+SEPARATOR = '.'
+SINGLE_WILDCARD = '*'
+MULTI_WILDCARD = '**'
+
+
+class EventNameTrie(object):
+    """
+    Segment trie of event name patterns. Event names are split on dots, a "*" segment
+    matches exactly one segment and a "**" segment matches one or more segments, e.g.
+    "order.*" matches "order.created" and "order.**" also matches "order.item.added".
+    """
+
+    def __init__(self):
+        self.__root = _Node()
+        self.__size = 0
+
+    @staticmethod
+    def is_pattern(event_name: str) -> bool:
+        # Both wildcards contain "*", most event names are rejected without splitting them
+        return SINGLE_WILDCARD in event_name and \
+            any(segment in (SINGLE_WILDCARD, MULTI_WILDCARD) for segment in event_name.split(SEPARATOR))
+
+    @staticmethod
+    def matches(pattern: str, event_name: str) -> bool:
+        """
+        Check if a single pattern matches the given event name.
+
+        :param pattern:    The event name pattern
+        :param event_name: The concrete event name
+        """
+        node = _Node()
+        node.insert(pattern.split(SEPARATOR), pattern)
+        return bool(node.match(event_name.split(SEPARATOR)))
+
+    def add(self, pattern: str):
+        if self.__root.insert(pattern.split(SEPARATOR), pattern):
+            self.__size += 1
+
+    def remove(self, pattern: str):
+        if self.__root.delete(pattern.split(SEPARATOR)):
+            self.__size -= 1
+
+    def match(self, event_name: str) -> List[str]:
+        """
+        Get all the patterns that match the given event name.
+
+        :param event_name: The concrete event name
+        :return:           The matching patterns
+        """
+        return list(self.__root.match(event_name.split(SEPARATOR)))
+
+    def __len__(self):
+        return self.__size
+
+
+class _Node(object):
+    __slots__ = ('children', 'pattern')
+
+    def __init__(self):
+        self.children = {}
+        self.pattern = None
+
+    def insert(self, segments: List[str], pattern: str) -> bool:
+        node = self
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+
+        added = node.pattern is None
+        node.pattern = pattern
+        return added
+
+    def delete(self, segments: List[str]) -> bool:
+        if not segments:
+            deleted = self.pattern is not None
+            self.pattern = None
+            return deleted
+
+        child = self.children.get(segments[0])
+        if child is None:
+            return False
+
+        deleted = child.delete(segments[1:])
+        if child.pattern is None and not child.children:
+            del self.children[segments[0]]
+
+        return deleted
+
+    def match(self, segments: List[str], offset: int = 0) -> set:
+        if offset == len(segments):
+            return {self.pattern} if self.pattern is not None else set()
+
+        patterns = set()
+        for segment in (segments[offset], SINGLE_WILDCARD):
+            child = self.children.get(segment)
+            if child is not None:
+                patterns |= child.match(segments, offset + 1)
+
+        child = self.children.get(MULTI_WILDCARD)
+        if child is not None:
+            for end in range(offset + 1, len(segments) + 1):
+                patterns |= child.match(segments, end)
+
+        return patterns
@@ -18,3 +18,7 @@ class LogicError(EventDispatcherError):
 
 class BadMethodCallError(LogicError):
     pass
+
+
+class QueueFullError(EventDispatcherError):
+    pass
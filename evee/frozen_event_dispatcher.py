@@ -0,0 +1,171 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from concurrent.futures import Future
+from heapq import merge
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Callable, Sequence, Any, Optional
+
+from evee.abstract_event_dispatcher import AbstractEventDispatcher
+from evee.abstract_event_subscriber import AbstractEventSubscriber
+from evee.event import Event
+from evee.event_dispatcher import EventDispatcher, _get_index_key
+from evee.event_name_trie import EventNameTrie
+from evee.exception import BadMethodCallError
+
+
+class FrozenEventDispatcher(AbstractEventDispatcher):
+    """
+    Standalone, read-only copy of the listeners of a dispatcher. Every event maps to a
+    tuple of listeners sorted ahead of time, so dispatching is a dictionary lookup and
+    a loop. Event names that only match wildcard patterns are resolved on every
+    dispatch, as nothing is cached after the dispatcher is built.
+    """
+
+    def __init__(self, dispatcher: AbstractEventDispatcher):
+        """
+        Middlewares, listeners with a time to live and throttled or debounced listeners
+        rely on the copied dispatcher at dispatch time, which the copy would bypass, so
+        dispatchers using any of them cannot be frozen.
+
+        :param dispatcher: The dispatcher to copy, listeners offloaded to an executor
+                            are still submitted to it
+        """
+        if isinstance(dispatcher, EventDispatcher):
+            if dispatcher.get_middlewares():
+                raise BadMethodCallError('Event dispatchers with middlewares cannot be frozen.')
+            if dispatcher._has_timed_listeners():
+                raise BadMethodCallError(
+                    'Event dispatchers with throttled, debounced or expiring listeners cannot be frozen.')
+
+        listeners = {}
+        keys = {}
+        priorities = {}
+        patterns = EventNameTrie()
+        for event_name, event_listeners in dispatcher.get_listeners().items():
+            if EventNameTrie.is_pattern(event_name):
+                patterns.add(event_name)
+                listeners[event_name] = tuple(event_listeners)
+                keys[event_name] = self.__get_keys(dispatcher, event_name, event_listeners)
+            else:
+                # Exact events already include the listeners of the matching patterns
+                listeners[event_name] = tuple(dispatcher.get_listeners(event_name))
+
+            event_priorities = {}
+            for listener in event_listeners:
+                key = _get_index_key(listener)
+                if key not in event_priorities:
+                    event_priorities[key] = dispatcher.get_listener_priority(event_name, listener)
+            priorities[event_name] = MappingProxyType(event_priorities)
+
+        self.__listeners = MappingProxyType(listeners)
+        self.__keys = MappingProxyType(keys)
+        self.__priorities = MappingProxyType(priorities)
+        self.__patterns = patterns
+        self.__submit = getattr(dispatcher, 'submit', None)
+
+    def dispatch(self, event_name: str, event: Event = None) -> Event:
+        if event is None:
+            event = Event()
+
+        listeners = self.__listeners.get(event_name)
+        if listeners is None and len(self.__patterns):
+            listeners = self.__resolve(event_name)
+
+        if listeners:
+            for listener in listeners:
+                listener(event, event_name, self)
+                if event.is_propagation_stopped():
+                    break
+
+        return event
+
+    def submit(self, executor: str, listener: Callable, event: Event, event_name: str) -> Future:
+        """
+        Submits an offloaded listener to the executors of the copied dispatcher.
+
+        :param executor:   Either "thread" or "process"
+        :param listener:   The listener
+        :param event:      The event to pass to the listener
+        :param event_name: The name of the event
+        :return:           The future of the listener call
+        """
+        if self.__submit is None:
+            raise BadMethodCallError('The copied event dispatcher cannot run offloaded listeners.')
+        return self.__submit(executor, listener, event, event_name)
+
+    def add_listener(self, event_name: str, listener: Callable = None, priority: int = 0, **options):
+        raise BadMethodCallError('Frozen event dispatcher must not be modified.')
+
+    def add_subscriber(self, subscriber: AbstractEventSubscriber):
+        raise BadMethodCallError('Frozen event dispatcher must not be modified.')
+
+    def remove_listener(self, event_name: str, listener: Callable):
+        raise BadMethodCallError('Frozen event dispatcher must not be modified.')
+
+    def remove_subscriber(self, subscriber: AbstractEventSubscriber):
+        raise BadMethodCallError('Frozen event dispatcher must not be modified.')
+
+    def get_listeners(self, event_name: str = None) -> Sequence[Callable[[Event, str, Any], Event]]:
+        if event_name:
+            listeners = self.__listeners.get(event_name)
+            if listeners is None:
+                listeners = self.__resolve(event_name) if len(self.__patterns) else ()
+            return listeners
+
+        return dict(self.__listeners)
+
+    def get_listener_priority(self, event_name: str, listener: Callable) -> Optional[Any]:
+        return self.__priorities.get(event_name, {}).get(_get_index_key(listener))
+
+    def has_listeners(self, event_name: str = None) -> bool:
+        if event_name:
+            return event_name in self.__listeners or bool(len(self.__patterns) and self.__resolve(event_name))
+        return bool(self.__listeners)
+
+    def __resolve(self, event_name: str) -> Sequence[Callable[[Event, str, Any], Event]]:
+        prioritized = [zip(self.__keys[pattern], self.__listeners[pattern])
+                       for pattern in self.__patterns.match(event_name)]
+        return tuple(listener for key, listener in merge(*prioritized, key=itemgetter(0)))
+
+    @staticmethod
+    def __get_keys(dispatcher: AbstractEventDispatcher, event_name: str, listeners: Sequence[Callable]) -> tuple:
+        """
+        Get the sort keys of the listeners of a pattern, so the patterns matching an
+        event are merged in the order the dispatcher would call them.
+
+        :param dispatcher: The copied dispatcher
+        :param event_name: The pattern
+        :param listeners:  The listeners of the pattern
+        :return:           One key per listener
+        """
+        if isinstance(dispatcher, EventDispatcher):
+            keys = tuple(key for key, listener in dispatcher._get_prioritized(event_name))
+            if len(keys) == len(listeners):
+                return keys
+
+        # Without sort keys, listeners of equal priority keep the order of their pattern.
+        # A listener registered more than once only has its first priority, so keys are
+        # kept ascending for the merge
+        keys = []
+        for position, listener in enumerate(listeners):
+            priority = -(dispatcher.get_listener_priority(event_name, listener) or 0)
+            keys.append((max(priority, keys[-1][0]) if keys else priority, 0, position))
+        return tuple(keys)
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise BadMethodCallError('Frozen event dispatcher must not be modified.')
+        super().__setattr__(name, value)
+
+    def __eq__(self, other):
+        return isinstance(other, FrozenEventDispatcher) and self.get_listeners() == other.get_listeners()
+
+    def __hash__(self):
+        return hash(frozenset(self.__listeners.items()))
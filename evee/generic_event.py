@@ -6,11 +6,16 @@
 #
 # @author Juan Manuel Torres <software@onema.io>
 #
-from collections import MutableMapping
+from collections.abc import MutableMapping
 from evee.event import Event
 
+POOL_SIZE = 1024
+
 
 class GenericEvent(Event, MutableMapping):
+    __slots__ = ('_arguments', '__subject')
+    __pools = {}
+
     def __init__(self, subject=None, arguments: dict = None):
             super().__init__()
             if arguments:
@@ -19,17 +24,52 @@ class GenericEvent(Event, MutableMapping):
                 self._arguments = {}
             self.__subject = subject
 
+    @classmethod
+    def acquire(cls, subject=None, **arguments) -> 'GenericEvent':
+        """
+        Get an event from the pool of released events, or a new event if the pool is
+        empty. Pooled events start with propagation enabled and the given arguments.
+
+        :param subject:   The subject of the event
+        :param arguments: The arguments of the event
+        :return:          An event of this class
+        """
+        try:
+            event = GenericEvent.__pools[cls].pop()
+        except (KeyError, IndexError):
+            return cls(subject, arguments)
+
+        event._reset()
+        event._arguments = arguments
+        event.__subject = subject
+        return event
+
+    def release(self):
+        """
+        Returns the event to the pool of its class, up to POOL_SIZE events are kept.
+        The subject and arguments are dropped, and the event must not be used once
+        released.
+        """
+        if self._arguments is None:
+            return
+
+        self._arguments = None
+        self.__subject = None
+        pool = GenericEvent.__pools.setdefault(type(self), [])
+        if len(pool) < POOL_SIZE:
+            pool.append(self)
+
     def get_subject(self):
         return self.__subject
 
     def get_argument(self, key):
         try:
-            return self[key]
+            return self._arguments[key]
         except KeyError:
             raise KeyError('Argument "{}" not found.'.format(key))
 
     def set_argument(self, key, value):
-        self[key] = value
+        self._arguments[key] = value
 
     def get_arguments(self):
         return dict(self._arguments)
@@ -40,7 +80,13 @@ class GenericEvent(Event, MutableMapping):
         return self
 
     def has_argument(self, key):
-        return key in self
+        return key in self._arguments
+
+    def get(self, key, default=None):
+        return self._arguments.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._arguments
 
     def __delitem__(self, key):
         del(self._arguments[key])
@@ -0,0 +1,177 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from typing import Callable, List, Sequence
+
+from evee.conditional_listener import ConditionalListener
+from evee.generic_event import GenericEvent
+from evee.lazy_listener import LazyListener
+from evee.offloaded_listener import OffloadedListener
+from evee.once_listener import OnceListener
+from evee.throttled_listener import ThrottledListener
+from evee.weak_listener import WeakListener
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def batch_listener(listener: Callable) -> Callable:
+    """
+    Marks a listener as batch aware. Batch aware listeners are invoked once per
+    GenericEventBatch instead of once per row.
+
+    :param listener: The listener
+    :return:         The same listener
+    """
+    listener.batch_aware = True
+    return listener
+
+
+def is_batch_listener(listener: Callable) -> bool:
+    """
+    Checks if a listener, or the listener wrapped by the dispatcher, e.g. for weak,
+    once or conditional registrations, is batch aware. Lazy listeners are resolved.
+
+    :param listener: The listener
+    """
+    while not getattr(listener, 'batch_aware', False):
+        if isinstance(listener, LazyListener):
+            listener = listener.resolve()
+        elif isinstance(listener, _WRAPPERS):
+            listener = listener.get_listener()
+        else:
+            return False
+
+    return True
+
+
+_WRAPPERS = (ConditionalListener, OffloadedListener, OnceListener, ThrottledListener, WeakListener)
+
+
+class GenericEventBatch(object):
+    def __init__(self, subject=None, arguments: dict = None, size: int = None):
+        """
+        Columnar batch of generic events sharing the same subject. Arguments are stored
+        as one list (or NumPy array) per key, every column holding one value per row.
+
+        :param subject:   The subject of every event in the batch
+        :param arguments: The argument columns by key
+        :param size:      The number of rows, required when there are no arguments
+        """
+        self._arguments = arguments if arguments else {}
+        self.__subject = subject
+
+        if size is None:
+            size = len(next(iter(self._arguments.values()))) if self._arguments else 0
+
+        for key, column in self._arguments.items():
+            if len(column) != size:
+                raise ValueError('Argument "{}" has {} rows, expected {}.'.format(key, len(column), size))
+
+        self.__size = size
+        if numpy is not None and any(isinstance(column, numpy.ndarray) for column in self._arguments.values()):
+            self.__mask = numpy.ones(size, dtype=bool)
+        else:
+            self.__mask = [True] * size
+
+    @classmethod
+    def from_events(cls, events: Sequence[GenericEvent], subject=None):
+        """
+        Builds a batch out of the arguments of the given generic events.
+
+        :param events:  The generic events
+        :param subject: The subject of the batch
+        """
+        keys = []
+        for event in events:
+            keys += [key for key in event if key not in keys]
+
+        arguments = {key: [event[key] if key in event else None for event in events] for key in keys}
+        return cls(subject, arguments, len(events))
+
+    def get_subject(self):
+        return self.__subject
+
+    def get_column(self, key):
+        try:
+            return self._arguments[key]
+        except KeyError:
+            raise KeyError('Argument "{}" not found.'.format(key))
+
+    def set_column(self, key, values):
+        if len(values) != self.__size:
+            raise ValueError('Argument "{}" has {} rows, expected {}.'.format(key, len(values), self.__size))
+        self._arguments[key] = values
+
+    def get_columns(self):
+        return dict(self._arguments)
+
+    def has_column(self, key):
+        return key in self._arguments
+
+    def get_row(self, row: int) -> dict:
+        return {key: column[row] for key, column in self._arguments.items()}
+
+    def set_row(self, row: int, arguments: dict):
+        for key, value in arguments.items():
+            if key not in self._arguments:
+                self._arguments[key] = [None] * self.__size
+            self._arguments[key][row] = value
+
+    def get_mask(self):
+        """
+        Get the propagation mask of the batch, true for the rows that are still
+        propagated to the next listeners.
+        """
+        return self.__mask
+
+    def get_active_rows(self) -> List[int]:
+        return [row for row, active in enumerate(self.__mask) if active]
+
+    def filter(self, mask: Sequence[bool]):
+        """
+        Stops the propagation of every row where the given mask is false.
+
+        :param mask: One boolean per row
+        """
+        if numpy is not None and isinstance(self.__mask, numpy.ndarray):
+            self.__mask &= numpy.asarray(mask, dtype=bool)
+        else:
+            self.__mask = [active and bool(keep) for active, keep in zip(self.__mask, mask)]
+        return self
+
+    def is_propagation_stopped(self, row: int = None) -> bool:
+        if row is not None:
+            return not self.__mask[row]
+        return not any(self.__mask)
+
+    def stop_propagation(self, row: int = None):
+        """
+        Stops the propagation of one row, or of the whole batch if no row is given.
+
+        :param row: The row to stop
+        """
+        if row is not None:
+            self.__mask[row] = False
+        else:
+            for row in range(self.__size):
+                self.__mask[row] = False
+
+    def _resume(self, rows: Sequence[int]):
+        """
+        Propagates the given rows again.
+
+        :param rows: The rows to resume
+        """
+        for row in rows:
+            self.__mask[row] = True
+
+    def __len__(self):
+        return self.__size
@@ -12,6 +12,7 @@ from evee.abstract_event_dispatcher import AbstractEventDispatcher
 from evee.abstract_event_subscriber import AbstractEventSubscriber
 from evee.event import Event
 from evee.exception import BadMethodCallError
+from evee.frozen_event_dispatcher import FrozenEventDispatcher
 
 
 class ImmutableEventDispatcher(AbstractEventDispatcher):
@@ -42,3 +43,14 @@ class ImmutableEventDispatcher(AbstractEventDispatcher):
 
     def has_listeners(self, event_name: str = None) -> bool:
         return self.__dispatcher.has_listeners(event_name)
+
+    def freeze(self) -> FrozenEventDispatcher:
+        """
+        Builds a standalone, read-only copy of the wrapped dispatcher with every
+        listener sorted ahead of time. Later changes to the wrapped dispatcher are
+        not reflected in the copy. Dispatchers with middlewares, or throttled,
+        debounced or expiring listeners cannot be frozen, see FrozenEventDispatcher.
+
+        :return: The frozen dispatcher
+        """
+        return FrozenEventDispatcher(self.__dispatcher)
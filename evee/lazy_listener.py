@@ -0,0 +1,112 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from importlib import import_module
+from inspect import getattr_static, isclass, isfunction
+from typing import Any, Callable, Union
+
+from evee.event import Event
+from evee.exception import LogicError
+
+
+def import_reference(path: str) -> Any:
+    """
+    Imports the object referenced by a "package.module:Object.attribute" path. When an
+    instance method of a class is referenced, the class is instantiated without
+    arguments and the bound method is returned.
+
+    :param path: The import path
+    :return:     The referenced object
+    """
+    module_name, _, attributes = path.partition(':')
+    target = import_module(module_name)
+    for attribute in attributes.split('.') if attributes else []:
+        if isclass(target) and isfunction(getattr_static(target, attribute, None)):
+            target = target()
+        target = getattr(target, attribute)
+
+    return target
+
+
+class LazyListener(object):
+    """
+    Listener that is only imported or built the first time it is called. The reference
+    is either an import path like "package.module:Class.method" or a factory that takes
+    no arguments and returns the listener, or the object holding the listener method.
+    """
+
+    def __init__(self, reference: Union[str, Callable], method: str = None, factory: Callable[[], Any] = None):
+        """
+        :param reference: The import path or factory, lazy listeners with the same
+                           reference and method are equal
+        :param method:    The name of the listener method of the built object
+        :param factory:   Builds the object instead of the reference, e.g. to share
+                           a single subscriber instance between several listeners
+        """
+        if isinstance(reference, str) and ':' not in reference:
+            raise LogicError('Invalid listener reference "{}", expected "package.module:name".'.format(reference))
+
+        self.__reference = reference
+        self.__method = method
+        self.__factory = factory
+        self.__listener = None
+
+    def get_reference(self) -> Union[str, Callable]:
+        return self.__reference
+
+    def is_resolved(self) -> bool:
+        return self.__listener is not None
+
+    def resolve(self) -> Callable:
+        """
+        Imports or builds the listener, the listener is memoized.
+
+        :return: The listener
+        """
+        if self.__listener is None:
+            if self.__factory is not None:
+                target = self.__factory()
+            elif isinstance(self.__reference, str):
+                target = import_reference(self.__reference)
+            else:
+                target = self.__reference()
+
+            self.__listener = getattr(target, self.__method) if self.__method else target
+
+        return self.__listener
+
+    def __call__(self, event: Event, event_name: str, dispatcher):
+        listener = self.__listener
+        if listener is None:
+            listener = self.resolve()
+        return listener(event, event_name, dispatcher)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyListener):
+            return self.__reference == other.get_reference() and self.__method == other.__method
+        return self.__reference == other and self.__method is None
+
+    def __hash__(self):
+        return hash(self.__reference) if self.__method is None else hash((self.__reference, self.__method))
+
+
+def shared(factory: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Memoizes a factory so every caller gets the same instance.
+
+    :param factory: A callable that takes no arguments
+    :return:        The memoized factory
+    """
+    instance = []
+
+    def get_instance():
+        if not instance:
+            instance.append(factory())
+        return instance[0]
+
+    return get_instance
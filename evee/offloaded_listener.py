@@ -0,0 +1,53 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from concurrent.futures import Future
+from typing import Callable
+
+from evee.event import Event
+from evee.exception import LogicError
+
+THREAD = 'thread'
+PROCESS = 'process'
+
+
+class OffloadedListener(object):
+    """
+    Listener that is submitted to an executor managed by the dispatcher instead of
+    being called in line. The listener is submitted when the chain reaches its
+    priority, but the chain does not wait for it: calling stop_propagation() from an
+    offloaded listener does not affect the listeners after it, while stopping the
+    propagation before it prevents it from being submitted.
+
+    Listeners offloaded to a process receive a pickled copy of the event and no
+    dispatcher, so both the listener and the event must be picklable and changes to
+    the event are not seen by the caller. Use the result of the future instead.
+    """
+
+    def __init__(self, listener: Callable, executor: str):
+        if executor not in (THREAD, PROCESS):
+            raise LogicError('Unknown executor "{}", expected "{}" or "{}".'.format(executor, THREAD, PROCESS))
+        self.__listener = listener
+        self.__executor = executor
+
+    def get_listener(self) -> Callable:
+        return self.__listener
+
+    def get_executor(self) -> str:
+        return self.__executor
+
+    def __call__(self, event: Event, event_name: str, dispatcher) -> Future:
+        return dispatcher.submit(self.__executor, self.__listener, event, event_name)
+
+    def __eq__(self, other):
+        if isinstance(other, OffloadedListener):
+            other = other.get_listener()
+        return self.__listener == other
+
+    def __hash__(self):
+        return hash(self.__listener)
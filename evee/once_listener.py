@@ -0,0 +1,45 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from typing import Callable
+
+from evee.event import Event
+
+
+class OnceListener(object):
+    """
+    Listener that is only called once. The callback removes the registration from
+    the dispatcher right before the listener is called, so the listener is removed
+    even if it fails.
+    """
+
+    __slots__ = ('__listener', '__callback', '__called')
+
+    def __init__(self, listener: Callable, callback: Callable[[], None]):
+        self.__listener = listener
+        self.__callback = callback
+        self.__called = False
+
+    def get_listener(self) -> Callable:
+        return self.__listener
+
+    def __call__(self, event: Event, event_name: str, dispatcher):
+        if self.__called:
+            return
+
+        self.__called = True
+        self.__callback()
+        return self.__listener(event, event_name, dispatcher)
+
+    def __eq__(self, other):
+        if isinstance(other, OnceListener):
+            other = other.get_listener()
+        return self.__listener == other
+
+    def __hash__(self):
+        return hash(self.__listener)
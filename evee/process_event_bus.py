@@ -0,0 +1,215 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+import multiprocessing
+import pickle
+from concurrent.futures import Future
+from queue import Empty
+from typing import Callable, List, Sequence, Any, Optional
+
+from evee.abstract_event_dispatcher import AbstractEventDispatcher
+from evee.abstract_event_subscriber import AbstractEventSubscriber
+from evee.event import Event
+from evee.event_dispatcher import EventDispatcher
+from evee.exception import LogicError
+
+
+class ProcessEventBus(AbstractEventDispatcher):
+    """
+    Event dispatcher shared by several processes, e.g. the workers of a pre-fork
+    server. The bus is created before the workers are started and every process
+    attaches to it with its own index. Listeners are registered per process, and
+    events dispatched in one process are pickled and delivered in batches through
+    a multiprocessing queue per process, where they are dispatched by poll().
+    """
+
+    def __init__(self, processes: int, batch_size: int = 1, fan_out: int = None, local: bool = True,
+                 context: multiprocessing.context.BaseContext = None):
+        """
+        :param processes:  The number of processes attached to the bus
+        :param batch_size: Events sent to a process are buffered until this many
+                            are pending, see flush()
+        :param fan_out:    The number of other processes each event is delivered to,
+                            targets are picked round robin. Defaults to all of them
+        :param local:      Also dispatch the events to the listeners of the
+                            process that dispatches them
+        :param context:    The multiprocessing context used to create the queues
+        """
+        if processes < 1:
+            raise LogicError('A process event bus needs at least one process, got {}.'.format(processes))
+
+        context = context or multiprocessing.get_context()
+        self.__queues = [context.Queue() for _ in range(processes)]
+        self.__batch_size = batch_size
+        self.__fan_out = fan_out
+        self.__local = local
+        self.__dispatcher = _LocalEventDispatcher(self)
+        self.__index = 0
+        self.__pending = {}
+        self.__next_target = 0
+
+    def attach(self, index: int):
+        """
+        Sets the index of the current process, must be called by every process once
+        it is started. The process that created the bus has the index 0.
+
+        :param index: The index of the process, from 0 to processes - 1
+        """
+        if not 0 <= index < len(self.__queues):
+            raise LogicError('Invalid process index {}, expected 0 to {}.'.format(index, len(self.__queues) - 1))
+
+        self.__index = index
+        self.__pending = {}
+        self.__next_target = index
+
+    def get_index(self) -> int:
+        return self.__index
+
+    def dispatch(self, event_name: str, event: Event = None) -> Event:
+        """
+        Dispatches an event to the local listeners, then sends it to the other
+        processes unless a local listener stopped its propagation.
+
+        :param event_name: The name of the event to dispatch
+        :param event:      The event to pass to the event handlers/listeners
+                            If not supplied, an empty Event instance is created
+        :return:           An instance of Event
+        """
+        if event is None:
+            event = Event()
+
+        if self.__local:
+            self.__dispatch_local(event_name, event)
+
+        targets = self.__get_targets() if not event.is_propagation_stopped() else []
+        if targets:
+            # Events are pickled once right away, later changes to them are not sent
+            payload = pickle.dumps((event_name, event), pickle.HIGHEST_PROTOCOL)
+            for target in targets:
+                pending = self.__pending.setdefault(target, [])
+                pending.append(payload)
+                if len(pending) >= self.__batch_size:
+                    self.__send(target)
+
+        return event
+
+    def flush(self):
+        """
+        Sends the events that are waiting for a full batch.
+        """
+        for target in list(self.__pending):
+            self.__send(target)
+
+    def poll(self, timeout: float = 0) -> int:
+        """
+        Dispatches the events received from the other processes to the local listeners,
+        and runs the delayed calls of the throttled and debounced listeners that are due.
+
+        :param timeout: Seconds to wait for the first batch, None waits until a
+                         batch is received and 0 does not wait
+        :return:        The number of events dispatched
+        """
+        self.__dispatcher.advance_timers()
+        queue = self.__queues[self.__index]
+        dispatched = 0
+        try:
+            batch = queue.get_nowait() if timeout == 0 else queue.get(True, timeout)
+            while True:
+                for payload in batch:
+                    self.__dispatch_local(*pickle.loads(payload))
+                    dispatched += 1
+                batch = queue.get_nowait()
+        except Empty:
+            return dispatched
+
+    def close(self):
+        """
+        Flushes the pending events and waits until they are written to the queues.
+        """
+        self.flush()
+        for queue in self.__queues:
+            queue.close()
+            queue.join_thread()
+
+    def submit(self, executor: str, listener: Callable, event: Event, event_name: str) -> Future:
+        """
+        Submits a listener to the executors of the local listeners, see EventDispatcher.submit().
+        """
+        return self.__dispatcher.submit(executor, listener, event, event_name)
+
+    def join(self, timeout: float = None) -> List[Future]:
+        """
+        Waits for the offloaded local listeners that are still pending, see EventDispatcher.join().
+        """
+        return self.__dispatcher.join(timeout)
+
+    def advance_timers(self) -> int:
+        """
+        Runs the delayed calls of the throttled and debounced local listeners that are due,
+        see EventDispatcher.advance_timers().
+        """
+        return self.__dispatcher.advance_timers()
+
+    def add_listener(self, event_name: str, listener: Callable = None, priority: int = 0, **options):
+        self.__dispatcher.add_listener(event_name, listener, priority, **options)
+
+    def add_subscriber(self, subscriber: AbstractEventSubscriber):
+        self.__dispatcher.add_subscriber(subscriber)
+
+    def remove_listener(self, event_name: str, listener: Callable):
+        self.__dispatcher.remove_listener(event_name, listener)
+
+    def remove_subscriber(self, subscriber: AbstractEventSubscriber):
+        self.__dispatcher.remove_subscriber(subscriber)
+
+    def get_listeners(self, event_name: str = None) -> Sequence[Callable[[Event, str, Any], Event]]:
+        return self.__dispatcher.get_listeners(event_name)
+
+    def get_listener_priority(self, event_name: str, listener: Callable) -> Optional[Any]:
+        return self.__dispatcher.get_listener_priority(event_name, listener)
+
+    def has_listeners(self, event_name: str = None) -> bool:
+        return self.__dispatcher.has_listeners(event_name)
+
+    def __dispatch_local(self, event_name: str, event: Event):
+        self.__dispatcher.dispatch(event_name, event)
+
+    def __get_targets(self) -> Sequence[int]:
+        peers = [index for index in range(len(self.__queues)) if index != self.__index]
+        if self.__fan_out is None or self.__fan_out >= len(peers):
+            return peers
+
+        start = self.__next_target % len(peers)
+        self.__next_target = start + self.__fan_out
+        return [peers[(start + offset) % len(peers)] for offset in range(self.__fan_out)]
+
+    def __send(self, target: int):
+        batch = self.__pending.pop(target, None)
+        if batch:
+            self.__queues[target].put(batch)
+
+
+class _LocalEventDispatcher(EventDispatcher):
+    """
+    Dispatcher of the listeners of the current process. Listeners receive the bus, so
+    the events they dispatch are sent to the other processes as well.
+    """
+
+    def __init__(self, bus: ProcessEventBus):
+        super().__init__()
+        self.__bus = bus
+
+    def _get_options(self) -> dict:
+        return {'bus': self.__bus}
+
+    def _do_dispatch(self, listeners: Sequence[Callable[[Event, str, AbstractEventDispatcher], Event]],
+                     event_name: str, event: Event):
+        for listener in listeners:
+            listener(event, event_name, self.__bus)
+            if event.is_propagation_stopped():
+                break
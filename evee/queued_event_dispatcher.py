@@ -0,0 +1,126 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from itertools import count
+from time import monotonic
+from typing import Callable, Hashable, List, Tuple
+
+from evee.event import Event
+from evee.event_dispatcher import EventDispatcher
+
+
+class QueuedEventDispatcher(EventDispatcher):
+    def __init__(self, max_size: int = None, max_delay: float = None, weak: bool = False):
+        """
+        Event dispatcher that can buffer events and dispatch them later in a single
+        flush. Events enqueued with the same event name and coalesce key are merged,
+        so a burst of "something changed" notifications is only dispatched once.
+
+        :param max_size:  Flush as soon as this many events are queued
+        :param max_delay: Flush when an event is enqueued and the oldest queued event
+                           has been waiting for at least this many seconds. The delay
+                           is only checked on enqueue, call flush() when idle
+        :param weak:      See EventDispatcher
+        """
+        super().__init__(weak)
+        self.__weak = weak
+        self.__max_size = max_size
+        self.__max_delay = max_delay
+        self.__queue = {}
+        self.__keys = count()
+        self.__queued_at = None
+
+    def enqueue(self, event_name: str, event: Event = None, coalesce_key: Hashable = None,
+                merge: Callable[[Event, Event], Event] = None) -> Event:
+        """
+        Queues an event until the next flush.
+
+        :param event_name:   The name of the event to dispatch
+        :param event:        The event to pass to the event handlers/listeners
+                              If not supplied, an empty Event instance is created
+        :param coalesce_key: Events with the same name and coalesce key are only
+                              dispatched once, at the position of the first one
+        :param merge:        Called with the queued and the new event and returns
+                              the event to keep, by default the new event replaces
+                              the queued one
+        :return:             The event that is queued
+        """
+        if event is None:
+            event = Event()
+
+        if coalesce_key is None:
+            key = next(self.__keys)
+        else:
+            key = (event_name, coalesce_key)
+            queued = self.__queue.get(key)
+            if queued is not None and merge is not None:
+                event = merge(queued[1], event)
+
+        if not self.__queue:
+            self.__queued_at = monotonic()
+        self.__queue[key] = (event_name, event)
+
+        if self.__max_size is not None and len(self.__queue) >= self.__max_size:
+            self.flush()
+        elif self.__max_delay is not None and monotonic() - self.__queued_at >= self.__max_delay:
+            self.flush()
+
+        return event
+
+    def flush(self) -> List[Tuple[str, Event]]:
+        """
+        Dispatches every queued event. Events are grouped by name and the listeners of
+        each name are looked up and walked once: every listener is called with all
+        the events of the name that have not stopped propagation before moving on to
+        the next listener. While middlewares are set, see use(), every event is
+        dispatched through them on its own instead. Events enqueued by listeners are
+        kept for the next flush.
+
+        :return: The dispatched event names and events, in queue order
+        """
+        queue, self.__queue = self.__queue, {}
+        self.__queued_at = None
+
+        events = {}
+        for event_name, event in queue.values():
+            events.setdefault(event_name, []).append(event)
+
+        routed = bool(self.get_middlewares())
+        for event_name, named_events in events.items():
+            if routed:
+                for event in named_events:
+                    self._dispatch(event_name, event)
+                continue
+
+            listeners = self.get_listeners(event_name)
+            if listeners:
+                self._do_dispatch_queued(listeners, event_name, named_events)
+
+        return list(queue.values())
+
+    def get_queue_size(self) -> int:
+        return len(self.__queue)
+
+    def _get_options(self) -> dict:
+        return {'max_size': self.__max_size, 'max_delay': self.__max_delay, 'weak': self.__weak}
+
+    def _do_dispatch_queued(self, listeners: List[Callable], event_name: str, events: List[Event]):
+        """
+        Triggers the listeners of an event for every queued event of that name.
+
+        :param listeners:  List of event listeners
+        :param event_name: The name of the event to dispatch
+        :param events:     The queued events
+        """
+        for listener in listeners:
+            events = [event for event in events if not event.is_propagation_stopped()]
+            if not events:
+                break
+
+            for event in events:
+                listener(event, event_name, self)
@@ -0,0 +1,155 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from threading import RLock
+from types import MappingProxyType
+from typing import Callable, Optional, Any
+from typing import Iterable, Sequence, Tuple, Union
+
+from evee.abstract_event_subscriber import AbstractEventSubscriber
+from evee.conditional_listener import MAX_ROUTES
+from evee.event import Event
+from evee.event_dispatcher import EventDispatcher
+from evee.event_name_trie import EventNameTrie
+from evee.exception import BadMethodCallError
+
+
+class ThreadSafeEventDispatcher(EventDispatcher):
+    """
+    Event dispatcher that can be shared between threads. Writers are serialized by a
+    lock and publish an immutable tuple of listeners per event, readers only fetch the
+    published tuple and never wait for the lock once the event has been dispatched.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__lock = RLock()
+        self.__snapshots = {}
+        self.__view = (-1, None)
+
+    def add_listener(self, event_name: str = None, listener: Callable = None, priority: int = 0, **options):
+        with self.__lock:
+            super().add_listener(event_name, listener, priority, **options)
+
+    def add_subscriber(self, subscriber: AbstractEventSubscriber):
+        with self.__lock:
+            super().add_subscriber(subscriber)
+
+    def add_subscribers(self, subscribers: Iterable[AbstractEventSubscriber]):
+        with self.__lock:
+            super().add_subscribers(subscribers)
+
+    def add_lazy_subscriber(self, subscriber_class: Union[type, str], factory: Callable[[], Any] = None):
+        with self.__lock:
+            super().add_lazy_subscriber(subscriber_class, factory)
+
+    def remove_listener(self, event_name: str, listener: Callable):
+        with self.__lock:
+            super().remove_listener(event_name, listener)
+
+    def remove_subscriber(self, subscriber: AbstractEventSubscriber):
+        with self.__lock:
+            super().remove_subscriber(subscriber)
+
+    def remove_lazy_subscriber(self, subscriber_class: Union[type, str]):
+        with self.__lock:
+            super().remove_lazy_subscriber(subscriber_class)
+
+    def use(self, middleware: Callable, per_listener: bool = False):
+        with self.__lock:
+            super().use(middleware, per_listener)
+
+    def remove_middleware(self, middleware: Callable):
+        with self.__lock:
+            super().remove_middleware(middleware)
+
+    def child(self):
+        raise BadMethodCallError('Child dispatchers are not supported by the thread safe event dispatcher.')
+
+    def advance_timers(self) -> int:
+        with self.__lock:
+            return super().advance_timers()
+
+    def _sweep(self):
+        with self.__lock:
+            super()._sweep()
+
+    def _remove_registrations(self, registrations: Iterable[Tuple[str, Callable, int, int]]):
+        with self.__lock:
+            super()._remove_registrations(registrations)
+
+    def get_listeners(self, event_name: str = None) -> Sequence[Callable[[Event, str, Any], Event]]:
+        """
+        Gets the listener of a specific event or all listeners stored by
+        descending priority. The listeners of a specific event are returned
+        as an immutable snapshot.
+
+        :param event_name: The name of the event
+        :return:           The event listeners for the specified event, or all
+                            event listeners by event name
+        """
+        if event_name:
+            self._expire()
+            # A single reference read, the snapshot dictionary is never mutated
+            listeners = self.__snapshots.get(event_name)
+            if listeners is None:
+                listeners = self.__snapshot(event_name)
+            return listeners
+
+        with self.__lock:
+            version, view = self.__view
+            if version != self.get_version():
+                view = MappingProxyType({name: tuple(listeners) for name, listeners in super().get_listeners().items()})
+                self.__view = (self.get_version(), view)
+            return view
+
+    def has_listeners(self, event_name: str = None) -> bool:
+        if event_name:
+            return bool(self.get_listeners(event_name))
+
+        with self.__lock:
+            return super().has_listeners()
+
+    def get_listener_priority(self, event_name: str, listener: Callable) -> Optional[Any]:
+        with self.__lock:
+            return super().get_listener_priority(event_name, listener)
+
+    def sort_listeners(self, event_name: str):
+        with self.__lock:
+            super().sort_listeners(event_name)
+
+    def __snapshot(self, event_name: str) -> Sequence[Callable[[Event, str, Any], Event]]:
+        """
+        Publishes the listeners of an event name. Event names may be unbounded, so
+        names without listeners are not published and at most MAX_ROUTES snapshots
+        are kept.
+
+        :param event_name: The name of the event
+        :return:           The immutable snapshot of the listeners
+        """
+        with self.__lock:
+            snapshots = self.__snapshots
+            if event_name in snapshots:
+                return snapshots[event_name]
+
+            listeners = tuple(super().get_listeners(event_name))
+            if listeners:
+                snapshots = dict(snapshots) if len(snapshots) < MAX_ROUTES else {}
+                snapshots[event_name] = listeners
+                self.__snapshots = snapshots
+            return listeners
+
+    def _invalidate(self, event_name: str):
+        super()._invalidate(event_name)
+        if EventNameTrie.is_pattern(event_name):
+            self.__snapshots = {name: listeners for name, listeners in self.__snapshots.items()
+                                if name != event_name and not EventNameTrie.matches(event_name, name)}
+        elif event_name in self.__snapshots:
+            snapshots = dict(self.__snapshots)
+            del snapshots[event_name]
+            self.__snapshots = snapshots
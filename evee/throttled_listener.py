@@ -0,0 +1,90 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from typing import Callable
+
+from evee.event import Event
+from evee.exception import LogicError
+from evee.timer_wheel import TimerWheel
+
+
+class ThrottledListener(object):
+    """
+    Listener that limits how often the actual listener is called.
+
+    A throttled listener is called at most once per interval: the first event is
+    passed on right away, and the last event received during the interval is passed
+    on once the interval is over. A debounced listener is only called once no event
+    was received for a whole interval, with the last event.
+
+    Delayed calls are scheduled on the timer wheel of the dispatcher and happen
+    after the dispatch of the event returned, so they cannot stop its propagation.
+    """
+
+    def __init__(self, listener: Callable, interval: float, wheel: TimerWheel, debounce: bool = False):
+        if interval <= 0:
+            raise LogicError('The throttle or debounce interval must be positive, got {}.'.format(interval))
+
+        self.__listener = listener
+        self.__interval = interval
+        self.__wheel = wheel
+        self.__debounce = debounce
+        self.__pending = None
+        self.__scheduled = False
+        self.__deadline = float('-inf')
+
+    def get_listener(self) -> Callable:
+        return self.__listener
+
+    def cancel(self):
+        """
+        Drops the pending call, if any.
+        """
+        self.__pending = None
+
+    def __call__(self, event: Event, event_name: str, dispatcher):
+        now = self.__wheel.now()
+        if self.__debounce:
+            self.__deadline = now + self.__interval
+        elif now >= self.__deadline and not self.__scheduled:
+            self.__deadline = now + self.__interval
+            return self.__listener(event, event_name, dispatcher)
+
+        self.__pending = (event, event_name, dispatcher)
+        if not self.__scheduled:
+            self.__scheduled = True
+            self.__wheel.schedule(self.__deadline, self.__fire)
+
+    def __fire(self):
+        rescheduled = False
+        try:
+            if self.__pending is None:
+                return
+
+            now = self.__wheel.now()
+            if now < self.__deadline:
+                # Debounced events received since the timer was scheduled push it back
+                self.__wheel.schedule(self.__deadline, self.__fire)
+                rescheduled = True
+                return
+
+            pending, self.__pending = self.__pending, None
+            if not self.__debounce:
+                self.__deadline += self.__interval
+            self.__listener(*pending)
+        finally:
+            # A failing listener must not keep the next events from being scheduled
+            self.__scheduled = rescheduled
+
+    def __eq__(self, other):
+        if isinstance(other, ThrottledListener):
+            other = other.get_listener()
+        return self.__listener == other
+
+    def __hash__(self):
+        return hash(self.__listener)
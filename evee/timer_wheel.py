@@ -0,0 +1,98 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from math import ceil
+from time import monotonic
+from typing import Callable, List, Optional
+
+
+class TimerWheel(object):
+    """
+    Hashed timer wheel. Time is divided in ticks of a fixed resolution and timers are
+    stored in the slot of their tick modulo the size of the wheel, so scheduling a
+    timer is O(1) and advancing only visits the slots of the elapsed ticks. Timers
+    run when the wheel is advanced, the wheel has no thread of its own.
+    """
+
+    def __init__(self, resolution: float = 0.01, size: int = 256, clock: Callable[[], float] = monotonic,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        :param resolution: The duration of a tick in seconds, timers run up to one
+                            tick late
+        :param size:       The number of slots of the wheel
+        :param clock:      Returns the current time in seconds
+        :param on_error:   Called with the exception of every failing timer. Without
+                            it, the first exception is raised once every due timer ran
+        """
+        self.__resolution = resolution
+        self.__on_error = on_error
+        self.__clock = clock
+        self.__slots = [[] for _ in range(size)]
+        self.__tick = int(clock() / resolution)
+        self.__pending = 0
+
+    def now(self) -> float:
+        return self.__clock()
+
+    def schedule(self, deadline: float, callback: Callable[[], None]):
+        """
+        Schedules a callback.
+
+        :param deadline: The time to run the callback at, see now()
+        :param callback: A callable without arguments
+        """
+        tick = max(ceil(deadline / self.__resolution), self.__tick + 1)
+        self.__slots[tick % len(self.__slots)].append((tick, callback))
+        self.__pending += 1
+
+    def advance(self) -> int:
+        """
+        Runs the timers that are due. A failing timer does not prevent the other due
+        timers from running, see the on_error argument.
+
+        :return: The number of timers that ran
+        """
+        current = int(self.__clock() / self.__resolution)
+        if current <= self.__tick or not self.__pending:
+            self.__tick = max(current, self.__tick)
+            return 0
+
+        due = []
+        # After a full turn every slot is visited once
+        for tick in range(self.__tick + 1, min(current, self.__tick + len(self.__slots)) + 1):
+            self.__collect(self.__slots[tick % len(self.__slots)], current, due)
+        self.__tick = current
+
+        self.__pending -= len(due)
+        errors = []
+        for tick, callback in sorted(due, key=lambda timer: timer[0]):
+            try:
+                callback()
+            except Exception as exception:
+                if self.__on_error is None:
+                    errors.append(exception)
+                else:
+                    self.__on_error(exception)
+
+        if errors:
+            raise errors[0]
+
+        return len(due)
+
+    def __len__(self) -> int:
+        return self.__pending
+
+    @staticmethod
+    def __collect(slot: List[tuple], current: int, due: List[tuple]):
+        if not slot:
+            return
+
+        kept = []
+        for timer in slot:
+            (due if timer[0] <= current else kept).append(timer)
+        slot[:] = kept
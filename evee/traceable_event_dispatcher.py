@@ -0,0 +1,267 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from inspect import isawaitable
+from typing import Awaitable, Callable, Sequence, Any, List
+
+from evee.abstract_event_dispatcher import AbstractEventDispatcher
+from evee.abstract_event_subscriber import AbstractEventSubscriber
+from evee.event import Event
+from evee.event_dispatcher import _get_index_key
+from evee.event_name_trie import EventNameTrie
+
+try:
+    from time import perf_counter_ns
+except ImportError:  # pragma: no cover
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
+
+class TraceableEventDispatcher(AbstractEventDispatcher):
+    """
+    Collects per listener timings and call counts of the wrapped dispatcher. While
+    tracing is enabled a per listener middleware is added to the wrapped dispatcher,
+    see EventDispatcher.use(), so events are still dispatched by the wrapped
+    dispatcher, with its own routing, timers and executors, and listeners receive
+    the wrapped dispatcher. The wrapped dispatcher cannot dispatch batches while the
+    middleware is set. Dispatchers without middlewares only get latency histograms.
+    Dispatches of an asynchronous dispatcher are traced once they are awaited.
+    """
+
+    def __init__(self, dispatcher: AbstractEventDispatcher, enabled: bool = True):
+        super().__init__()
+        self.__dispatcher = dispatcher
+        self.__enabled = False
+        self.__middleware = self.__trace
+        self.__listeners = {}
+        self.__latencies = {}
+        self.__stoppers = {}
+        if enabled:
+            self.enable()
+
+    def enable(self):
+        if not self.__enabled and hasattr(self.__dispatcher, 'use'):
+            self.__dispatcher.use(self.__middleware, per_listener=True)
+        self.__enabled = True
+
+    def disable(self):
+        if self.__enabled and hasattr(self.__dispatcher, 'remove_middleware'):
+            self.__dispatcher.remove_middleware(self.__middleware)
+        self.__enabled = False
+
+    def is_enabled(self) -> bool:
+        return self.__enabled
+
+    def reset(self):
+        self.__listeners = {}
+        self.__latencies = {}
+
+    def dispatch(self, event_name: str, event: Event = None) -> Event:
+        if not self.__enabled:
+            return self.__dispatcher.dispatch(event_name, event)
+
+        if event is None:
+            event = Event()
+
+        # The listener that stops the propagation is recorded by the middleware
+        frame = (event_name, id(event))
+        self.__stoppers[frame] = None
+        start = perf_counter_ns()
+        try:
+            result = self.__dispatcher.dispatch(event_name, event)
+        except BaseException:
+            del self.__stoppers[frame]
+            raise
+
+        if isawaitable(result):
+            return self.__await_dispatch(result, event_name, frame, start)
+
+        self.__end_dispatch(event_name, frame, start)
+        return result
+
+    def add_listener(self, event_name: str, listener: Callable = None, priority: int = 0, **options):
+        self.__dispatcher.add_listener(event_name, listener, priority, **options)
+
+    def add_subscriber(self, subscriber: AbstractEventSubscriber):
+        self.__dispatcher.add_subscriber(subscriber)
+
+    def remove_listener(self, event_name: str, listener: Callable):
+        self.__dispatcher.remove_listener(event_name, listener)
+
+    def remove_subscriber(self, subscriber: AbstractEventSubscriber):
+        self.__dispatcher.remove_subscriber(subscriber)
+
+    def get_listeners(self, event_name: str = None) -> Sequence[Callable[[Event, str, Any], Event]]:
+        return self.__dispatcher.get_listeners(event_name)
+
+    def get_listener_priority(self, event_name: str, listener: Callable) -> int:
+        return self.__dispatcher.get_listener_priority(event_name, listener)
+
+    def has_listeners(self, event_name: str = None) -> bool:
+        return self.__dispatcher.has_listeners(event_name)
+
+    def get_called_listeners(self, event_name: str = None) -> List[dict]:
+        """
+        Get the listeners that were called while tracing.
+
+        :param event_name: The name of the event, or all events if not supplied
+        :return:           One dictionary per listener with the event name, the
+                            listener, its priority, the number of calls, the total
+                            and maximum nanoseconds spent in it and the number of
+                            dispatches that skipped it
+        """
+        return [stats for stats in self.__get_stats(event_name) if stats['calls']]
+
+    def get_not_called_listeners(self, event_name: str = None) -> List[dict]:
+        """
+        Get the registered listeners that were not called while tracing, either
+        because the event was not dispatched or because a listener with a higher
+        priority stopped its propagation. Listeners of a pattern are reported under
+        the dispatched names matching the pattern, or under the pattern if none did.
+
+        :param event_name: The name of the event or a pattern, or all events if not supplied
+        :return:           One dictionary per listener, see get_called_listeners()
+        """
+        not_called = [stats for stats in self.__get_stats(event_name) if not stats['calls']]
+        registered = [event_name] if event_name else list(self.__dispatcher.get_listeners().keys())
+        names = self.__get_traced_names(event_name)
+        for name in registered:
+            if name not in names and not any(EventNameTrie.matches(name, traced) for traced in names):
+                names.append(name)
+
+        for name in names:
+            traced = self.__listeners.get(name, {})
+            for listener in self.__dispatcher.get_listeners(name):
+                if _get_index_key(listener) not in traced:
+                    not_called.append(self.__to_dict(name, _ListenerStats(listener)))
+
+        return not_called
+
+    def get_latency_histogram(self, event_name: str) -> dict:
+        """
+        Get the dispatch latencies of an event.
+
+        :param event_name: The name of the event
+        :return:           Number of dispatches by upper bound in nanoseconds,
+                            bounds are powers of two
+        """
+        return dict(sorted(self.__latencies.get(event_name, {}).items()))
+
+    def get_latency_histograms(self) -> dict:
+        return {event_name: self.get_latency_histogram(event_name) for event_name in self.__latencies}
+
+    def __trace(self, listener: Callable, event_name: str) -> Callable:
+        """
+        Per listener middleware timing every call of a listener.
+
+        :param listener:   The listener
+        :param event_name: The name of the event
+        :return:           The traced listener
+        """
+        def call(event: Event, name: str, dispatcher):
+            start = perf_counter_ns()
+            result = listener(event, name, dispatcher)
+            if isawaitable(result):
+                return self.__await_listener(result, listener, event, event_name, start)
+
+            self.__record(listener, event, event_name, perf_counter_ns() - start)
+            return result
+
+        return call
+
+    async def __await_listener(self, result: Awaitable, listener: Callable, event: Event, event_name: str,
+                               start: int) -> Any:
+        result = await result
+        self.__record(listener, event, event_name, perf_counter_ns() - start)
+        return result
+
+    async def __await_dispatch(self, result: Awaitable, event_name: str, frame: tuple, start: int) -> Any:
+        try:
+            result = await result
+        except BaseException:
+            del self.__stoppers[frame]
+            raise
+
+        self.__end_dispatch(event_name, frame, start)
+        return result
+
+    def __record(self, listener: Callable, event: Event, event_name: str, elapsed: int):
+        key = _get_index_key(listener)
+        traced = self.__listeners.setdefault(event_name, {})
+        stats = traced.get(key)
+        if stats is None:
+            stats = traced[key] = _ListenerStats(listener)
+        stats.calls += 1
+        stats.total_ns += elapsed
+        stats.max_ns = max(stats.max_ns, elapsed)
+
+        frame = (event_name, id(event))
+        if event.is_propagation_stopped() and frame in self.__stoppers and self.__stoppers[frame] is None:
+            self.__stoppers[frame] = listener
+
+    def __end_dispatch(self, event_name: str, frame: tuple, start: int):
+        # Latencies are bucketed by the next power of two of the nanoseconds spent
+        bucket = 1 << (perf_counter_ns() - start).bit_length()
+        histogram = self.__latencies.setdefault(event_name, {})
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+
+        stopper = self.__stoppers.pop(frame)
+        if stopper is None:
+            return
+
+        listeners = list(self.__dispatcher.get_listeners(event_name))
+        stats = self.__listeners.setdefault(event_name, {})
+        for skipped in listeners[listeners.index(stopper) + 1:] if stopper in listeners else ():
+            key = _get_index_key(skipped)
+            skipped_stats = stats.get(key)
+            if skipped_stats is None:
+                skipped_stats = stats[key] = _ListenerStats(skipped)
+            skipped_stats.skipped += 1
+            skipped_stats.stopped_by = stopper
+
+    def __get_stats(self, event_name: str = None) -> List[dict]:
+        return [self.__to_dict(name, stats)
+                for name in self.__get_traced_names(event_name)
+                for stats in self.__listeners.get(name, {}).values()]
+
+    def __get_traced_names(self, event_name: str = None) -> List[str]:
+        """
+        :param event_name: The name of the event or a pattern, or all events if not supplied
+        :return:           The traced event names matching the event name
+        """
+        if not event_name:
+            return list(self.__listeners.keys())
+        if EventNameTrie.is_pattern(event_name):
+            return [name for name in self.__listeners if EventNameTrie.matches(event_name, name)]
+        return [event_name]
+
+    def __to_dict(self, event_name: str, stats: '_ListenerStats') -> dict:
+        return {
+            'event_name': event_name,
+            'listener': stats.listener,
+            'priority': self.__dispatcher.get_listener_priority(event_name, stats.listener),
+            'calls': stats.calls,
+            'total_ns': stats.total_ns,
+            'max_ns': stats.max_ns,
+            'skipped': stats.skipped,
+            'stopped_by': stats.stopped_by,
+        }
+
+
+class _ListenerStats(object):
+    __slots__ = ('listener', 'calls', 'total_ns', 'max_ns', 'skipped', 'stopped_by')
+
+    def __init__(self, listener: Callable):
+        self.listener = listener
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.skipped = 0
+        self.stopped_by = None
@@ -0,0 +1,54 @@
+#
+# This file is part of the onema.io evee Package.
+# For the full copyright and license information,
+# please view the LICENSE file that was distributed
+# with this source code.
+#
+# @author Juan Manuel Torres <software@onema.io>
+#
+from inspect import ismethod
+from typing import Any, Callable
+from weakref import WeakMethod, ref
+
+from evee.event import Event
+
+
+class WeakListener(object):
+    """
+    Listener that only holds a weak reference to the actual listener, bound methods
+    are referenced through a WeakMethod so the subscriber can be collected. The
+    callback is invoked with the weak listener once the listener is collected.
+
+    A weak listener hashes and compares like the listener it references, so it can be
+    found in dictionaries and lists using the listener itself.
+    """
+
+    __slots__ = ('__ref', '__hash', '__weakref__')
+
+    def __init__(self, listener: Callable, callback: Callable[['WeakListener'], Any] = None):
+        on_collect = (lambda reference: callback(self)) if callback else None
+        self.__ref = WeakMethod(listener, on_collect) if ismethod(listener) else ref(listener, on_collect)
+        self.__hash = hash(listener)
+
+    def get_listener(self) -> Callable:
+        """
+        :return: The listener, or None if it was collected
+        """
+        return self.__ref()
+
+    def __call__(self, event: Event, event_name: str, dispatcher):
+        listener = self.__ref()
+        if listener is not None:
+            return listener(event, event_name, dispatcher)
+
+    def __eq__(self, other):
+        if other is self:
+            return True
+
+        listener = self.__ref()
+        if isinstance(other, WeakListener):
+            other = other.get_listener()
+        return listener is not None and listener == other
+
+    def __hash__(self):
+        return self.__hash
@@ -61,6 +61,103 @@ class AbstractEventDispatcherTest(TestCase, metaclass=ABCMeta):
 
         self.assertListEqual(expected, self.__dispatcher.get_listeners('pre.foo'))
 
+    def _listeners_stay_sorted_on_add_and_remove(self):
+        listener_1 = TestEventListener()
+        listener_2 = TestEventListener()
+        listener_3 = TestEventListener()
+        listener_4 = TestEventListener()
+
+        self.__dispatcher.add_listener('pre.foo', listener_1, 10)
+        self.__dispatcher.add_listener('pre.foo', listener_2, -10)
+        self.__dispatcher.add_listener('pre.foo', listener_3, 10)
+        self.assertSequenceEqual([listener_1, listener_3, listener_2], self.__dispatcher.get_listeners('pre.foo'))
+
+        self.__dispatcher.remove_listener('pre.foo', listener_1)
+        self.__dispatcher.add_listener('pre.foo', listener_4)
+        self.__dispatcher.add_listener('pre.foo', listener_1, 10)
+        self.assertSequenceEqual([listener_3, listener_1, listener_4, listener_2],
+                                 self.__dispatcher.get_listeners('pre.foo'))
+
+        self.__dispatcher.remove_listener('pre.foo', listener_2)
+        self.__dispatcher.remove_listener('pre.foo', listener_4)
+        self.assertSequenceEqual([listener_3, listener_1], self.__dispatcher.get_listeners('pre.foo'))
+        self.assertEqual(10, self.__dispatcher.get_listener_priority('pre.foo', listener_1))
+        self.assertIsNone(self.__dispatcher.get_listener_priority('pre.foo', listener_2))
+
+    def _remove_listener_registered_many_times(self):
+        listener_1 = TestEventListener()
+        listener_2 = TestEventListener()
+
+        self.__dispatcher.add_listener('pre.foo', listener_1, 10)
+        self.__dispatcher.add_listener('pre.foo', listener_2)
+        self.__dispatcher.add_listener('pre.foo', listener_1, -10)
+        self.__dispatcher.add_listener('pre.foo', listener_1, -10)
+        self.__dispatcher.add_listener('post.foo', listener_1, 5)
+        self.assertEqual(10, self.__dispatcher.get_listener_priority('pre.foo', listener_1))
+        self.assertEqual(5, self.__dispatcher.get_listener_priority('post.foo', listener_1))
+
+        self.__dispatcher.remove_listener('pre.foo', listener_1)
+        self.assertSequenceEqual([listener_2, listener_1], self.__dispatcher.get_listeners('pre.foo'))
+        self.assertEqual(-10, self.__dispatcher.get_listener_priority('pre.foo', listener_1))
+        self.assertEqual(5, self.__dispatcher.get_listener_priority('post.foo', listener_1))
+
+        self.__dispatcher.remove_listener('pre.foo', listener_1)
+        self.__dispatcher.remove_listener('post.foo', listener_1)
+        self.assertSequenceEqual([listener_2], self.__dispatcher.get_listeners('pre.foo'))
+        self.assertIsNone(self.__dispatcher.get_listener_priority('pre.foo', listener_1))
+        self.assertFalse(self.__dispatcher.has_listeners(self.POST_FOO))
+
+    def _wildcard_listeners_merge_by_priority(self):
+        invoked = []
+        exact = lambda event, name, dispatcher: invoked.append('exact')
+        single = lambda event, name, dispatcher: invoked.append('single')
+        multi = lambda event, name, dispatcher: invoked.append('multi')
+
+        self.__dispatcher.add_listener('order.created', exact)
+        self.__dispatcher.add_listener('order.*', single, 10)
+        self.__dispatcher.add_listener('order.**', multi, -10)
+        self.assertSequenceEqual([single, exact, multi], self.__dispatcher.get_listeners('order.created'))
+        self.assertSequenceEqual([multi], self.__dispatcher.get_listeners('order.item.added'))
+        self.assertSequenceEqual([single], self.__dispatcher.get_listeners('order.*'))
+        self.assertFalse(self.__dispatcher.has_listeners('user.created'))
+
+        self.__dispatcher.dispatch('order.created')
+        self.__dispatcher.dispatch('order.updated')
+        self.assertListEqual(['single', 'exact', 'multi', 'single', 'multi'], invoked)
+
+    def _wildcard_listeners_invalidate_cached_resolution(self):
+        listener_1 = TestEventListener()
+        listener_2 = TestEventListener()
+
+        self.__dispatcher.add_listener('order.*', listener_1)
+        self.assertSequenceEqual([listener_1], self.__dispatcher.get_listeners('order.created'))
+
+        self.__dispatcher.add_listener('*.created', listener_2, 10)
+        self.assertSequenceEqual([listener_2, listener_1], self.__dispatcher.get_listeners('order.created'))
+
+        self.__dispatcher.add_listener('order.created', listener_1, 20)
+        self.assertSequenceEqual([listener_1, listener_2, listener_1],
+                                 self.__dispatcher.get_listeners('order.created'))
+
+        self.__dispatcher.remove_listener('order.*', listener_1)
+        self.__dispatcher.remove_listener('*.created', listener_2)
+        self.assertSequenceEqual([listener_1], self.__dispatcher.get_listeners('order.created'))
+        self.assertFalse(self.__dispatcher.has_listeners('order.updated'))
+
+    def _remove_listener_during_dispatch(self):
+        invoked = []
+        listener_2 = lambda event, name, dispatcher: invoked.append('2')
+
+        def listener_1(event, name, dispatcher):
+            invoked.append('1')
+            dispatcher.remove_listener(name, listener_2)
+
+        self.__dispatcher.add_listener('pre.foo', listener_1, 10)
+        self.__dispatcher.add_listener('pre.foo', listener_2)
+        self.__dispatcher.dispatch(self.PRE_FOO)
+        self.__dispatcher.dispatch(self.PRE_FOO)
+        self.assertListEqual(['1', '2', '1'], invoked)
+
     def _get_all_listeners_sorts_by_priority(self):
         listener_1 = TestEventListener()
         listener_2 = TestEventListener()
@@ -81,7 +178,7 @@ class AbstractEventDispatcherTest(TestCase, metaclass=ABCMeta):
             'post.foo': [listener_6, listener_5, listener_4],
         }
 
-        self.assertDictEqual(expected, self.__dispatcher.get_listeners())
+        self.assertDictEqual(expected, dict(self.__dispatcher.get_listeners()))
 
     def _get_listener_priority(self):
         listener_1 = TestEventListener()
@@ -180,6 +277,30 @@ class AbstractEventDispatcherTest(TestCase, metaclass=ABCMeta):
         self.assertEqual(2, len(listeners))
         self.assertEqual(getattr(event_subscriber, 'pre_foo2'), listeners[0])
 
+    def _add_subscribers(self):
+        listener = TestEventListener()
+        subscriber_1 = TestEventSubscriberWithPriorities()
+        subscriber_2 = TestEventSubscriberWithMultipleListeners()
+        subscriber_3 = TestEventSubscriberWithPriorities()
+
+        self.__dispatcher.add_listener('pre.foo', listener, 5)
+        self.__dispatcher.add_subscribers([subscriber_1, subscriber_2, subscriber_3])
+
+        expected = [
+            getattr(subscriber_1, 'pre_foo1'),
+            getattr(subscriber_2, 'pre_foo2'),
+            getattr(subscriber_3, 'pre_foo1'),
+            listener,
+            getattr(subscriber_2, 'pre_foo1'),
+        ]
+        self.assertSequenceEqual(expected, self.__dispatcher.get_listeners('pre.foo'))
+        self.assertEqual(2, len(self.__dispatcher.get_listeners('post.foo')))
+
+        for subscriber in [subscriber_1, subscriber_2, subscriber_3]:
+            self.__dispatcher.remove_subscriber(subscriber)
+        self.assertSequenceEqual([listener], self.__dispatcher.get_listeners('pre.foo'))
+        self.assertFalse(self.__dispatcher.has_listeners(self.POST_FOO))
+
     def _remove_subscriber(self):
         event_subscriber = TestEventSubscriber()
         self.__dispatcher.add_subscriber(event_subscriber)
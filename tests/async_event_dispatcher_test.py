@@ -0,0 +1,261 @@
+import asyncio
+from unittest import TestCase
+from evee import AsyncEventDispatcher
+from evee import BadMethodCallError
+from evee import Event
+from evee import GenericEvent
+from evee import GenericEventBatch
+from evee import LogicError
+from evee import QueueFullError
+from tests.abstract_event_dispatcher_test import TestEventSubscriber
+
+
+class AsyncEventDispatcherTest(TestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__loop = None
+
+    def setUp(self):
+        self.__loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.__loop.close()
+        self.__loop = None
+
+    def run_coroutine(self, coroutine):
+        return self.__loop.run_until_complete(coroutine)
+
+    def test_dispatch_awaits_coroutine_listeners_by_priority(self):
+        invoked = []
+
+        async def listener1(event, name, dispatcher):
+            await asyncio.sleep(0)
+            invoked.append('1')
+
+        def listener2(event, name, dispatcher):
+            invoked.append('2')
+
+        async def listener3(event, name, dispatcher):
+            invoked.append('3')
+
+        dispatcher = AsyncEventDispatcher()
+        dispatcher.add_listener('pre.foo', listener1, -10)
+        dispatcher.add_listener('pre.foo', listener2)
+        dispatcher.add_listener('pre.foo', listener3, 10)
+        event = Event()
+        self.assertEqual(event, self.run_coroutine(dispatcher.dispatch('pre.foo', event)))
+        self.assertListEqual(['3', '2', '1'], invoked)
+
+    def test_dispatch_without_listeners(self):
+        dispatcher = AsyncEventDispatcher()
+        self.assertIsInstance(self.run_coroutine(dispatcher.dispatch('noevent')), Event)
+
+    def test_stop_event_propagation(self):
+        invoked = []
+
+        async def stopper(event, name, dispatcher):
+            invoked.append('stopper')
+            event.stop_propagation()
+
+        async def listener(event, name, dispatcher):
+            invoked.append('listener')
+
+        dispatcher = AsyncEventDispatcher()
+        dispatcher.add_listener('pre.foo', stopper, 10)
+        dispatcher.add_listener('pre.foo', listener)
+        self.run_coroutine(dispatcher.dispatch('pre.foo'))
+        self.assertListEqual(['stopper'], invoked)
+
+    def test_concurrent_dispatch_gathers_each_priority_level(self):
+        invoked = []
+
+        async def waiting(event, name, dispatcher):
+            invoked.append('waiting')
+            while 'releasing' not in invoked:
+                await asyncio.sleep(0)
+            invoked.append('released')
+
+        async def releasing(event, name, dispatcher):
+            invoked.append('releasing')
+
+        async def lower(event, name, dispatcher):
+            invoked.append('lower')
+
+        dispatcher = AsyncEventDispatcher(concurrent=True)
+        self.assertTrue(dispatcher.is_concurrent())
+        dispatcher.add_listener('pre.foo', waiting, 10)
+        dispatcher.add_listener('pre.foo', releasing, 10)
+        dispatcher.add_listener('pre.foo', lower)
+        self.run_coroutine(dispatcher.dispatch('pre.foo'))
+        self.assertListEqual(['waiting', 'releasing', 'released', 'lower'], invoked)
+
+    def test_concurrent_dispatch_checks_propagation_at_priority_boundaries(self):
+        invoked = []
+
+        async def stopper(event, name, dispatcher):
+            invoked.append('stopper')
+            event.stop_propagation()
+
+        async def same_priority(event, name, dispatcher):
+            invoked.append('same_priority')
+
+        async def lower(event, name, dispatcher):
+            invoked.append('lower')
+
+        dispatcher = AsyncEventDispatcher(concurrent=True)
+        dispatcher.add_listener('pre.foo', stopper, 10)
+        dispatcher.add_listener('pre.foo', same_priority, 10)
+        dispatcher.add_listener('pre.foo', lower)
+        self.run_coroutine(dispatcher.dispatch('pre.foo'))
+        self.assertListEqual(['stopper', 'same_priority'], invoked)
+
+    def test_concurrent_dispatch_groups_pattern_and_repeated_listeners_by_registration(self):
+        invoked = []
+
+        def stopper(event, name, dispatcher):
+            invoked.append('stopper')
+            event.stop_propagation()
+
+        def listener(event, name, dispatcher):
+            invoked.append('listener')
+
+        dispatcher = AsyncEventDispatcher(concurrent=True)
+        dispatcher.add_listener('order.*', stopper, 10)
+        dispatcher.add_listener('order.*', listener, 0)
+        dispatcher.add_listener('order.created', listener, 10)
+        dispatcher.add_listener('order.created', listener, -10)
+        self.run_coroutine(dispatcher.dispatch('order.created'))
+        self.assertListEqual(['stopper', 'listener'], invoked)
+
+    def test_streams_and_batches_are_rejected(self):
+        dispatcher = AsyncEventDispatcher()
+        with self.assertRaises(BadMethodCallError):
+            dispatcher.dispatch_stream('pre.foo', [Event()])
+        with self.assertRaises(BadMethodCallError):
+            dispatcher.dispatch_batch('pre.foo', GenericEventBatch(None, {'id': [1]}))
+
+    def test_dispatch_goes_through_the_middlewares(self):
+        for concurrent in [False, True]:
+            invoked = []
+
+            async def listener(event, name, dispatcher):
+                await asyncio.sleep(0)
+                invoked.append(event['tenant'])
+
+            def outer(handler):
+                async def dispatch(listeners, event_name, event):
+                    invoked.append('before')
+                    await handler(listeners, event_name, event)
+                    invoked.append('after')
+                return dispatch
+
+            dispatcher = AsyncEventDispatcher(concurrent=concurrent)
+            dispatcher.add_listener('pre.foo', listener, when={'tenant': 'acme'})
+            dispatcher.add_listener('pre.foo', listener, -10)
+            dispatcher.use(outer)
+            dispatcher.use(lambda listener, name: lambda *args: invoked.append('wrapped') or listener(*args),
+                           per_listener=True)
+
+            self.run_coroutine(dispatcher.dispatch('pre.foo', GenericEvent(None, {'tenant': 'acme'})))
+            self.run_coroutine(dispatcher.dispatch('pre.foo', GenericEvent(None, {'tenant': 'initech'})))
+            wrapped = ['wrapped'] * (2 if concurrent else 1)
+            self.assertEqual(['before', 'wrapped', 'acme', 'wrapped', 'acme', 'after',
+                              'before'] + wrapped + ['initech', 'after'], invoked)
+
+    def test_add_and_remove_subscriber(self):
+        dispatcher = AsyncEventDispatcher()
+        subscriber = TestEventSubscriber()
+        dispatcher.add_subscriber(subscriber)
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+        self.assertTrue(dispatcher.has_listeners('post.foo'))
+        dispatcher.remove_subscriber(subscriber)
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_dispatch_nowait_dispatches_from_workers(self):
+        invoked = []
+
+        async def listener(event, name, dispatcher):
+            await asyncio.sleep(0)
+            invoked.append(name)
+
+        dispatcher = AsyncEventDispatcher(workers=2)
+        dispatcher.add_listener('pre.foo', listener)
+
+        async def produce():
+            for _ in range(5):
+                dispatcher.dispatch_nowait('pre.foo')
+            self.assertEqual([], invoked)
+            self.assertEqual(5, dispatcher.get_queue_metrics()['depth'])
+            await dispatcher.drain()
+
+        self.run_coroutine(produce())
+        metrics = dispatcher.get_queue_metrics()
+        self.assertEqual(['pre.foo'] * 5, invoked)
+        self.assertEqual(5, metrics['enqueued'])
+        self.assertEqual(5, metrics['processed'])
+        self.assertEqual(0, metrics['depth'])
+        self.assertEqual(0, metrics['workers'])
+        self.assertGreaterEqual(metrics['max_lag'], metrics['mean_lag'])
+
+    def test_overflow_policies(self):
+        invoked = []
+        dropping = AsyncEventDispatcher(max_queue_size=2, overflow='drop_oldest')
+        dropping.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(event))
+        rejecting = AsyncEventDispatcher(max_queue_size=2, overflow='reject')
+
+        async def produce():
+            events = [dropping.dispatch_nowait('pre.foo') for _ in range(3)]
+            await dropping.drain()
+            self.assertEqual(events[1:], invoked)
+
+            rejecting.dispatch_nowait('pre.foo')
+            await rejecting.enqueue('pre.foo')
+            with self.assertRaises(QueueFullError):
+                rejecting.dispatch_nowait('pre.foo')
+            await rejecting.drain()
+
+        self.run_coroutine(produce())
+        self.assertEqual(1, dropping.get_queue_metrics()['dropped'])
+        self.assertEqual(1, rejecting.get_queue_metrics()['rejected'])
+
+    def test_enqueue_blocks_until_the_queue_has_room(self):
+        dispatcher = AsyncEventDispatcher(max_queue_size=1)
+        invoked = []
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(name))
+
+        async def produce():
+            dispatcher.dispatch_nowait('pre.foo')
+            with self.assertRaises(QueueFullError):
+                dispatcher.dispatch_nowait('pre.foo')
+            await dispatcher.enqueue('pre.foo')
+            await dispatcher.drain()
+
+        self.run_coroutine(produce())
+        self.assertEqual(['pre.foo', 'pre.foo'], invoked)
+
+    def test_failing_listeners_do_not_stop_the_workers(self):
+        invoked = []
+        errors = []
+
+        def fail(event, name, dispatcher):
+            raise RuntimeError('failed')
+
+        dispatcher = AsyncEventDispatcher()
+        dispatcher.add_listener('pre.foo', fail)
+        dispatcher.add_listener('post.foo', lambda event, name, dispatcher: invoked.append(name))
+
+        async def produce():
+            asyncio.get_event_loop().set_exception_handler(lambda loop, context: errors.append(context))
+            dispatcher.dispatch_nowait('pre.foo')
+            dispatcher.dispatch_nowait('post.foo')
+            await dispatcher.drain()
+
+        self.run_coroutine(produce())
+        self.assertEqual(['post.foo'], invoked)
+        self.assertEqual(1, dispatcher.get_queue_metrics()['errors'])
+        self.assertIsInstance(errors[0]['exception'], RuntimeError)
+
+    def test_unknown_overflow_policy(self):
+        with self.assertRaises(LogicError):
+            AsyncEventDispatcher(overflow='wait')
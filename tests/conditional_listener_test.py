@@ -0,0 +1,114 @@
+from unittest import TestCase
+from evee import Event
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee.conditional_listener import ConditionalListener, ListenerRouter, MAX_ROUTES
+
+
+class ConditionalListenerTest(TestCase):
+    def setUp(self):
+        self.__dispatcher = EventDispatcher()
+        self.__invoked = []
+
+    def listener(self, label):
+        return lambda event, name, dispatcher: self.__invoked.append(label)
+
+    def test_equality_and_membership_conditions(self):
+        self.__dispatcher.add_listener('order', self.listener('acme'), when={'tenant': 'acme'})
+        self.__dispatcher.add_listener('order', self.listener('any'), when={'tenant': {'acme', 'initech'}})
+        self.__dispatcher.add_listener('order', self.listener('both'), when={'tenant': 'acme', 'region': 'eu'})
+
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'acme'}))
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'initech', 'region': 'eu'}))
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'acme', 'region': 'eu'}))
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'region': 'eu'}))
+
+        self.assertEqual(['acme', 'any', 'any', 'acme', 'any', 'both'], self.__invoked)
+
+    def test_priority_order_is_kept_across_conditional_listeners(self):
+        self.__dispatcher.add_listener('order', self.listener('low'), -10)
+        self.__dispatcher.add_listener('order', self.listener('acme'), 5, when={'tenant': 'acme'})
+        self.__dispatcher.add_listener('order', self.listener('high'), 10)
+        self.__dispatcher.add_listener('order', self.listener('initech'), 0, when={'tenant': 'initech'})
+
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'acme'}))
+        self.assertEqual(['high', 'acme', 'low'], self.__invoked)
+
+    def test_conditional_listeners_are_skipped_for_plain_events(self):
+        self.__dispatcher.add_listener('order', self.listener('acme'), when={'tenant': 'acme'})
+        self.__dispatcher.add_listener('order', self.listener('always'))
+
+        self.__dispatcher.dispatch('order', Event())
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': ['unhashable']}))
+        self.assertEqual(['always', 'always'], self.__invoked)
+
+    def test_routes_are_rebuilt_when_listeners_change(self):
+        listener = self.listener('acme')
+        self.__dispatcher.add_listener('order.*', listener, when={'tenant': 'acme'})
+        self.__dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'acme'}))
+
+        self.__dispatcher.add_listener('order.paid', self.listener('paid'), -10, when={'tenant': 'acme'})
+        self.__dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'acme'}))
+
+        self.__dispatcher.remove_listener('order.*', listener)
+        self.__dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'acme'}))
+        self.assertEqual(['acme', 'acme', 'paid', 'paid'], self.__invoked)
+
+    def test_conditional_listeners_can_be_removed_and_prioritized(self):
+        listener = self.listener('acme')
+        self.__dispatcher.add_listener('order', listener, 10, when={'tenant': 'acme'})
+
+        self.assertEqual([listener], self.__dispatcher.get_listeners('order'))
+        self.assertEqual(10, self.__dispatcher.get_listener_priority('order', listener))
+        self.__dispatcher.remove_listener('order', listener)
+        self.assertFalse(self.__dispatcher.has_listeners())
+
+    def test_conditional_listeners_with_middlewares(self):
+        self.__dispatcher.add_listener('order', self.listener('acme'), when={'tenant': 'acme'})
+        self.__dispatcher.use(lambda listener, name: lambda *args: self.__invoked.append('wrapped') or listener(*args),
+                              per_listener=True)
+
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'acme'}))
+        self.__dispatcher.dispatch('order', GenericEvent(None, {'tenant': 'initech'}))
+        self.assertEqual(['wrapped', 'acme'], self.__invoked)
+
+    def test_called_directly_the_listener_checks_its_conditions(self):
+        listener = ConditionalListener(self.listener('acme'), {'tenant': 'acme'})
+        listener(GenericEvent(None, {'tenant': 'initech'}), 'order', None)
+        listener(GenericEvent(None, {'tenant': 'acme'}), 'order', None)
+        self.assertEqual(['acme'], self.__invoked)
+
+    def test_router_keeps_a_bounded_number_of_routes(self):
+        acme = self.listener('acme')
+        router = ListenerRouter([ConditionalListener(acme, {'id': key}) for key in range(MAX_ROUTES + 1)])
+
+        route, listeners = router.route(GenericEvent(None, {'id': 0}))
+        self.assertEqual(frozenset([0]), route)
+        self.assertEqual([acme], listeners)
+        self.assertIs(listeners, router.route(GenericEvent(None, {'id': 0}))[1])
+
+        for key in range(MAX_ROUTES + 1):
+            router.route(GenericEvent(None, {'id': key}))
+        self.assertIsNot(listeners, router.route(GenericEvent(None, {'id': 0}))[1])
+
+    def test_events_matching_the_same_listeners_share_a_route(self):
+        always = self.listener('always')
+        acme = self.listener('acme')
+        request = self.listener('request')
+        router = ListenerRouter([
+            ConditionalListener(acme, {'tenant': 'acme'}),
+            always,
+            ConditionalListener(request, {'request_id': 1, 'tenant': {'acme', 'initech'}}),
+        ])
+
+        route, listeners = router.route(GenericEvent(None, {'tenant': 'acme', 'request_id': 2}))
+        self.assertEqual(frozenset([0]), route)
+        self.assertEqual([acme, always], listeners)
+        for request_id in range(3, 100):
+            self.assertIs(listeners, router.route(GenericEvent(None, {'tenant': 'acme', 'request_id': request_id}))[1])
+
+        self.assertEqual([acme, always, request],
+                         router.route(GenericEvent(None, {'tenant': 'acme', 'request_id': 1}))[1])
+        self.assertEqual([always, request], router.route(GenericEvent(None, {'tenant': 'initech', 'request_id': 1}))[1])
+        self.assertEqual([always], router.route(Event())[1])
+        self.assertEqual([always], router.route(GenericEvent(None, {'tenant': ['unhashable']}))[1])
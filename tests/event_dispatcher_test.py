@@ -1,5 +1,20 @@
+import gc
+import weakref
+from unittest import TestCase
 from tests.abstract_event_dispatcher_test import AbstractEventDispatcherTest
+from tests.abstract_event_dispatcher_test import TestEventSubscriber
+from tests.abstract_event_dispatcher_test import TestEventSubscriberWithMultipleListeners
+from tests.abstract_event_dispatcher_test import TestEventSubscriberWithPriorities
+from evee import AsyncEventDispatcher
+from evee import Event
+from evee import BadMethodCallError
 from evee import EventDispatcher
+from evee import GenericEvent
+from evee import GenericEventBatch
+from evee import QueuedEventDispatcher
+from evee import ThreadSafeEventDispatcher
+from evee.conditional_listener import MAX_ROUTES
+from evee.timer_wheel import TimerWheel
 
 
 class EventDispatcherTest(AbstractEventDispatcherTest):
@@ -45,6 +60,9 @@ class EventDispatcherTest(AbstractEventDispatcherTest):
     def test_add_subscriber_with_multiple_listeners(self):
         self._add_subscriber_with_multiple_listeners()
 
+    def test_add_subscribers(self):
+        self._add_subscribers()
+
     def test_remove_subscriber(self):
         self._remove_subscriber()
 
@@ -65,3 +83,526 @@ class EventDispatcherTest(AbstractEventDispatcherTest):
 
     def test_has_listeners_without_events_returns_false_after_has_listeners_with_event_has_been_called(self):
         self._has_listeners_without_events_returns_false_after_has_listeners_with_event_has_been_called()
+
+    def test_listeners_stay_sorted_on_add_and_remove(self):
+        self._listeners_stay_sorted_on_add_and_remove()
+
+    def test_remove_listener_during_dispatch(self):
+        self._remove_listener_during_dispatch()
+
+    def test_remove_listener_registered_many_times(self):
+        self._remove_listener_registered_many_times()
+
+    def test_wildcard_listeners_merge_by_priority(self):
+        self._wildcard_listeners_merge_by_priority()
+
+    def test_wildcard_listeners_invalidate_cached_resolution(self):
+        self._wildcard_listeners_invalidate_cached_resolution()
+
+
+class WeakEventDispatcherTest(EventDispatcherTest):
+    def create_event_dispatcher(self):
+        return EventDispatcher(weak=True)
+
+    def test_add_subscriber_with_priorities(self):
+        # The first subscriber is no longer referenced once the variable is reassigned
+        dispatcher = self.create_event_dispatcher()
+        event_subscriber = TestEventSubscriber()
+        dispatcher.add_subscriber(event_subscriber)
+
+        event_subscriber = TestEventSubscriberWithPriorities()
+        dispatcher.add_subscriber(event_subscriber)
+        gc.collect()
+
+        listeners = dispatcher.get_listeners('pre.foo')
+        self.assertEqual(1, len(listeners))
+        self.assertEqual(getattr(event_subscriber, 'pre_foo1'), listeners[0])
+
+    def test_collected_subscriber_is_pruned(self):
+        dispatcher = self.create_event_dispatcher()
+        subscriber = TestEventSubscriberWithMultipleListeners()
+        dispatcher.add_subscriber(subscriber)
+        dispatcher.add_listener('post.foo', subscriber.pre_foo1)
+        dispatcher.add_listener('order.*', subscriber.pre_foo2)
+        self.assertEqual(2, len(dispatcher.get_listeners('pre.foo')))
+        self.assertEqual(1, len(dispatcher.get_listeners('order.created')))
+
+        del subscriber
+        gc.collect()
+        self.assertFalse(dispatcher.has_listeners())
+        self.assertFalse(dispatcher.has_listeners('pre.foo'))
+        self.assertFalse(dispatcher.has_listeners('order.created'))
+
+    def test_collected_listener_keeps_the_other_listeners(self):
+        invoked = []
+        dispatcher = self.create_event_dispatcher()
+        kept = lambda event, name, dispatcher: invoked.append(name)
+        collected = lambda event, name, dispatcher: invoked.append('collected')
+        dispatcher.add_listener('pre.foo', collected, 10)
+        dispatcher.add_listener('pre.foo', kept)
+        dispatcher.add_listener('pre.foo', collected, -10)
+
+        del collected
+        gc.collect()
+        dispatcher.dispatch('pre.foo')
+        self.assertListEqual(['pre.foo'], invoked)
+        self.assertListEqual([kept], dispatcher.get_listeners('pre.foo'))
+
+    def test_strong_dispatcher_keeps_listeners_alive(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: None)
+        gc.collect()
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+
+
+class SubscriberSpecsTest(TestCase):
+    def test_subscriber_specs_are_normalized_and_cached_per_class(self):
+        specs = EventDispatcher._get_subscriber_specs(TestEventSubscriberWithMultipleListeners())
+        self.assertEqual((('pre.foo', 'pre_foo1', 0, {}), ('pre.foo', 'pre_foo2', 10, {})), specs)
+        self.assertIs(specs, EventDispatcher._get_subscriber_specs(TestEventSubscriberWithMultipleListeners))
+        self.assertEqual((('pre.foo', 'pre_foo1', 10, {}), ('post.foo', 'pre_foo2', 0, {})),
+                         EventDispatcher._get_subscriber_specs(TestEventSubscriberWithPriorities))
+
+
+class StreamEvent(Event):
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+class DispatchStreamTest(TestCase):
+    def test_dispatch_stream_is_lazy(self):
+        pulled = []
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: setattr(event, 'value', event.value * 2))
+
+        def events():
+            for value in range(5):
+                pulled.append(value)
+                yield StreamEvent(value)
+
+        stream = dispatcher.dispatch_stream('pre.foo', events(), chunk_size=2)
+        self.assertEqual([], pulled)
+        self.assertEqual(0, next(stream).value)
+        self.assertEqual([0, 1], pulled)
+        self.assertEqual([2, 4, 6, 8], [event.value for event in stream])
+
+    def test_dispatch_stream_without_listeners(self):
+        dispatcher = EventDispatcher()
+        events = [StreamEvent(value) for value in range(3)]
+        self.assertEqual(events, list(dispatcher.dispatch_stream('pre.foo', events)))
+
+    def test_dispatch_stream_can_be_chained(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('parsed', lambda event, name, dispatcher: setattr(event, 'value', event.value + 1))
+        dispatcher.add_listener('priced', lambda event, name, dispatcher: setattr(event, 'value', event.value * 10))
+
+        events = (StreamEvent(value) for value in range(3))
+        stream = dispatcher.dispatch_stream('priced', dispatcher.dispatch_stream('parsed', events), chunk_size=2)
+        self.assertEqual([10, 20, 30], [event.value for event in stream])
+
+    def test_dispatch_stream_does_not_hold_earlier_events(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: None)
+        references = []
+
+        stream = dispatcher.dispatch_stream('pre.foo', (StreamEvent(value) for value in range(10)), chunk_size=4)
+        for event in stream:
+            references.append(weakref.ref(event))
+            del event
+            gc.collect()
+            # Only the event being yielded is still referenced by the generator
+            self.assertEqual([None] * (len(references) - 1), [reference() for reference in references[:-1]])
+
+    def test_dispatch_stream_rejects_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            next(EventDispatcher().dispatch_stream('pre.foo', [], chunk_size=0))
+
+
+class MiddlewareTest(TestCase):
+    def test_dispatch_middlewares_wrap_the_dispatch(self):
+        invoked = []
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append('listener'))
+
+        def middleware(label):
+            def wrap(handler):
+                def dispatch(listeners, event_name, event):
+                    invoked.append(label + '.before')
+                    handler(listeners, event_name, event)
+                    invoked.append(label + '.after')
+                return dispatch
+            return wrap
+
+        dispatcher.use(middleware('outer'))
+        dispatcher.use(middleware('inner'))
+        dispatcher.dispatch('pre.foo')
+
+        self.assertEqual(['outer.before', 'inner.before', 'listener', 'inner.after', 'outer.after'], invoked)
+
+    def test_dispatch_middlewares_run_without_listeners(self):
+        names = []
+        dispatcher = EventDispatcher()
+        dispatcher.use(lambda handler: lambda listeners, event_name, event: names.append(event_name))
+
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(['pre.foo'], names)
+
+    def test_listener_middlewares_wrap_every_listener(self):
+        invoked = []
+        dispatcher = EventDispatcher()
+        listener1 = lambda event, name, dispatcher: invoked.append('1')
+        listener2 = lambda event, name, dispatcher: invoked.append('2')
+        dispatcher.add_listener('pre.foo', listener1, 10)
+        dispatcher.add_listener('pre.foo', listener2)
+
+        def capture_errors(listener, event_name):
+            def call(event, name, dispatcher):
+                invoked.append(event_name)
+                return listener(event, name, dispatcher)
+            return call
+
+        dispatcher.use(capture_errors, per_listener=True)
+        dispatcher.dispatch('pre.foo')
+
+        self.assertEqual(['pre.foo', '1', 'pre.foo', '2'], invoked)
+        self.assertEqual([listener1, listener2], dispatcher.get_listeners('pre.foo'))
+
+    def test_chain_is_composed_when_listeners_change(self):
+        compositions = []
+        invoked = []
+        dispatcher = EventDispatcher()
+
+        def count_compositions(listener, event_name):
+            compositions.append(listener)
+            return listener
+
+        dispatcher.use(count_compositions, per_listener=True)
+        listener1 = lambda event, name, dispatcher: invoked.append('1')
+        listener2 = lambda event, name, dispatcher: invoked.append('2')
+        dispatcher.add_listener('pre.*', listener1)
+
+        dispatcher.dispatch('pre.foo')
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual([listener1], compositions)
+
+        dispatcher.add_listener('pre.foo', listener2, 10)
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual([listener1, listener2, listener1], compositions)
+        self.assertEqual(['1', '1', '2', '1'], invoked)
+
+        dispatcher.remove_middleware(count_compositions)
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(3, len(compositions))
+
+    def test_middlewares_apply_to_dispatch_stream(self):
+        dispatcher = EventDispatcher()
+        dispatcher.use(lambda handler: lambda listeners, event_name, event: event.stop_propagation())
+
+        events = list(dispatcher.dispatch_stream('pre.foo', [Event(), Event()]))
+        self.assertTrue(all(event.is_propagation_stopped() for event in events))
+
+    def test_batches_are_rejected_while_middlewares_are_set(self):
+        dispatcher = EventDispatcher()
+        middleware = lambda handler: handler
+        dispatcher.use(middleware)
+        self.assertEqual([middleware], dispatcher.get_middlewares())
+        with self.assertRaises(BadMethodCallError):
+            dispatcher.dispatch_batch('pre.foo', GenericEventBatch(None, {'id': [1]}))
+
+        dispatcher.remove_middleware(middleware)
+        self.assertEqual([], dispatcher.get_middlewares())
+        self.assertEqual(1, len(dispatcher.dispatch_batch('pre.foo', GenericEventBatch(None, {'id': [1]}))))
+
+
+class ListenerCountTest(TestCase):
+    def test_has_listeners_does_not_build_listener_lists(self):
+        dispatcher = EventDispatcher()
+        dispatcher.get_listeners = None
+        self.assertFalse(dispatcher.has_listeners())
+        self.assertFalse(dispatcher.has_listeners('pre.foo'))
+
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: None)
+        self.assertTrue(dispatcher.has_listeners())
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+        self.assertFalse(dispatcher.has_listeners('post.foo'))
+
+    def test_has_listeners_with_patterns(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.*', lambda event, name, dispatcher: None)
+
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+        self.assertTrue(dispatcher.has_listeners('pre.*'))
+        self.assertFalse(dispatcher.has_listeners('pre.foo.bar'))
+        self.assertFalse(dispatcher.has_listeners('post.*'))
+
+    def test_listener_counts(self):
+        dispatcher = EventDispatcher()
+        listener = lambda event, name, dispatcher: None
+        dispatcher.add_listener('pre.foo', listener)
+        dispatcher.add_listener('pre.*', listener)
+        dispatcher.add_subscribers([TestEventSubscriberWithMultipleListeners(), TestEventSubscriber()])
+
+        self.assertEqual(6, dispatcher.get_listener_count())
+        self.assertEqual(5, dispatcher.get_listener_count('pre.foo'))
+        self.assertEqual(1, dispatcher.get_listener_count('post.foo'))
+
+        dispatcher.remove_listener('pre.*', listener)
+        dispatcher.remove_listener('pre.foo', listener)
+        self.assertEqual(4, dispatcher.get_listener_count())
+
+    def test_listener_count_after_listeners_are_collected(self):
+        dispatcher = EventDispatcher(weak=True)
+        subscriber = TestEventSubscriberWithMultipleListeners()
+        dispatcher.add_subscriber(subscriber)
+        self.assertEqual(2, dispatcher.get_listener_count())
+
+        del subscriber
+        gc.collect()
+        self.assertEqual(0, dispatcher.get_listener_count())
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_get_listeners_view_is_cached_until_the_version_changes(self):
+        dispatcher = EventDispatcher()
+        listener = lambda event, name, dispatcher: None
+        dispatcher.add_listener('pre.foo', listener)
+        version = dispatcher.get_version()
+
+        view = dispatcher.get_listeners()
+        self.assertIs(view, dispatcher.get_listeners())
+        with self.assertRaises(TypeError):
+            view['post.foo'] = [listener]
+
+        dispatcher.add_listener('post.foo', listener)
+        self.assertGreater(dispatcher.get_version(), version)
+        self.assertIsNot(view, dispatcher.get_listeners())
+        self.assertEqual({'pre.foo': [listener], 'post.foo': [listener]}, dispatcher.get_listeners())
+        self.assertEqual({'pre.foo': [listener]}, view)
+
+    def test_listener_lists_are_rebuilt_on_read_and_never_mutated(self):
+        dispatcher = EventDispatcher()
+        listeners = [lambda event, name, dispatcher: None for _ in range(4)]
+        for priority, listener in enumerate(listeners):
+            dispatcher.add_listener('pre.foo', listener, priority % 2)
+
+        sorted_listeners = dispatcher.get_listeners('pre.foo')
+        self.assertIs(sorted_listeners, dispatcher.get_listeners('pre.foo'))
+        self.assertListEqual([listeners[1], listeners[3], listeners[0], listeners[2]], sorted_listeners)
+
+        dispatcher.remove_listener('pre.foo', listeners[3])
+        dispatcher.remove_listener('pre.foo', listeners[1])
+        dispatcher.add_listener('pre.foo', listeners[1], 1)
+        self.assertListEqual([listeners[1], listeners[3], listeners[0], listeners[2]], sorted_listeners)
+        self.assertListEqual([listeners[1], listeners[0], listeners[2]], dispatcher.get_listeners('pre.foo'))
+
+    def test_resolved_event_names_are_bounded(self):
+        dispatcher = EventDispatcher()
+        listener = lambda event, name, dispatcher: None
+        dispatcher.add_listener('order.*.created', listener)
+        dispatcher.add_listener('order.**', listener)
+
+        listeners = dispatcher.get_listeners('order.0.created')
+        self.assertIs(listeners, dispatcher.get_listeners('order.0.created'))
+        for key in range(MAX_ROUTES + 1):
+            self.assertTrue(dispatcher.has_listeners('order.{}.created'.format(key)))
+
+        self.assertIsNot(listeners, dispatcher.get_listeners('order.0.created'))
+        self.assertListEqual([listener, listener], dispatcher.get_listeners('order.0.created'))
+
+    def test_unhashable_listeners_are_indexed_by_identity(self):
+        dispatcher = EventDispatcher()
+        listener_1 = CallableRecord()
+        listener_2 = CallableRecord()
+        dispatcher.add_listener('pre.foo', listener_1, 10)
+        dispatcher.add_listener('pre.foo', listener_2)
+        dispatcher.dispatch('pre.foo')
+
+        self.assertEqual(listener_1, listener_2)
+        self.assertListEqual(['pre.foo'], listener_1.calls)
+        self.assertEqual(10, dispatcher.get_listener_priority('pre.foo', listener_1))
+        self.assertEqual(0, dispatcher.get_listener_priority('pre.foo', listener_2))
+
+        dispatcher.remove_listener('pre.foo', listener_1)
+        self.assertEqual(1, dispatcher.get_listener_count('pre.foo'))
+        self.assertIs(listener_2, dispatcher.get_listeners('pre.foo')[0])
+
+
+class CallableRecord(object):
+    """
+    Equal to every other record, and unhashable like a dataclass with eq=True.
+    """
+    __hash__ = None
+
+    def __init__(self):
+        self.calls = []
+
+    def __eq__(self, other):
+        return isinstance(other, CallableRecord)
+
+    def __call__(self, event, event_name, dispatcher):
+        self.calls.append(event_name)
+
+
+class SharedEventTest(TestCase):
+    def test_dispatches_without_event_reuse_the_shared_event(self):
+        dispatcher = EventDispatcher(shared_event=True)
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: event.stop_propagation())
+
+        event = dispatcher.dispatch('pre.foo')
+        self.assertTrue(event.is_propagation_stopped())
+        self.assertIs(event, dispatcher.dispatch('post.foo'))
+        self.assertFalse(event.is_propagation_stopped())
+
+        own_event = Event()
+        self.assertIs(own_event, dispatcher.dispatch('pre.foo', own_event))
+
+    def test_nested_dispatches_get_a_new_event(self):
+        events = []
+        dispatcher = EventDispatcher(shared_event=True)
+        dispatcher.add_listener('pre.foo', lambda event, name, inner: events.append(inner.dispatch('post.foo')))
+
+        event = dispatcher.dispatch('pre.foo')
+        self.assertIsNot(event, events[0])
+        self.assertIs(event, dispatcher.dispatch('pre.foo'))
+
+    def test_shared_event_is_kept_when_a_listener_fails(self):
+        dispatcher = EventDispatcher(shared_event=True)
+        event = dispatcher.dispatch('pre.foo')
+
+        def fail(event, name, dispatcher):
+            raise RuntimeError()
+
+        dispatcher.add_listener('pre.foo', fail)
+        with self.assertRaises(RuntimeError):
+            dispatcher.dispatch('pre.foo')
+        self.assertIs(event, dispatcher.dispatch('post.foo'))
+
+    def test_events_are_created_per_dispatch_by_default(self):
+        dispatcher = EventDispatcher()
+        self.assertIsNot(dispatcher.dispatch('pre.foo'), dispatcher.dispatch('pre.foo'))
+
+    def test_empty_events_are_not_replaced(self):
+        for dispatcher in [EventDispatcher(), EventDispatcher(shared_event=True)]:
+            event = GenericEvent()
+            self.assertIs(event, dispatcher.dispatch('pre.foo', event))
+
+
+class ChildEventDispatcherTest(TestCase):
+    def setUp(self):
+        self.__parent = EventDispatcher()
+        self.__invoked = []
+
+    def listener(self, label):
+        return lambda event, name, dispatcher: self.__invoked.append(label)
+
+    def test_child_listeners_are_merged_by_priority_with_the_parent(self):
+        parent_high = self.listener('parent.high')
+        parent_low = self.listener('parent.low')
+        child_same = self.listener('child.same')
+        child_pattern = self.listener('child.pattern')
+        self.__parent.add_listener('pre.foo', parent_high, 10)
+        self.__parent.add_listener('pre.foo', parent_low, -10)
+
+        child = self.__parent.child()
+        self.assertIs(self.__parent, child.get_parent())
+        child.add_listener('pre.foo', child_same, 10)
+        child.add_listener('pre.*', child_pattern)
+
+        child.dispatch('pre.foo')
+        self.assertEqual(['parent.high', 'child.same', 'child.pattern', 'parent.low'], self.__invoked)
+        self.assertEqual([parent_high, child_same, child_pattern, parent_low], child.get_listeners('pre.foo'))
+        self.assertEqual([parent_high, parent_low], self.__parent.get_listeners('pre.foo'))
+        self.assertEqual(10, child.get_listener_priority('pre.foo', parent_high))
+        self.assertEqual(0, child.get_listener_priority('pre.*', child_pattern))
+
+    def test_merged_listeners_are_cached_until_the_parent_or_child_changes(self):
+        child = self.__parent.child()
+        self.__parent.add_listener('pre.foo', self.listener('parent'))
+        listeners = child.get_listeners('pre.foo')
+        self.assertIs(listeners, child.get_listeners('pre.foo'))
+
+        late = self.listener('late')
+        self.__parent.add_listener('pre.foo', late, 5)
+        self.assertEqual(late, child.get_listeners('pre.foo')[0])
+
+        own = self.listener('own')
+        child.add_listener('pre.foo', own, 10)
+        self.assertEqual([own, late], child.get_listeners('pre.foo')[:2])
+
+        self.__parent.remove_listener('pre.foo', late)
+        self.assertEqual(2, len(child.get_listeners('pre.foo')))
+
+    def test_children_without_own_listeners_share_the_listeners_of_the_parent(self):
+        self.__parent.add_listener('pre.foo', self.listener('parent'))
+        prioritized = self.__parent._get_prioritized('pre.foo')
+        self.assertIs(prioritized, self.__parent._get_prioritized('pre.foo'))
+        self.assertIs(prioritized, self.__parent.child()._get_prioritized('pre.foo'))
+        self.assertIs(prioritized, self.__parent.child()._get_prioritized('pre.foo'))
+
+        child = self.__parent.child()
+        child.add_listener('pre.foo', self.listener('child'))
+        self.assertEqual(2, len(child._get_prioritized('pre.foo')))
+        self.assertIs(prioritized, self.__parent._get_prioritized('pre.foo'))
+
+        self.__parent.add_listener('pre.foo', self.listener('late'))
+        self.assertIsNot(prioritized, self.__parent._get_prioritized('pre.foo'))
+        self.assertEqual(3, len(child._get_prioritized('pre.foo')))
+
+    def test_grandchildren_inherit_every_ancestor(self):
+        self.__parent.add_listener('pre.foo', self.listener('parent'))
+        child = self.__parent.child()
+        child.add_listener('pre.foo', self.listener('child'))
+        grandchild = child.child()
+        grandchild.add_listener('pre.foo', self.listener('grandchild'), 1)
+
+        grandchild.dispatch('pre.foo')
+        self.assertEqual(['grandchild', 'parent', 'child'], self.__invoked)
+
+        self.__parent.add_listener('pre.foo', self.listener('parent.high'), 5)
+        self.__invoked = []
+        grandchild.dispatch('pre.foo')
+        self.assertEqual(['parent.high', 'grandchild', 'parent', 'child'], self.__invoked)
+
+    def test_child_counts_and_views(self):
+        listener = self.listener('parent')
+        self.__parent.add_listener('pre.foo', listener)
+        child = self.__parent.child()
+
+        self.assertTrue(child.has_listeners())
+        self.assertTrue(child.has_listeners('pre.foo'))
+        self.assertFalse(child.has_listeners('post.foo'))
+        self.assertEqual({'pre.foo': [listener]}, child.get_listeners())
+
+        child.add_listener('post.foo', listener)
+        self.assertEqual(2, child.get_listener_count())
+        self.assertEqual({'pre.foo': [listener], 'post.foo': [listener]}, child.get_listeners())
+        self.assertFalse(self.__parent.has_listeners('post.foo'))
+
+        child.remove_listener('pre.foo', listener)
+        self.assertTrue(child.has_listeners('pre.foo'))
+
+    def test_children_keep_the_settings_of_their_parent(self):
+        queued = QueuedEventDispatcher(max_size=2, max_delay=5, weak=True).child()
+        self.assertEqual({'max_size': 2, 'max_delay': 5, 'weak': True}, queued._get_options())
+        concurrent = AsyncEventDispatcher(concurrent=True, workers=3, max_queue_size=0, overflow='reject').child()
+        self.assertTrue(concurrent.is_concurrent())
+        self.assertEqual(3, concurrent._get_options()['workers'])
+
+        shared = EventDispatcher(shared_event=True).child()
+        self.assertIs(shared.dispatch('pre.foo'), shared.dispatch('pre.foo'))
+
+    def test_child_dispatches_run_the_timers_of_the_parent(self):
+        now = [0.0]
+        self.__parent.set_timer_wheel(TimerWheel(clock=lambda: now[0]))
+        self.__parent.add_listener('pre.foo', self.listener('debounced'), debounce=1)
+        child = self.__parent.child()
+
+        child.dispatch('pre.foo')
+        now[0] = 2.0
+        child.dispatch('post.foo')
+        self.assertEqual(['debounced'], self.__invoked)
+        self.assertEqual(0, child.advance_timers())
+
+    def test_thread_safe_dispatcher_has_no_children(self):
+        with self.assertRaises(BadMethodCallError):
+            ThreadSafeEventDispatcher().child()
@@ -0,0 +1,44 @@
+from unittest import TestCase
+from evee.event_name_trie import EventNameTrie
+
+
+class EventNameTrieTest(TestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__trie = None
+
+    def setUp(self):
+        self.__trie = EventNameTrie()
+        self.__trie.add('order.*')
+        self.__trie.add('order.**')
+        self.__trie.add('*.created')
+        self.__trie.add('order.created')
+
+    def test_is_pattern(self):
+        self.assertTrue(EventNameTrie.is_pattern('order.*'))
+        self.assertTrue(EventNameTrie.is_pattern('**.created'))
+        self.assertFalse(EventNameTrie.is_pattern('order.created'))
+        self.assertFalse(EventNameTrie.is_pattern('order.created*'))
+
+    def test_match_single_segment(self):
+        self.assertCountEqual(['order.*', 'order.**', '*.created', 'order.created'],
+                              self.__trie.match('order.created'))
+        self.assertCountEqual(['*.created'], self.__trie.match('user.created'))
+        self.assertCountEqual([], self.__trie.match('order'))
+
+    def test_match_many_segments(self):
+        self.assertCountEqual(['order.**'], self.__trie.match('order.item.added'))
+
+    def test_matches(self):
+        self.assertTrue(EventNameTrie.matches('order.**', 'order.item.added'))
+        self.assertTrue(EventNameTrie.matches('**.added', 'order.item.added'))
+        self.assertFalse(EventNameTrie.matches('order.*', 'order.item.added'))
+
+    def test_remove(self):
+        self.assertEqual(4, len(self.__trie))
+        self.__trie.remove('order.**')
+        self.__trie.remove('order.**')
+        self.__trie.remove('does.not.exist')
+        self.assertEqual(3, len(self.__trie))
+        self.assertCountEqual([], self.__trie.match('order.item.added'))
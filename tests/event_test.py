@@ -0,0 +1,28 @@
+import weakref
+from unittest import TestCase
+from evee import Event
+
+
+class EventTest(TestCase):
+    def test_stop_propagation(self):
+        event = Event()
+        self.assertFalse(event.is_propagation_stopped())
+        event.stop_propagation()
+        self.assertTrue(event.is_propagation_stopped())
+
+    def test_attributes_cannot_be_added(self):
+        with self.assertRaises(AttributeError):
+            Event().foo = 1
+
+    def test_events_cannot_be_weakly_referenced(self):
+        with self.assertRaises(TypeError):
+            weakref.ref(Event())
+
+    def test_subclasses_without_slots_keep_their_attributes(self):
+        class OrderEvent(Event):
+            pass
+
+        event = OrderEvent()
+        event.foo = 1
+        self.assertEqual(1, event.foo)
+        self.assertIsNotNone(weakref.ref(event)())
@@ -0,0 +1,130 @@
+from unittest import TestCase
+from unittest.mock import Mock
+from evee import BadMethodCallError
+from evee import Event
+from evee import EventDispatcher
+from evee import FrozenEventDispatcher
+from evee import GenericEvent
+from evee import ImmutableEventDispatcher
+
+
+class FrozenEventDispatcherTest(TestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__dispatcher = None
+        self.__inner_dispatcher = None
+        self.__invoked = None
+
+    def setUp(self):
+        self.__invoked = []
+        self.__inner_dispatcher = EventDispatcher()
+        self.__inner_dispatcher.add_listener('pre.foo', self.listener('1'), -10)
+        self.__inner_dispatcher.add_listener('pre.foo', self.listener('2'), 10)
+        self.__inner_dispatcher.add_listener('order.*', self.listener('3'))
+        self.__inner_dispatcher.add_listener('order.created', self.listener('4'), 5)
+        self.__dispatcher = ImmutableEventDispatcher(self.__inner_dispatcher).freeze()
+
+    def listener(self, name):
+        return lambda event, event_name, dispatcher: self.__invoked.append(name)
+
+    def test_dispatch(self):
+        event = Event()
+        self.assertEqual(event, self.__dispatcher.dispatch('pre.foo', event))
+        self.__dispatcher.dispatch('order.created')
+        self.__dispatcher.dispatch('order.updated')
+        self.assertIsInstance(self.__dispatcher.dispatch('noevent'), Event)
+        self.assertListEqual(['2', '1', '4', '3', '3'], self.__invoked)
+
+    def test_stop_event_propagation(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: event.stop_propagation(), 10)
+        dispatcher.add_listener('pre.foo', self.listener('1'))
+        FrozenEventDispatcher(dispatcher).dispatch('pre.foo')
+        self.assertListEqual([], self.__invoked)
+
+    def test_is_a_snapshot(self):
+        self.__inner_dispatcher.add_listener('pre.foo', self.listener('5'))
+        self.assertEqual(2, len(self.__dispatcher.get_listeners('pre.foo')))
+
+    def test_get_listeners(self):
+        self.assertIsInstance(self.__dispatcher.get_listeners('pre.foo'), tuple)
+        self.assertEqual(2, len(self.__dispatcher.get_listeners('order.created')))
+        self.assertEqual(1, len(self.__dispatcher.get_listeners('order.updated')))
+        self.assertEqual((), self.__dispatcher.get_listeners('noevent'))
+        self.assertEqual(['pre.foo', 'order.*', 'order.created'], list(self.__dispatcher.get_listeners().keys()))
+
+    def test_get_listener_priority(self):
+        listener = self.__inner_dispatcher.get_listeners('pre.foo')[0]
+        self.assertEqual(10, self.__dispatcher.get_listener_priority('pre.foo', listener))
+        self.assertIsNone(self.__dispatcher.get_listener_priority('post.foo', listener))
+
+    def test_has_listeners(self):
+        self.assertTrue(self.__dispatcher.has_listeners())
+        self.assertTrue(self.__dispatcher.has_listeners('pre.foo'))
+        self.assertTrue(self.__dispatcher.has_listeners('order.updated'))
+        self.assertFalse(self.__dispatcher.has_listeners('post.foo'))
+        self.assertFalse(FrozenEventDispatcher(EventDispatcher()).has_listeners())
+
+    def test_is_hashable(self):
+        same = FrozenEventDispatcher(self.__inner_dispatcher)
+        self.assertEqual(self.__dispatcher, same)
+        self.assertEqual(hash(self.__dispatcher), hash(same))
+        self.assertNotEqual(self.__dispatcher, FrozenEventDispatcher(EventDispatcher()))
+
+    def test_modification_disallowed(self):
+        with self.assertRaises(BadMethodCallError):
+            self.__dispatcher.add_listener('event', self.listener('1'))
+        with self.assertRaises(BadMethodCallError):
+            self.__dispatcher.add_subscriber(Mock())
+        with self.assertRaises(BadMethodCallError):
+            self.__dispatcher.remove_listener('event', self.listener('1'))
+        with self.assertRaises(BadMethodCallError):
+            self.__dispatcher.remove_subscriber(Mock())
+        with self.assertRaises(BadMethodCallError):
+            self.__dispatcher._FrozenEventDispatcher__listeners = {}
+
+    def test_patterns_are_merged_in_registration_order(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('b.*', self.listener('1'))
+        dispatcher.add_listener('*.x', self.listener('2'))
+        dispatcher.add_listener('b.*', self.listener('3'), 10)
+        repeated = self.listener('4')
+        dispatcher.add_listener('*.x', repeated, 20)
+        dispatcher.add_listener('*.x', repeated, -20)
+
+        frozen = FrozenEventDispatcher(dispatcher)
+        self.assertEqual(tuple(dispatcher.get_listeners('b.x')), frozen.get_listeners('b.x'))
+        frozen.dispatch('b.x')
+        self.assertListEqual(['4', '3', '1', '2', '4'], self.__invoked)
+        self.assertEqual(20, frozen.get_listener_priority('*.x', repeated))
+
+    def test_offloaded_listeners_are_submitted_to_the_copied_dispatcher(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener('1'), executor='thread')
+        FrozenEventDispatcher(dispatcher).dispatch('pre.foo')
+        dispatcher.join()
+        self.assertListEqual(['1'], self.__invoked)
+
+    def test_empty_events_are_not_replaced(self):
+        event = GenericEvent()
+        self.assertIs(event, self.__dispatcher.dispatch('pre.foo', event))
+
+    def test_dispatchers_depending_on_dispatch_time_features_cannot_be_frozen(self):
+        middleware = lambda listeners, name: listeners
+        dispatcher = EventDispatcher()
+        dispatcher.use(middleware)
+        with self.assertRaises(BadMethodCallError):
+            FrozenEventDispatcher(dispatcher)
+        dispatcher.remove_middleware(middleware)
+
+        for options in [{'throttle': 1}, {'debounce': 1}, {'ttl': 60}]:
+            listener = self.listener('timed')
+            dispatcher.add_listener('pre.foo', listener, **options)
+            with self.assertRaises(BadMethodCallError):
+                ImmutableEventDispatcher(dispatcher).freeze()
+            with self.assertRaises(BadMethodCallError):
+                FrozenEventDispatcher(dispatcher.child())
+
+            dispatcher.remove_listener('pre.foo', listener)
+            self.assertEqual({}, FrozenEventDispatcher(dispatcher).get_listeners())
@@ -0,0 +1,128 @@
+from unittest import TestCase
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee import GenericEventBatch
+from evee import batch_listener
+
+
+class GenericEventBatchTest(TestCase):
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__batch = None
+        self.__subject = None
+
+    def setUp(self):
+        self.__subject = object()  # type: object
+        self.__batch = GenericEventBatch(self.__subject, {'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+
+    def tearDown(self):
+        self.__subject = None
+        self.__batch = None
+
+    def test_construct(self):
+        self.assertEqual(3, len(self.__batch))
+        self.assertEqual(self.__subject, self.__batch.get_subject())
+        self.assertListEqual([True, True, True], list(self.__batch.get_mask()))
+
+    def test_construct_with_uneven_columns(self):
+        with self.assertRaises(ValueError):
+            GenericEventBatch(None, {'id': [1, 2], 'name': ['a']})
+
+    def test_from_events(self):
+        batch = GenericEventBatch.from_events([GenericEvent(None, {'id': 1}), GenericEvent(None, {'name': 'b'})])
+        self.assertEqual({'id': [1, None], 'name': [None, 'b']}, batch.get_columns())
+
+    def test_get_column(self):
+        self.assertListEqual([1, 2, 3], self.__batch.get_column('id'))
+        with self.assertRaises(KeyError):
+            self.__batch.get_column('does not exist')
+
+    def test_rows(self):
+        self.assertEqual({'id': 2, 'name': 'b'}, self.__batch.get_row(1))
+        self.__batch.set_row(1, {'name': 'x', 'flag': True})
+        self.assertEqual({'id': 2, 'name': 'x', 'flag': True}, self.__batch.get_row(1))
+        self.assertListEqual([None, True, None], self.__batch.get_column('flag'))
+
+    def test_filter_and_stop_propagation(self):
+        self.__batch.filter([True, False, True])
+        self.assertListEqual([0, 2], self.__batch.get_active_rows())
+        self.__batch.stop_propagation(0)
+        self.assertTrue(self.__batch.is_propagation_stopped(0))
+        self.assertFalse(self.__batch.is_propagation_stopped())
+        self.__batch.stop_propagation()
+        self.assertTrue(self.__batch.is_propagation_stopped())
+
+    def test_dispatch_batch_calls_batch_listeners_once(self):
+        calls = []
+
+        @batch_listener
+        def listener(batch, name, dispatcher):
+            calls.append(len(batch))
+            batch.set_column('id', [value * 10 for value in batch.get_column('id')])
+            batch.filter([value != 20 for value in batch.get_column('id')])
+
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', listener)
+        self.assertEqual(self.__batch, dispatcher.dispatch_batch('pre.foo', self.__batch))
+        self.assertListEqual([3], calls)
+        self.assertListEqual([10, 20, 30], self.__batch.get_column('id'))
+        self.assertListEqual([0, 2], self.__batch.get_active_rows())
+
+    def test_dispatch_batch_loops_rows_for_other_listeners(self):
+        invoked = []
+
+        def stop_second(event, name, dispatcher):
+            event['seen'] = True
+            if event['id'] == 2:
+                event.stop_propagation()
+
+        def record(event, name, dispatcher):
+            invoked.append(event['name'])
+
+        @batch_listener
+        def count(batch, name, dispatcher):
+            invoked.append(len(batch.get_active_rows()))
+
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', stop_second, 10)
+        dispatcher.add_listener('pre.foo', count, 5)
+        dispatcher.add_listener('pre.foo', record)
+        dispatcher.dispatch_batch('pre.foo', self.__batch)
+        self.assertListEqual([2, 'a', 'c'], invoked)
+        self.assertListEqual([True, True, True], self.__batch.get_column('seen'))
+
+    def test_dispatch_batch_stops_when_every_row_is_stopped(self):
+        invoked = []
+
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: event.stop_propagation(), 10)
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(event))
+        dispatcher.dispatch_batch('pre.foo', self.__batch)
+        self.assertTrue(self.__batch.is_propagation_stopped())
+        self.assertListEqual([], invoked)
+
+    def test_wrapped_batch_listeners_are_called_once(self):
+        calls = []
+
+        @batch_listener
+        def listener(batch, name, dispatcher):
+            calls.append(batch.get_active_rows())
+
+        dispatcher = EventDispatcher(weak=True)
+        dispatcher.add_listener('pre.foo', listener, once=True)
+        dispatcher.add_listener('pre.foo', lambda: listener, -10, lazy=True)
+        dispatcher.add_listener('pre.foo', listener, when={'name': {'a', 'c'}})
+        dispatcher.dispatch_batch('pre.foo', self.__batch)
+        self.assertListEqual([[0, 1, 2], [0, 2], [0, 1, 2]], calls)
+        self.assertListEqual([0, 1, 2], self.__batch.get_active_rows())
+
+    def test_conditional_batch_listeners_only_stop_matching_rows(self):
+        @batch_listener
+        def stop(batch, name, dispatcher):
+            batch.stop_propagation(batch.get_active_rows()[0])
+
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', stop, when={'name': 'b'})
+        dispatcher.add_listener('pre.foo', stop, when={'name': 'd'})
+        dispatcher.dispatch_batch('pre.foo', self.__batch)
+        self.assertListEqual([0, 2], self.__batch.get_active_rows())
@@ -78,3 +78,33 @@ class GenericEventTest(TestCase):
     def test_len(self):
         event = GenericEvent(self.__subject, {'name': 'Event'})
         self.assertEqual(1, len(event))
+
+    def test_attributes_cannot_be_added(self):
+        with self.assertRaises(AttributeError):
+            self.__event.foo = 1
+
+    def test_acquire_reuses_released_events(self):
+        event = GenericEvent.acquire(self.__subject, name='Event')
+        self.assertEqual({'name': 'Event'}, event.get_arguments())
+        self.assertIs(self.__subject, event.get_subject())
+
+        event.stop_propagation()
+        event.release()
+        event.release()
+
+        reused = GenericEvent.acquire(id=1)
+        self.assertIs(event, reused)
+        self.assertFalse(reused.is_propagation_stopped())
+        self.assertIsNone(reused.get_subject())
+        self.assertEqual({'id': 1}, reused.get_arguments())
+        self.assertIsNot(reused, GenericEvent.acquire())
+
+    def test_acquire_uses_a_pool_per_class(self):
+        class OrderEvent(GenericEvent):
+            __slots__ = ()
+
+        event = OrderEvent.acquire()
+        event.release()
+
+        self.assertIsNot(event, GenericEvent.acquire())
+        self.assertIs(event, OrderEvent.acquire())
@@ -0,0 +1,89 @@
+from unittest import TestCase
+from evee import EventDispatcher
+from evee import LogicError
+from evee.lazy_listener import LazyListener
+from evee.lazy_listener import import_reference
+from tests.lazy_subscriber import LazySubscriber
+from tests.lazy_subscriber import built
+from tests.lazy_subscriber import invoked
+from tests.lazy_subscriber import lazy_function
+
+
+class LazyListenerTest(TestCase):
+
+    def setUp(self):
+        del invoked[:]
+        del built[:]
+
+    def test_import_reference(self):
+        self.assertEqual(lazy_function, import_reference('tests.lazy_subscriber:lazy_function'))
+        self.assertEqual(LazySubscriber.static_foo, import_reference('tests.lazy_subscriber:LazySubscriber.static_foo'))
+        method = import_reference('tests.lazy_subscriber:LazySubscriber.pre_foo')
+        self.assertIsInstance(method.__self__, LazySubscriber)
+
+    def test_invalid_reference(self):
+        with self.assertRaises(LogicError):
+            LazyListener('tests.lazy_subscriber.lazy_function')
+
+    def test_lazy_listener_is_resolved_once(self):
+        factory_calls = []
+
+        def factory():
+            factory_calls.append(True)
+            return lazy_function
+
+        listener = LazyListener(factory)
+        self.assertFalse(listener.is_resolved())
+        listener(None, 'pre.foo', None)
+        listener(None, 'pre.foo', None)
+        self.assertTrue(listener.is_resolved())
+        self.assertEqual(1, len(factory_calls))
+        self.assertEqual(2, len(invoked))
+
+    def test_add_listener_with_import_path(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', 'tests.lazy_subscriber:lazy_function', 10)
+        listener = dispatcher.get_listeners('pre.foo')[0]
+        self.assertFalse(listener.is_resolved())
+        self.assertEqual(10, dispatcher.get_listener_priority('pre.foo', 'tests.lazy_subscriber:lazy_function'))
+
+        dispatcher.dispatch('pre.foo')
+        self.assertTrue(listener.is_resolved())
+        self.assertListEqual([('lazy_function', 'pre.foo')], invoked)
+
+        dispatcher.remove_listener('pre.foo', 'tests.lazy_subscriber:lazy_function')
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_add_listener_with_factory(self):
+        dispatcher = EventDispatcher(weak=True)
+        factory = lambda: lazy_function
+        dispatcher.add_listener('pre.foo', factory, lazy=True)
+        dispatcher.dispatch('pre.foo')
+        self.assertListEqual([('lazy_function', 'pre.foo')], invoked)
+        dispatcher.remove_listener('pre.foo', factory)
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_lazy_subscriber_is_built_once_on_first_dispatch(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_lazy_subscriber(LazySubscriber)
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+        self.assertEqual(10, dispatcher.get_listener_priority('pre.foo', LazyListener(LazySubscriber, 'pre_foo')))
+        self.assertListEqual([], built)
+
+        dispatcher.dispatch('pre.foo')
+        dispatcher.dispatch('post.foo')
+        self.assertEqual(1, len(built))
+        self.assertListEqual([('pre_foo', 'pre.foo'), ('post_foo', 'post.foo')], invoked)
+
+        dispatcher.remove_lazy_subscriber(LazySubscriber)
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_lazy_subscriber_from_import_path_and_factory(self):
+        dispatcher = EventDispatcher()
+        subscriber = LazySubscriber()
+        dispatcher.add_lazy_subscriber('tests.lazy_subscriber:LazySubscriber', lambda: subscriber)
+        dispatcher.dispatch('post.foo')
+        self.assertListEqual([subscriber], built)
+        self.assertListEqual([('post_foo', 'post.foo')], invoked)
+        dispatcher.remove_lazy_subscriber('tests.lazy_subscriber:LazySubscriber')
+        self.assertFalse(dispatcher.has_listeners())
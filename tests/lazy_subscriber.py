@@ -0,0 +1,27 @@
+from evee import AbstractEventSubscriber
+
+invoked = []
+built = []
+
+
+def lazy_function(event, event_name, dispatcher):
+    invoked.append(('lazy_function', event_name))
+
+
+class LazySubscriber(AbstractEventSubscriber):
+    def __init__(self):
+        built.append(self)
+
+    @staticmethod
+    def get_subscribed_events():
+        return {'pre.foo': ['pre_foo', 10], 'post.foo': 'post_foo'}
+
+    def pre_foo(self, event, event_name, dispatcher):
+        invoked.append(('pre_foo', event_name))
+
+    def post_foo(self, event, event_name, dispatcher):
+        invoked.append(('post_foo', event_name))
+
+    @staticmethod
+    def static_foo(event, event_name, dispatcher):
+        invoked.append(('static_foo', event_name))
@@ -0,0 +1,117 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event as ThreadingEvent
+from unittest import TestCase
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee import LogicError
+from evee import AbstractEventSubscriber
+from evee.offloaded_listener import OffloadedListener
+
+
+def process_listener(event, event_name, dispatcher):
+    return os.getpid(), event['value'] * 2, dispatcher
+
+
+class OffloadedListenerTest(TestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__dispatcher = None
+
+    def setUp(self):
+        self.__dispatcher = EventDispatcher()
+
+    def tearDown(self):
+        self.__dispatcher.shutdown()
+        self.__dispatcher = None
+
+    def test_unknown_executor(self):
+        with self.assertRaises(LogicError):
+            self.__dispatcher.add_listener('pre.foo', process_listener, executor='fiber')
+
+    def test_thread_listener_does_not_block_the_chain(self):
+        release = ThreadingEvent()
+        invoked = []
+
+        def blocking(event, name, dispatcher):
+            release.wait(5)
+            invoked.append('blocking')
+            return dispatcher
+
+        def in_line(event, name, dispatcher):
+            invoked.append('in_line')
+            release.set()
+
+        self.__dispatcher.add_listener('pre.foo', blocking, 10, executor='thread')
+        self.__dispatcher.add_listener('pre.foo', in_line)
+        self.__dispatcher.dispatch('pre.foo')
+
+        futures = self.__dispatcher.join(5)
+        self.assertEqual(1, len(futures))
+        self.assertEqual(self.__dispatcher, futures[0].result())
+        self.assertListEqual(['in_line', 'blocking'], invoked)
+        self.assertListEqual([], self.__dispatcher.join())
+
+    def test_stopped_propagation_prevents_submission(self):
+        invoked = []
+
+        self.__dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: event.stop_propagation(), 10)
+        self.__dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(name),
+                                       executor='thread')
+        self.__dispatcher.dispatch('pre.foo')
+        self.assertListEqual([], self.__dispatcher.join(5))
+        self.assertListEqual([], invoked)
+
+    def test_process_listener_receives_a_copy_of_the_event(self):
+        self.__dispatcher.add_listener('pre.foo', process_listener, executor='process')
+        self.__dispatcher.dispatch('pre.foo', GenericEvent(None, {'value': 21}))
+
+        pid, value, dispatcher = self.__dispatcher.join(30)[0].result()
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual(42, value)
+        self.assertIsNone(dispatcher)
+
+    def test_set_executor(self):
+        pool = ThreadPoolExecutor(1)
+        self.__dispatcher.set_executor('thread', pool)
+        future = self.__dispatcher.submit('thread', process_listener, GenericEvent(None, {'value': 1}), 'pre.foo')
+        self.assertEqual(2, future.result(5)[1])
+        pool.shutdown()
+
+    def test_offloaded_listener_can_be_found_and_removed(self):
+        self.__dispatcher.add_listener('pre.foo', process_listener, 5, executor='process')
+        listeners = self.__dispatcher.get_listeners('pre.foo')
+        self.assertIsInstance(listeners[0], OffloadedListener)
+        self.assertIn(process_listener, listeners)
+        self.assertEqual(5, self.__dispatcher.get_listener_priority('pre.foo', process_listener))
+        self.__dispatcher.remove_listener('pre.foo', process_listener)
+        self.assertFalse(self.__dispatcher.has_listeners())
+
+    def test_subscriber_options(self):
+        subscriber = TestOffloadedSubscriber()
+        self.__dispatcher.add_subscriber(subscriber)
+        listeners = self.__dispatcher.get_listeners('pre.foo')
+        self.assertEqual('thread', listeners[0].get_executor())
+        self.assertEqual(subscriber.pre_foo, listeners[1])
+        self.assertEqual('thread', self.__dispatcher.get_listeners('post.foo')[0].get_executor())
+        self.__dispatcher.remove_subscriber(subscriber)
+        self.assertFalse(self.__dispatcher.has_listeners())
+
+
+class TestOffloadedSubscriber(AbstractEventSubscriber):
+    @staticmethod
+    def get_subscribed_events():
+        return {
+            'pre.foo': [['pre_foo'], ['pre_foo_offloaded', 10, {'executor': 'thread'}]],
+            'post.foo': ['post_foo', {'executor': 'thread'}]
+        }
+
+    def pre_foo(self, event, event_name, dispatcher):
+        pass
+
+    def pre_foo_offloaded(self, event, event_name, dispatcher):
+        pass
+
+    def post_foo(self, event, event_name, dispatcher):
+        pass
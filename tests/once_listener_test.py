@@ -0,0 +1,141 @@
+from time import sleep
+from unittest import TestCase
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee import GenericEventBatch
+from evee import ProcessEventBus
+from evee import ThreadSafeEventDispatcher
+from evee import TraceableEventDispatcher
+from tests.abstract_event_dispatcher_test import TestEventSubscriber
+
+
+class OnceListenerTest(TestCase):
+    def setUp(self):
+        self.__invoked = []
+
+    def listener(self, event, event_name, dispatcher):
+        self.__invoked.append(event_name)
+
+    def test_once_listeners_are_removed_after_the_first_call(self):
+        for dispatcher in [EventDispatcher(), ThreadSafeEventDispatcher()]:
+            self.__invoked = []
+            other = lambda event, name, dispatcher: self.__invoked.append('other')
+            dispatcher.add_listener('pre.foo', self.listener, 10, once=True)
+            dispatcher.add_listener('pre.foo', other)
+
+            dispatcher.dispatch('pre.foo')
+            dispatcher.dispatch('pre.foo')
+
+            self.assertEqual(['pre.foo', 'other', 'other'], self.__invoked)
+            self.assertSequenceEqual([other], dispatcher.get_listeners('pre.foo'))
+            self.assertIsNone(dispatcher.get_listener_priority('pre.foo', self.listener))
+            self.assertEqual(1, dispatcher.get_listener_count())
+
+    def test_once_listener_with_conditions_waits_for_a_matching_event(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('order.*', self.listener, once=True, when={'tenant': 'acme'})
+
+        dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'initech'}))
+        self.assertTrue(dispatcher.has_listeners('order.paid'))
+        dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'acme'}))
+        dispatcher.dispatch('order.paid', GenericEvent(None, {'tenant': 'acme'}))
+
+        self.assertEqual(['order.paid'], self.__invoked)
+        self.assertFalse(dispatcher.has_listeners())
+
+    def test_only_the_once_registration_is_removed(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, once=True)
+        dispatcher.add_listener('pre.foo', self.listener, -10)
+        dispatcher.add_listener('post.foo', self.listener, once=True)
+
+        dispatcher.dispatch('pre.foo')
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(['pre.foo', 'pre.foo', 'pre.foo'], self.__invoked)
+        self.assertEqual(-10, dispatcher.get_listener_priority('pre.foo', self.listener))
+        self.assertTrue(dispatcher.has_listeners('post.foo'))
+
+    def test_once_listener_removed_before_it_is_called(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, once=True)
+        dispatcher.remove_listener('pre.foo', self.listener)
+        dispatcher.dispatch('pre.foo')
+
+        self.assertEqual([], self.__invoked)
+        self.assertEqual(0, dispatcher.get_listener_count())
+
+    def test_expired_listeners_are_swept_on_dispatch(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, ttl=0.01)
+        dispatcher.add_listener('post.foo', self.listener, ttl=60)
+        dispatcher.dispatch('pre.foo')
+
+        sleep(0.02)
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(['pre.foo'], self.__invoked)
+        self.assertFalse(dispatcher.has_listeners('pre.foo'))
+        self.assertTrue(dispatcher.has_listeners('post.foo'))
+
+    def test_expiries_are_checked_once_per_dispatch(self):
+        checks = []
+
+        class CountingEventDispatcher(EventDispatcher):
+            def _expire(self):
+                checks.append(1)
+                super()._expire()
+
+        dispatcher = CountingEventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, ttl=60)
+        del checks[:]
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(1, len(checks))
+
+    def test_expired_listeners_are_swept_on_registration(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, ttl=0)
+        dispatcher.add_listener('pre.foo', self.listener, once=True, ttl=0)
+        self.assertEqual(1, dispatcher.get_listener_count())
+
+        dispatcher.add_subscribers([TestEventSubscriber()])
+        self.assertEqual(2, dispatcher.get_listener_count())
+        self.assertIsNone(dispatcher.get_listener_priority('pre.foo', self.listener))
+
+    def test_removed_listeners_are_ignored_when_they_expire(self):
+        dispatcher = EventDispatcher()
+        dispatcher.add_listener('pre.foo', self.listener, ttl=0.01)
+        dispatcher.remove_listener('pre.foo', self.listener)
+        dispatcher.add_listener('pre.foo', self.listener)
+
+        sleep(0.02)
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(['pre.foo'], self.__invoked)
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+
+    def test_expired_listeners_are_swept_on_every_dispatch_path(self):
+        traced = EventDispatcher()
+        parent = EventDispatcher()
+        batched = EventDispatcher()
+        bus = ProcessEventBus(1)
+        for dispatcher in [traced, parent, batched, bus]:
+            dispatcher.add_listener('pre.foo', self.listener, ttl=0.01)
+        sleep(0.02)
+
+        TraceableEventDispatcher(traced).dispatch('pre.foo')
+        parent.child().dispatch('pre.foo')
+        batched.dispatch_batch('pre.foo', GenericEventBatch(None, {'id': [1, 2]}))
+        bus.dispatch('pre.foo')
+
+        self.assertEqual([], self.__invoked)
+        for dispatcher in [traced, parent, batched, bus]:
+            self.assertFalse(dispatcher.has_listeners())
+
+    def test_once_listeners_of_an_event_are_all_removed_by_one_dispatch(self):
+        dispatcher = EventDispatcher()
+        for priority in range(1000):
+            dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: self.__invoked.append(name),
+                                    priority % 7, once=True)
+
+        dispatcher.dispatch('pre.foo')
+        dispatcher.dispatch('pre.foo')
+        self.assertEqual(1000, len(self.__invoked))
+        self.assertEqual(0, dispatcher.get_listener_count())
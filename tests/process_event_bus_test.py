@@ -0,0 +1,136 @@
+import multiprocessing
+from unittest import TestCase
+from evee import GenericEvent
+from evee import LogicError
+from evee import ProcessEventBus
+
+
+def echo_worker(bus, index, events):
+    bus.attach(index)
+
+    def reply(event, name, dispatcher):
+        dispatcher.dispatch('pong', GenericEvent(None, {'id': event['id'], 'worker': index}))
+
+    bus.add_listener('ping', reply)
+    received = 0
+    while received < events:
+        received += bus.poll(timeout=5)
+    bus.close()
+
+
+def collect_worker(bus, index, events, results):
+    bus.attach(index)
+    received = []
+    bus.add_listener('ping', lambda event, name, dispatcher: received.append(event['id']))
+    while len(received) < events:
+        bus.poll(timeout=5)
+    results.put((index, received))
+
+
+class ProcessEventBusTest(TestCase):
+    def setUp(self):
+        self.__context = multiprocessing.get_context('fork')
+
+    def start_workers(self, bus, workers, events):
+        processes = [self.__context.Process(target=echo_worker, args=(bus, index, events))
+                     for index in range(1, workers + 1)]
+        for process in processes:
+            process.start()
+        return processes
+
+    def receive(self, bus, count):
+        received = []
+        bus.add_listener('pong', lambda event, name, dispatcher: received.append((event['worker'], event['id'])))
+        while len(received) < count:
+            self.assertTrue(bus.poll(timeout=5), 'Timed out waiting for events')
+        return received
+
+    def test_events_are_broadcast_to_every_process(self):
+        bus = ProcessEventBus(3, batch_size=4, context=self.__context)
+        processes = self.start_workers(bus, 2, 10)
+
+        local = []
+        bus.add_listener('ping', lambda event, name, dispatcher: local.append(event['id']))
+        for key in range(10):
+            bus.dispatch('ping', GenericEvent(None, {'id': key}))
+        bus.flush()
+
+        received = self.receive(bus, 20)
+        for process in processes:
+            process.join(5)
+            self.assertEqual(0, process.exitcode)
+
+        self.assertEqual(list(range(10)), local)
+        self.assertEqual(list(range(10)), [key for worker, key in received if worker == 1])
+        self.assertEqual(list(range(10)), [key for worker, key in received if worker == 2])
+
+    def test_fan_out_delivers_each_event_to_some_processes(self):
+        bus = ProcessEventBus(3, fan_out=1, local=False, context=self.__context)
+        results = self.__context.Queue()
+        processes = [self.__context.Process(target=collect_worker, args=(bus, index, 5, results))
+                     for index in [1, 2]]
+        for process in processes:
+            process.start()
+
+        for key in range(10):
+            bus.dispatch('ping', GenericEvent(None, {'id': key}))
+
+        received = dict(results.get(timeout=5) for _ in processes)
+        for process in processes:
+            process.join(5)
+
+        self.assertEqual({1: [0, 2, 4, 6, 8], 2: [1, 3, 5, 7, 9]}, received)
+
+    def test_stopped_events_are_not_sent(self):
+        bus = ProcessEventBus(2, context=self.__context)
+        bus.add_listener('ping', lambda event, name, dispatcher: event.stop_propagation())
+
+        bus.dispatch('ping')
+        bus.attach(1)
+        self.assertEqual(0, bus.poll())
+
+    def test_events_are_sent_as_they_were_dispatched(self):
+        bus = ProcessEventBus(2, batch_size=2, context=self.__context)
+        event = GenericEvent(None, {'id': 1})
+        bus.dispatch('ping', event)
+        event['id'] = 2
+        bus.flush()
+
+        received = []
+        bus.attach(1)
+        bus.add_listener('ping', lambda event, name, dispatcher: received.append(event['id']))
+        self.assertEqual(1, bus.poll(timeout=5))
+        self.assertEqual([1], received)
+
+    def test_invalid_process_index(self):
+        bus = ProcessEventBus(2, context=self.__context)
+        with self.assertRaises(LogicError):
+            bus.attach(2)
+        with self.assertRaises(LogicError):
+            ProcessEventBus(0)
+
+    def test_listeners_are_registered_locally(self):
+        bus = ProcessEventBus(1, context=self.__context)
+        listener = lambda event, name, dispatcher: None
+        bus.add_listener('ping', listener, 10)
+
+        self.assertTrue(bus.has_listeners('ping'))
+        self.assertEqual(10, bus.get_listener_priority('ping', listener))
+        self.assertEqual([listener], bus.get_listeners('ping'))
+        bus.remove_listener('ping', listener)
+        self.assertFalse(bus.has_listeners())
+
+    def test_local_listeners_use_the_dispatcher_options(self):
+        invoked = []
+        bus = ProcessEventBus(1, context=self.__context)
+        bus.add_listener('ping', lambda event, name, dispatcher: invoked.append(dispatcher), 10, once=True)
+        bus.add_listener('ping', lambda event, name, dispatcher: invoked.append('thread'), executor='thread')
+        bus.add_listener('ping', lambda event, name, dispatcher: invoked.append('throttled'), -10, throttle=60)
+        bus.add_listener('ping', lambda event, name, dispatcher: invoked.append('expired'), ttl=0)
+
+        bus.dispatch('ping')
+        bus.dispatch('ping')
+        bus.join()
+        self.assertEqual(0, bus.advance_timers())
+        self.assertIs(bus, invoked[0])
+        self.assertCountEqual(['thread', 'throttled', 'thread'], invoked[1:])
@@ -0,0 +1,108 @@
+from time import sleep
+from unittest import TestCase
+from evee import Event
+from evee import GenericEvent
+from evee import QueuedEventDispatcher
+
+
+class QueuedEventDispatcherTest(TestCase):
+    def test_enqueue_defers_dispatch_until_flush(self):
+        invoked = []
+        dispatcher = QueuedEventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(name))
+
+        dispatcher.enqueue('pre.foo')
+        dispatcher.enqueue('pre.foo')
+        self.assertEqual([], invoked)
+        self.assertEqual(2, dispatcher.get_queue_size())
+
+        self.assertEqual(2, len(dispatcher.flush()))
+        self.assertEqual(['pre.foo', 'pre.foo'], invoked)
+        self.assertEqual(0, dispatcher.get_queue_size())
+        self.assertEqual([], dispatcher.flush())
+
+    def test_coalesced_events_are_replaced(self):
+        invoked = []
+        dispatcher = QueuedEventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(event['id']))
+
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': 1}), coalesce_key='a')
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': 2}), coalesce_key='b')
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': 3}), coalesce_key='a')
+        dispatcher.enqueue('post.foo', GenericEvent(None, {'id': 4}), coalesce_key='a')
+        dispatcher.flush()
+
+        self.assertEqual([3, 2], invoked)
+
+    def test_coalesced_events_are_merged(self):
+        dispatcher = QueuedEventDispatcher()
+
+        def merge(queued, event):
+            queued['count'] += event['count']
+            return queued
+
+        first = dispatcher.enqueue('pre.foo', GenericEvent(None, {'count': 1}), 'key', merge)
+        second = dispatcher.enqueue('pre.foo', GenericEvent(None, {'count': 2}), 'key', merge)
+
+        self.assertIs(first, second)
+        self.assertEqual([('pre.foo', first)], dispatcher.flush())
+        self.assertEqual(3, first['count'])
+
+    def test_flush_walks_listeners_once_per_event_name(self):
+        invoked = []
+        dispatcher = QueuedEventDispatcher()
+
+        def stop(event, name, dispatcher):
+            invoked.append(('stop', event['id']))
+            if event['id'] == 1:
+                event.stop_propagation()
+
+        dispatcher.add_listener('pre.foo', stop, 10)
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(('last', event['id'])))
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': 1}))
+        dispatcher.enqueue('pre.foo', GenericEvent(None, {'id': 2}))
+        dispatcher.flush()
+
+        self.assertEqual([('stop', 1), ('stop', 2), ('last', 2)], invoked)
+
+    def test_events_enqueued_by_listeners_wait_for_next_flush(self):
+        dispatcher = QueuedEventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: dispatcher.enqueue('post.foo'))
+
+        dispatcher.enqueue('pre.foo')
+        dispatcher.flush()
+        self.assertEqual(1, dispatcher.get_queue_size())
+
+    def test_flush_on_max_size(self):
+        invoked = []
+        dispatcher = QueuedEventDispatcher(max_size=2)
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(event))
+
+        dispatcher.enqueue('pre.foo', coalesce_key=1)
+        dispatcher.enqueue('pre.foo', coalesce_key=1)
+        self.assertEqual([], invoked)
+
+        dispatcher.enqueue('pre.foo', coalesce_key=2)
+        self.assertEqual(2, len(invoked))
+        self.assertEqual(0, dispatcher.get_queue_size())
+
+    def test_flush_on_max_delay(self):
+        dispatcher = QueuedEventDispatcher(max_delay=0.01)
+        dispatcher.enqueue('pre.foo')
+        sleep(0.02)
+        event = dispatcher.enqueue('pre.foo', Event())
+
+        self.assertIsInstance(event, Event)
+        self.assertEqual(0, dispatcher.get_queue_size())
+
+    def test_flush_dispatches_through_middlewares(self):
+        invoked = []
+        dispatcher = QueuedEventDispatcher()
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append('listener'))
+        dispatcher.use(lambda listener, name: lambda *args: invoked.append('wrapped') or listener(*args),
+                       per_listener=True)
+
+        dispatcher.enqueue('pre.foo')
+        dispatcher.enqueue('pre.foo')
+        dispatcher.flush()
+        self.assertEqual(['wrapped', 'listener', 'wrapped', 'listener'], invoked)
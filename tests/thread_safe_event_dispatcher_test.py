@@ -0,0 +1,164 @@
+from threading import Thread
+from tests.abstract_event_dispatcher_test import AbstractEventDispatcherTest
+from tests.abstract_event_dispatcher_test import TestEventListener
+from tests.abstract_event_dispatcher_test import TestEventSubscriber
+from evee import ThreadSafeEventDispatcher
+from evee.conditional_listener import MAX_ROUTES
+
+
+class ThreadSafeEventDispatcherTest(AbstractEventDispatcherTest):
+    def create_event_dispatcher(self):
+        return ThreadSafeEventDispatcher()
+
+    def test_initial_state(self):
+        self._initial_state()
+
+    def test_add_listener(self):
+        self._add_listener()
+
+    def test_get_listener_priority(self):
+        self._get_listener_priority()
+
+    def test_dispatch(self):
+        self._dispatch()
+
+    def test_dispatch_for_lambda(self):
+        self._dispatch_for_lambda()
+
+    def test_stop_event_propagation(self):
+        self._stop_event_propagation()
+
+    def test_dispatch_by_priority(self):
+        self._dispatch_by_priority()
+
+    def test_remove_listener(self):
+        self._remove_listener()
+
+    def test_add_subscriber(self):
+        self._add_subscriber()
+
+    def test_add_subscriber_with_priorities(self):
+        self._add_subscriber_with_priorities()
+
+    def test_add_subscriber_with_multiple_listeners(self):
+        self._add_subscriber_with_multiple_listeners()
+
+    def test_add_subscribers(self):
+        self._add_subscribers()
+
+    def test_remove_subscriber(self):
+        self._remove_subscriber()
+
+    def test_remove_subscriber_with_priorities(self):
+        self._remove_subscriber_with_priorities()
+
+    def test_remove_subscriber_with_multiple_listeners(self):
+        self._remove_subscriber_with_multiple_listeners()
+
+    def test_event_receives_the_dispatcher_instance_as_argument(self):
+        self._event_receives_the_dispatcher_instance_as_argument()
+
+    def test_has_listeners_when_added_callback_listener_is_removed(self):
+        self._has_listeners_when_added_callback_listener_is_removed()
+
+    def test_get_listeners_when_added_callback_listener_is_removed(self):
+        self._get_listeners_when_added_callback_listener_is_removed()
+
+    def test_has_listeners_without_events_returns_false_after_has_listeners_with_event_has_been_called(self):
+        self._has_listeners_without_events_returns_false_after_has_listeners_with_event_has_been_called()
+
+    def test_listeners_stay_sorted_on_add_and_remove(self):
+        self._listeners_stay_sorted_on_add_and_remove()
+
+    def test_remove_listener_during_dispatch(self):
+        self._remove_listener_during_dispatch()
+
+    def test_remove_listener_registered_many_times(self):
+        self._remove_listener_registered_many_times()
+
+    def test_wildcard_listeners_merge_by_priority(self):
+        self._wildcard_listeners_merge_by_priority()
+
+    def test_wildcard_listeners_invalidate_cached_resolution(self):
+        self._wildcard_listeners_invalidate_cached_resolution()
+
+    def test_get_listeners_returns_immutable_snapshots(self):
+        dispatcher = self.create_event_dispatcher()
+        listener_1 = TestEventListener()
+        listener_2 = TestEventListener()
+
+        dispatcher.add_listener('pre.foo', listener_1, -10)
+        snapshot = dispatcher.get_listeners('pre.foo')
+        self.assertEqual((listener_1,), snapshot)
+        self.assertIs(snapshot, dispatcher.get_listeners('pre.foo'))
+
+        dispatcher.add_listener('pre.foo', listener_2, 10)
+        self.assertEqual((listener_1,), snapshot)
+        self.assertEqual((listener_2, listener_1), dispatcher.get_listeners('pre.foo'))
+        self.assertEqual({'pre.foo': (listener_2, listener_1)}, dispatcher.get_listeners())
+
+    def test_wildcard_registration_invalidates_snapshots(self):
+        dispatcher = self.create_event_dispatcher()
+        listener = TestEventListener()
+
+        self.assertEqual((), dispatcher.get_listeners('order.created'))
+        dispatcher.add_listener('order.*', listener)
+        self.assertEqual((listener,), dispatcher.get_listeners('order.created'))
+        dispatcher.remove_listener('order.*', listener)
+        self.assertEqual((), dispatcher.get_listeners('order.created'))
+
+    def test_snapshots_are_bounded_and_skip_names_without_listeners(self):
+        dispatcher = self.create_event_dispatcher()
+        for index in range(10):
+            dispatcher.dispatch('user.{}.created'.format(index))
+            self.assertFalse(dispatcher.has_listeners('user.{}.deleted'.format(index)))
+        self.assertEqual({}, dispatcher._ThreadSafeEventDispatcher__snapshots)
+
+        listener = TestEventListener()
+        dispatcher.add_listener('order.*.created', listener)
+        for index in range(MAX_ROUTES + 10):
+            self.assertEqual((listener,), dispatcher.get_listeners('order.{}.created'.format(index)))
+        self.assertLessEqual(len(dispatcher._ThreadSafeEventDispatcher__snapshots), MAX_ROUTES)
+
+    def test_concurrent_registration_and_dispatch(self):
+        dispatcher = self.create_event_dispatcher()
+        invoked = []
+        dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append(name))
+
+        def churn():
+            for index in range(200):
+                listener = lambda event, name, dispatcher: None
+                dispatcher.add_listener('pre.foo', listener, index % 5)
+                dispatcher.remove_listener('pre.foo', listener)
+
+        def dispatch():
+            for index in range(200):
+                dispatcher.dispatch('pre.foo')
+
+        threads = [Thread(target=churn) for index in range(4)] + [Thread(target=dispatch) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(800, len(invoked))
+        self.assertEqual(1, len(dispatcher.get_listeners('pre.foo')))
+
+    def test_add_subscribers_invalidates_snapshots(self):
+        dispatcher = self.create_event_dispatcher()
+        self.assertEqual((), dispatcher.get_listeners('pre.foo'))
+        dispatcher.add_subscribers([TestEventSubscriber(), TestEventSubscriber()])
+        self.assertEqual(2, len(dispatcher.get_listeners('pre.foo')))
+
+    def test_get_listeners_view_is_cached_until_listeners_change(self):
+        dispatcher = self.create_event_dispatcher()
+        listener = TestEventListener()
+        dispatcher.add_listener('pre.foo', listener)
+
+        view = dispatcher.get_listeners()
+        self.assertIs(view, dispatcher.get_listeners())
+        self.assertTrue(dispatcher.has_listeners('pre.foo'))
+
+        dispatcher.remove_listener('pre.foo', listener)
+        self.assertEqual({}, dispatcher.get_listeners())
+        self.assertFalse(dispatcher.has_listeners())
@@ -0,0 +1,175 @@
+from unittest import TestCase
+from evee import AsyncEventDispatcher
+from evee import EventDispatcher
+from evee import GenericEvent
+from evee import LogicError
+from evee.timer_wheel import TimerWheel
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.time = 1000.0
+
+    def __call__(self):
+        return self.time
+
+
+class TimerWheelTest(TestCase):
+    def setUp(self):
+        self.__clock = FakeClock()
+        self.__wheel = TimerWheel(resolution=0.01, size=8, clock=self.__clock)
+
+    def test_timers_run_in_deadline_order_once_due(self):
+        ran = []
+        self.__wheel.schedule(1000.05, lambda: ran.append('b'))
+        self.__wheel.schedule(1000.02, lambda: ran.append('a'))
+        self.__wheel.schedule(1000.5, lambda: ran.append('c'))
+        self.assertEqual(3, len(self.__wheel))
+
+        self.__clock.time = 1000.01
+        self.assertEqual(0, self.__wheel.advance())
+        self.__clock.time = 1000.06
+        self.assertEqual(2, self.__wheel.advance())
+        self.assertEqual(['a', 'b'], ran)
+
+        # More than a full turn of the wheel later
+        self.__clock.time = 1001.0
+        self.assertEqual(1, self.__wheel.advance())
+        self.assertEqual(['a', 'b', 'c'], ran)
+        self.assertEqual(0, len(self.__wheel))
+
+    def test_failing_timers_do_not_drop_the_other_due_timers(self):
+        ran = []
+
+        def fail():
+            raise RuntimeError('failed')
+
+        self.__wheel.schedule(1000.02, fail)
+        self.__wheel.schedule(1000.03, lambda: ran.append('a'))
+        self.__clock.time = 1000.05
+        with self.assertRaises(RuntimeError):
+            self.__wheel.advance()
+        self.assertEqual(['a'], ran)
+        self.assertEqual(0, len(self.__wheel))
+
+        errors = []
+        wheel = TimerWheel(clock=self.__clock, on_error=errors.append)
+        wheel.schedule(1000.06, fail)
+        wheel.schedule(1000.07, lambda: ran.append('b'))
+        self.__clock.time = 1000.1
+        self.assertEqual(2, wheel.advance())
+        self.assertEqual(['a', 'b'], ran)
+        self.assertIsInstance(errors[0], RuntimeError)
+
+    def test_past_deadlines_run_on_the_next_tick(self):
+        ran = []
+        self.__wheel.schedule(999.0, lambda: ran.append('late'))
+        self.assertEqual(0, self.__wheel.advance())
+        self.__clock.time = 1000.011
+        self.assertEqual(1, self.__wheel.advance())
+        self.assertEqual(['late'], ran)
+
+
+class ThrottledListenerTest(TestCase):
+    def setUp(self):
+        self.__clock = FakeClock()
+        self.__dispatcher = EventDispatcher()
+        self.__dispatcher.set_timer_wheel(TimerWheel(clock=self.__clock))
+        self.__invoked = []
+
+    def listener(self, event, event_name, dispatcher):
+        self.__invoked.append(event['id'])
+
+    def dispatch(self, key, time):
+        self.__clock.time = time
+        self.__dispatcher.dispatch('pre.foo', GenericEvent(None, {'id': key}))
+
+    def test_throttle_calls_the_first_and_last_event_of_an_interval(self):
+        self.__dispatcher.add_listener('pre.foo', self.listener, throttle=1)
+
+        self.dispatch(1, 1000.0)
+        self.dispatch(2, 1000.2)
+        self.dispatch(3, 1000.5)
+        self.assertEqual([1], self.__invoked)
+
+        self.__clock.time = 1001.01
+        self.assertEqual(1, self.__dispatcher.advance_timers())
+        self.assertEqual([1, 3], self.__invoked)
+
+        self.dispatch(4, 1001.5)
+        self.assertEqual([1, 3], self.__invoked)
+        self.__clock.time = 1002.0
+        self.__dispatcher.advance_timers()
+        self.assertEqual([1, 3, 4], self.__invoked)
+
+        self.dispatch(5, 1003.5)
+        self.assertEqual([1, 3, 4, 5], self.__invoked)
+
+    def test_debounce_waits_for_a_quiet_interval(self):
+        self.__dispatcher.add_listener('pre.foo', self.listener, debounce=1)
+
+        self.dispatch(1, 1000.0)
+        self.dispatch(2, 1000.8)
+        self.dispatch(3, 1001.5)
+        self.assertEqual([], self.__invoked)
+
+        self.__clock.time = 1002.0
+        self.__dispatcher.advance_timers()
+        self.assertEqual([], self.__invoked)
+
+        self.__clock.time = 1002.6
+        self.__dispatcher.advance_timers()
+        self.assertEqual([3], self.__invoked)
+
+    def test_removed_listeners_drop_their_pending_call(self):
+        self.__dispatcher.add_listener('pre.foo', self.listener, debounce=1, when={'id': {1, 2}})
+        self.dispatch(1, 1000.0)
+        self.__dispatcher.remove_listener('pre.foo', self.listener)
+
+        self.__clock.time = 1002.0
+        self.__dispatcher.advance_timers()
+        self.assertEqual([], self.__invoked)
+
+    def test_throttled_listeners_are_indexed_by_listener(self):
+        self.__dispatcher.add_listener('pre.foo', self.listener, 5, throttle=1)
+        self.assertEqual([self.listener], self.__dispatcher.get_listeners('pre.foo'))
+        self.assertEqual(5, self.__dispatcher.get_listener_priority('pre.foo', self.listener))
+
+    def test_throttle_and_debounce_are_exclusive(self):
+        with self.assertRaises(LogicError):
+            self.__dispatcher.add_listener('pre.foo', self.listener, throttle=1, debounce=1)
+        with self.assertRaises(LogicError):
+            self.__dispatcher.add_listener('pre.foo', self.listener, throttle=-1)
+
+    def test_throttled_listeners_keep_working_after_a_failing_delayed_call(self):
+        def bad(event, name, dispatcher):
+            raise RuntimeError('failed')
+
+        self.__dispatcher.add_listener('pre.foo', self.listener, throttle=1)
+        self.__dispatcher.add_listener('post.foo', bad, throttle=1)
+        self.__clock.time = 1000.0
+        with self.assertRaises(RuntimeError):
+            self.__dispatcher.dispatch('post.foo')
+        self.__clock.time = 1000.2
+        self.__dispatcher.dispatch('post.foo')
+        self.dispatch(1, 1000.5)
+        self.dispatch(2, 1000.6)
+
+        self.__clock.time = 1001.6
+        with self.assertRaises(RuntimeError):
+            self.__dispatcher.advance_timers()
+        self.assertEqual([1, 2], self.__invoked)
+
+        self.dispatch(3, 1003.0)
+        self.assertEqual([1, 2, 3], self.__invoked)
+
+    def test_async_dispatchers_reject_throttled_listeners(self):
+        dispatcher = AsyncEventDispatcher()
+        with self.assertRaises(LogicError):
+            dispatcher.add_listener('pre.foo', self.listener, throttle=1)
+        with self.assertRaises(LogicError):
+            dispatcher.add_listener('pre.foo', self.listener, debounce=1)
+        with self.assertRaises(LogicError):
+            dispatcher.set_timer_wheel(TimerWheel())
+        self.assertFalse(dispatcher.has_listeners())
+        self.assertIsNone(dispatcher.get_listener_priority('pre.foo', self.listener))
@@ -0,0 +1,169 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import Mock
+from evee import AsyncEventDispatcher
+from evee import Event
+from evee import EventDispatcher
+from evee import FrozenEventDispatcher
+from evee import GenericEvent
+from evee import TraceableEventDispatcher
+
+
+class TraceableEventDispatcherTest(TestCase):
+
+    def __init__(self, methodName='runTest'):
+        super().__init__(methodName)
+        self.__dispatcher = None
+        self.__inner_dispatcher = None
+
+    def setUp(self):
+        self.__inner_dispatcher = EventDispatcher()
+        self.__dispatcher = TraceableEventDispatcher(self.__inner_dispatcher)
+
+    def test_registration_delegates(self):
+        listener = lambda event, name, dispatcher: None
+        self.__dispatcher.add_listener('pre.foo', listener, 10)
+        self.assertEqual([listener], self.__inner_dispatcher.get_listeners('pre.foo'))
+        self.assertEqual(10, self.__dispatcher.get_listener_priority('pre.foo', listener))
+        self.assertTrue(self.__dispatcher.has_listeners('pre.foo'))
+        self.__dispatcher.remove_listener('pre.foo', listener)
+        self.assertFalse(self.__inner_dispatcher.has_listeners())
+
+    def test_dispatch_delegates_when_disabled(self):
+        event = Event()
+        self.__dispatcher.disable()
+        self.assertFalse(self.__dispatcher.is_enabled())
+        self.__inner_dispatcher.dispatch = Mock(return_value='result')
+        self.assertEqual('result', self.__dispatcher.dispatch('event', event))
+        self.__inner_dispatcher.dispatch.assert_called_with('event', event)
+        self.assertEqual([], self.__dispatcher.get_called_listeners())
+        self.assertEqual({}, self.__dispatcher.get_latency_histograms())
+
+    def test_called_listeners(self):
+        received = []
+        listener_1 = lambda event, name, dispatcher: received.append(dispatcher)
+        listener_2 = lambda event, name, dispatcher: None
+
+        self.__dispatcher.add_listener('pre.foo', listener_1, 10)
+        self.__dispatcher.add_listener('pre.foo', listener_2)
+        event = Event()
+        self.assertEqual(event, self.__dispatcher.dispatch('pre.foo', event))
+        self.__dispatcher.dispatch('pre.foo')
+
+        called = self.__dispatcher.get_called_listeners('pre.foo')
+        self.assertEqual([listener_1, listener_2], [stats['listener'] for stats in called])
+        self.assertEqual([10, 0], [stats['priority'] for stats in called])
+        self.assertEqual([2, 2], [stats['calls'] for stats in called])
+        self.assertTrue(all(stats['total_ns'] >= stats['max_ns'] for stats in called))
+        self.assertEqual([self.__inner_dispatcher, self.__inner_dispatcher], received)
+        self.assertEqual(2, sum(self.__dispatcher.get_latency_histogram('pre.foo').values()))
+        self.assertEqual(['pre.foo'], list(self.__dispatcher.get_latency_histograms().keys()))
+
+    def test_not_called_listeners(self):
+        stopper = lambda event, name, dispatcher: event.stop_propagation()
+        skipped = lambda event, name, dispatcher: None
+        never = lambda event, name, dispatcher: None
+
+        self.__dispatcher.add_listener('pre.foo', stopper, 10)
+        self.__dispatcher.add_listener('pre.foo', skipped)
+        self.__dispatcher.add_listener('post.foo', never)
+        self.__dispatcher.dispatch('pre.foo')
+
+        self.assertEqual([stopper], [stats['listener'] for stats in self.__dispatcher.get_called_listeners()])
+        not_called = self.__dispatcher.get_not_called_listeners()
+        self.assertEqual([skipped, never], [stats['listener'] for stats in not_called])
+        self.assertEqual([1, 0], [stats['skipped'] for stats in not_called])
+        self.assertEqual([stopper, None], [stats['stopped_by'] for stats in not_called])
+        not_called = self.__dispatcher.get_not_called_listeners('post.foo')
+        self.assertEqual([never], [stats['listener'] for stats in not_called])
+
+        self.__dispatcher.reset()
+        self.assertEqual([], self.__dispatcher.get_called_listeners())
+        self.assertEqual(3, len(self.__dispatcher.get_not_called_listeners()))
+
+    def test_unhashable_listeners_are_traced(self):
+        class Listener:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return isinstance(other, Listener)
+
+            def __call__(self, event, name, dispatcher):
+                event.stop_propagation()
+
+        stopper, skipped = Listener(), Listener()
+        self.__dispatcher.add_listener('pre.foo', stopper, 10)
+        self.__dispatcher.add_listener('pre.foo', skipped)
+        self.__dispatcher.dispatch('pre.foo')
+
+        called = self.__dispatcher.get_called_listeners()
+        self.assertEqual(1, len(called))
+        self.assertIs(stopper, called[0]['listener'])
+        not_called = self.__dispatcher.get_not_called_listeners()
+        self.assertEqual(1, len(not_called))
+        self.assertIs(skipped, not_called[0]['listener'])
+        self.assertEqual(1, not_called[0]['skipped'])
+
+    def test_called_pattern_listeners_are_not_reported_as_not_called(self):
+        listener = lambda event, name, dispatcher: None
+        never = lambda event, name, dispatcher: None
+        self.__dispatcher.add_listener('order.*', listener)
+        self.__dispatcher.add_listener('user.*', never)
+        self.__dispatcher.dispatch('order.created')
+
+        self.assertEqual([listener], [stats['listener'] for stats in self.__dispatcher.get_called_listeners()])
+        self.assertEqual(['order.created'],
+                         [stats['event_name'] for stats in self.__dispatcher.get_called_listeners('order.*')])
+        not_called = self.__dispatcher.get_not_called_listeners()
+        self.assertEqual([never], [stats['listener'] for stats in not_called])
+        self.assertEqual(['user.*'], [stats['event_name'] for stats in not_called])
+        self.assertEqual([], self.__dispatcher.get_not_called_listeners('order.*'))
+
+    def test_dispatch_goes_through_the_wrapped_dispatcher(self):
+        invoked = []
+        self.__inner_dispatcher.use(lambda listener, name: lambda *args: invoked.append('wrapped') or listener(*args),
+                                    per_listener=True)
+        self.__dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append('thread'),
+                                       executor='thread')
+        self.__dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: invoked.append('acme'),
+                                       when={'tenant': 'acme'})
+
+        self.__dispatcher.dispatch('pre.foo', GenericEvent(None, {'tenant': 'initech'}))
+        self.__inner_dispatcher.join()
+        self.assertEqual(['wrapped', 'thread'], invoked)
+        self.assertEqual([1], [stats['calls'] for stats in self.__dispatcher.get_called_listeners()])
+
+        self.__dispatcher.disable()
+        self.__dispatcher.enable()
+        self.__dispatcher.disable()
+        self.assertEqual(1, len(self.__inner_dispatcher.get_middlewares()))
+
+    def test_async_dispatches_are_traced_once_awaited(self):
+        async def stopper(event, name, dispatcher):
+            await asyncio.sleep(0)
+            event.stop_propagation()
+
+        skipped = lambda event, name, dispatcher: None
+        dispatcher = TraceableEventDispatcher(AsyncEventDispatcher())
+        dispatcher.add_listener('pre.foo', stopper, 10)
+        dispatcher.add_listener('pre.foo', skipped)
+
+        loop = asyncio.new_event_loop()
+        try:
+            event = loop.run_until_complete(dispatcher.dispatch('pre.foo'))
+        finally:
+            loop.close()
+
+        self.assertTrue(event.is_propagation_stopped())
+        self.assertEqual([stopper], [stats['listener'] for stats in dispatcher.get_called_listeners()])
+        self.assertEqual([stopper], [stats['stopped_by'] for stats in dispatcher.get_not_called_listeners()])
+        self.assertEqual(1, sum(dispatcher.get_latency_histogram('pre.foo').values()))
+
+    def test_dispatchers_without_middlewares_only_record_latencies(self):
+        inner_dispatcher = EventDispatcher()
+        inner_dispatcher.add_listener('pre.foo', lambda event, name, dispatcher: None)
+        dispatcher = TraceableEventDispatcher(FrozenEventDispatcher(inner_dispatcher))
+        dispatcher.dispatch('pre.foo')
+
+        self.assertEqual([], dispatcher.get_called_listeners())
+        self.assertEqual(1, sum(dispatcher.get_latency_histogram('pre.foo').values()))